@@ -1,12 +1,50 @@
 """
 Audio-Manager für Audio Studio Tycoon - Audio Edition.
-Kommuniziert direkt mit NVDA über accessible_output2.
+Sprachausgabe über speech.SpeechOutput (NVDA).
 Nutzt pygame.mixer für Sound-Effekte.
 """
 
 import pygame
 import os
 import sys
+import threading
+from collections import deque
+
+# ============================================================
+# MIXER-KONFIGURATION
+# ============================================================
+# Kleiner Puffer = geringe Latenz zwischen Tastendruck und Klick.
+MIXER_SETTINGS = {
+    "frequency": 44100,
+    "size": -16,
+    "channels": 2,
+    "buffer": 512,
+}
+
+# Reservierte Kanäle pro Kategorie (= maximale gleichzeitige Stimmen)
+CHANNEL_LAYOUT = {
+    "ui": 4,        # Navigations-Klicks, Fehler
+    "confirm": 2,   # Bestätigung, Erfolg
+    "loop": 2,      # Tipp-Geräusche u.ä. Endlosschleifen
+    "cash": 2,      # Kassenklingeln
+    "music": 2,     # Hintergrundmusik (zwei Kanäle für Überblendungen)
+}
+
+# Zuordnung Sound-Name -> Kategorie (unbekannte Sounds landen in "ui")
+SOUND_CATEGORIES = {
+    "click": "ui",
+    "error": "ui",
+    "confirm": "confirm",
+    "success": "confirm",
+    "typing": "loop",
+    "cash": "cash",
+}
+
+SOUND_FORMATS = ["wav", "ogg", "mp3"]
+
+# Der stumme Audio-Manager behält nur die letzten Ansagen (lange Headless-Läufe)
+SPOKEN_HISTORY = 200
+
 
 def resource_path(relative_path):
     """ Get absolute path to resource, works for dev and for PyInstaller """
@@ -18,102 +56,270 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
+def preinit_mixer():
+    """Setzt die Mixer-Parameter, bevor pygame.init() den Mixer startet."""
+    try:
+        pygame.mixer.pre_init(**MIXER_SETTINGS)
+    except Exception:
+        pass
+
+
+class ChannelManager:
+    """
+    Verteilt Sounds auf fest reservierte Mixer-Kanäle pro Kategorie.
+
+    Jede Kategorie besitzt eigene Kanäle, sodass schnelle Klick-Folgen
+    nie die Tipp-Schleife oder den Bestätigungston abschneiden. Sind alle
+    Kanäle einer Kategorie belegt, wird die älteste Stimme gestoppt.
+    """
+
+    def __init__(self, layout=None):
+        self.layout = dict(layout or CHANNEL_LAYOUT)
+        self.channels = {}       # Kategorie -> [pygame.mixer.Channel]
+        self._started = {}       # Kanal-ID -> Startzeitpunkt (Zähler)
+        self._counter = 0
+        self.stats = {"played": 0, "stolen": 0}
+
+        total = sum(self.layout.values())
+        # Zusätzliche freie Kanäle für pygame's automatische Verteilung behalten
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), total + 4))
+        # Reservierte Kanäle werden von Sound.play() nie automatisch belegt
+        pygame.mixer.set_reserved(total)
+
+        index = 0
+        for category, count in self.layout.items():
+            self.channels[category] = [pygame.mixer.Channel(index + i) for i in range(count)]
+            index += count
+
+    def _pick_channel(self, category):
+        """Freier Kanal der Kategorie, sonst der mit der ältesten Stimme."""
+        channels = self.channels.get(category) or self.channels["ui"]
+        oldest = None
+        for ch in channels:
+            if not ch.get_busy():
+                return ch
+            if oldest is None or self._started.get(id(ch), 0) < self._started.get(id(oldest), 0):
+                oldest = ch
+        oldest.stop()
+        self.stats["stolen"] += 1
+        return oldest
+
+    def play(self, category, sound, loops=0):
+        """Spielt einen Sound auf einem Kanal der Kategorie ab."""
+        channel = self._pick_channel(category)
+        self._counter += 1
+        self._started[id(channel)] = self._counter
+        channel.play(sound, loops=loops)
+        self.stats["played"] += 1
+        return channel
+
+    def active_voices(self, category):
+        """Anzahl der gerade spielenden Stimmen einer Kategorie."""
+        return sum(1 for ch in self.channels.get(category, []) if ch.get_busy())
+
+    def stop_category(self, category):
+        for ch in self.channels.get(category, []):
+            ch.stop()
+
+
 class AudioManager:
-    def __init__(self):
+    def __init__(self, speech=None, start_mixer=True):
+        """
+        speech: bereits initialisierte SpeechOutput (sonst wird eine erzeugt)
+        start_mixer: False, um den Mixer später (z.B. per start_mixer_async) zu starten
+        """
         # NVDA-Ausgabe initialisieren
-        self.speaker = None
-        try:
-            from accessible_output2.outputs import nvda
-            self.speaker = nvda.NVDA()
-        except Exception as e:
-            print(f"[NVDA Init Fehler]: {e}")
-            print("[INFO] Fallback auf Konsolen-Ausgabe aktiv.")
+        if speech is None:
+            from speech import SpeechOutput
+            speech = SpeechOutput()
+        self.speech = speech
 
         # Pygame Mixer für SFX
-        try:
-            pygame.mixer.init()
-        except Exception:
-            pass
-
+        self.mixer_ready = False
+        self.channel_manager = None
+        self.music = None
         self.music_enabled = True
         self.current_loop = None
+        self._music_context = None
+        self._sounds = {}  # Name -> pygame.mixer.Sound (oder None, falls nicht vorhanden)
+        if start_mixer:
+            self.init_mixer()
+
+    def init_mixer(self):
+        """Initialisiert Mixer, Kanäle und Musik-System."""
+        try:
+            pygame.mixer.init(**MIXER_SETTINGS)
+            self.channel_manager = ChannelManager()
+            from music import MusicPlayer
+            music = MusicPlayer(self.channel_manager.channels["music"], resource_path)
+            music.preload()
+            self.music = music
+            self.mixer_ready = True
+        except Exception as e:
+            print(f"[Mixer Fehler]: {e}")
+
+    def preload_sounds(self):
+        """Lädt alle bekannten Sound-Effekte vorab in den Cache."""
+        if not self.mixer_ready:
+            return
+        for name in SOUND_CATEGORIES:
+            self._get_sound(name)
+
+    def start_mixer_async(self, on_ready=None):
+        """Startet Mixer und lädt Sounds im Hintergrund; on_ready wird danach aufgerufen."""
+        def run():
+            self.init_mixer()
+            self.preload_sounds()
+            if on_ready:
+                on_ready()
+        thread = threading.Thread(target=run, name="mixer-init", daemon=True)
+        thread.start()
+        return thread
 
     def set_music_enabled(self, enabled):
         """Aktiviert oder deaktiviert Musik."""
         self.music_enabled = enabled
-        if not enabled:
-            self.stop_music()
+        if self.music:
+            self.music.set_enabled(enabled)
 
     def speak(self, text, interrupt=True):
         """
         Text an NVDA senden. Fallback: Konsolen-Ausgabe.
         """
-        print(f"[SPRACHE]: {text}")
-        if self.speaker:
-            try:
-                self.speaker.speak(text, interrupt=interrupt)
-            except Exception as e:
-                print(f"[NVDA Fehler]: {e}")
+        self.speech.speak(text, interrupt=interrupt)
 
-    def play_sound(self, sound_name):
-        """Spielt einen Sound-Effekt ab (wav, ogg oder mp3)."""
-        formats = ["wav", "ogg", "mp3"]
-        for fmt in formats:
+    def _get_sound(self, sound_name):
+        """Lädt einen Sound einmalig (wav, ogg, mp3 oder Synthese) und cached ihn."""
+        if sound_name in self._sounds:
+            return self._sounds[sound_name]
+        sound = None
+        for fmt in SOUND_FORMATS:
             try:
                 sound_path = resource_path(f"assets/{sound_name}.{fmt}")
                 if os.path.exists(sound_path):
                     sound = pygame.mixer.Sound(sound_path)
-                    sound.set_volume(0.15)
-                    sound.play()
-                    return
+                    break
             except Exception:
                 continue
+        if sound is None:
+            # Keine Datei vorhanden: Effekt direkt im Speicher synthetisieren
+            try:
+                from generate_sfx import synthesize_sound
+                sound = synthesize_sound(sound_name)
+            except Exception:
+                sound = None
+        self._sounds[sound_name] = sound
+        return sound
+
+    def play_sound(self, sound_name):
+        """Spielt einen Sound-Effekt auf einem Kanal seiner Kategorie ab."""
+        if not self.mixer_ready:
+            return
+        sound = self._get_sound(sound_name)
+        if sound is None:
+            return
+        sound.set_volume(0.15)
+        category = SOUND_CATEGORIES.get(sound_name, "ui")
+        self.channel_manager.play(category, sound)
 
     def play_loop(self, sound_name):
         """Startet einen Sound in Endlosschleife."""
-        formats = ["wav", "ogg", "mp3"]
-        for fmt in formats:
-            try:
-                sound_path = resource_path(f"assets/{sound_name}.{fmt}")
-                if os.path.exists(sound_path):
-                    self.current_loop = pygame.mixer.Sound(sound_path)
-                    self.current_loop.set_volume(0.1)
-                    self.current_loop.play(loops=-1)
-                    return
-            except Exception:
-                continue
         self.current_loop = None
+        if not self.mixer_ready:
+            return
+        sound = self._get_sound(sound_name)
+        if sound is None:
+            return
+        sound.set_volume(0.1)
+        self.current_loop = self.channel_manager.play("loop", sound, loops=-1)
 
     def play_music(self, music_name):
-        """Startet Hintergrundmusik über pygame.mixer.music."""
-        if not self.music_enabled:
-            return
-        formats = ["mp3", "ogg", "wav"]
-        for fmt in formats:
-            try:
-                music_path = resource_path(f"assets/{music_name}.{fmt}")
-                if os.path.exists(music_path):
-                    pygame.mixer.music.load(music_path)
-                    pygame.mixer.music.set_volume(0.05)
-                    pygame.mixer.music.play(loops=-1)
-                    return
-            except Exception:
-                continue
+        """Spielt einen einzelnen Musiktitel in Endlosschleife (vorab dekodiert)."""
+        if self.music and self.music_enabled:
+            self.music.play_track(music_name)
+
+    def set_music_context(self, context):
+        """Wechselt zur Playlist eines Spielkontexts mit Überblendung."""
+        self._music_context = context
+        if self.music:
+            self.music.set_context(context)
 
     def stop_music(self):
         """Stoppt die Hintergrundmusik."""
-        pygame.mixer.music.stop()
+        if self.music:
+            self.music.stop()
+
+    def update(self):
+        """Pro Frame aufrufen (Playlist-Fortschritt, fertig dekodierte Titel)."""
+        if not self.music:
+            return
+        # Mixer wurde im Hintergrund fertig: zwischenzeitliche Wünsche nachholen
+        if self.music.enabled != self.music_enabled:
+            self.music.set_enabled(self.music_enabled)
+        if self._music_context and self.music.context != self._music_context:
+            self.music.set_context(self._music_context)
+        self.music.update()
 
     def stop_loop(self):
         """Stoppt die aktuelle Schleife."""
-        if hasattr(self, 'current_loop') and self.current_loop:
+        if self.current_loop:
             self.current_loop.stop()
             self.current_loop = None
 
     def cleanup(self):
         """Ressourcen freigeben."""
         self.stop_loop()
+        if self.music:
+            self.music.shutdown()
         try:
             pygame.mixer.quit()
         except Exception:
             pass
+
+
+class NullAudioManager:
+    """
+    Stummes Gegenstück zum AudioManager (ohne NVDA und Soundkarte).
+    Zeichnet Sprachausgaben und Sounds nur auf, z.B. für den Headless-Modus.
+    """
+
+    def __init__(self, echo=False):
+        self.echo = echo
+        self.music_enabled = True
+        self.current_loop = None
+        self.spoken = deque(maxlen=SPOKEN_HISTORY)  # Die letzten gesprochenen Texte
+        self.spoken_count = 0           # Anzahl aller Ansagen
+        self.sound_counts = {}          # Sound-Name -> Anzahl
+
+    def set_music_enabled(self, enabled):
+        self.music_enabled = enabled
+
+    def speak(self, text, interrupt=True):
+        self.spoken.append(text)
+        self.spoken_count += 1
+        if self.echo:
+            print(f"[SPRACHE]: {text}")
+
+    def play_sound(self, sound_name):
+        self.sound_counts[sound_name] = self.sound_counts.get(sound_name, 0) + 1
+
+    def play_loop(self, sound_name):
+        self.play_sound(sound_name)
+
+    def play_music(self, music_name):
+        pass
+
+    def set_music_context(self, context):
+        pass
+
+    def stop_music(self):
+        pass
+
+    def update(self):
+        pass
+
+    def stop_loop(self):
+        self.current_loop = None
+
+    def cleanup(self):
+        pass
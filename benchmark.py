@@ -0,0 +1,1484 @@
+"""
+Benchmarks & Stresstests für Audio Studio Tycoon - Audio Edition.
+
+Aufruf: python benchmark.py [szenario ...]
+Ohne Argumente laufen alle Szenarien. Läuft ohne Bildschirm und
+Soundkarte (SDL-Dummy-Treiber).
+"""
+
+import os
+import sys
+import time
+import random
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """Registriert eine Funktion als Benchmark-Szenario."""
+    def decorator(func):
+        BENCHMARKS[name] = func
+        return func
+    return decorator
+
+
+# ============================================================
+# AUDIO
+# ============================================================
+
+@benchmark("audio_stress")
+def bench_audio_stress(sounds_per_second=5000, duration=2.0):
+    """Feuert tausende Sounds pro Sekunde gegen den Dummy-Audiotreiber."""
+    import pygame
+    from audio import AudioManager, CHANNEL_LAYOUT, SOUND_CATEGORIES, preinit_mixer
+
+    preinit_mixer()
+    pygame.init()
+    audio = AudioManager()
+    assert audio.mixer_ready, "Mixer konnte nicht initialisiert werden"
+
+    audio.play_loop("typing")
+    loop_channel = audio.current_loop
+    names = [n for n in SOUND_CATEGORIES if n != "typing"]
+    rng = random.Random(1)
+
+    interval = 1.0 / sounds_per_second
+    fired = 0
+    max_voices = {cat: 0 for cat in CHANNEL_LAYOUT}
+    start = time.perf_counter()
+    next_shot = start
+    while True:
+        now = time.perf_counter()
+        if now - start >= duration:
+            break
+        if now < next_shot:
+            continue
+        audio.play_sound(rng.choice(names))
+        fired += 1
+        next_shot += interval
+        if fired % 250 == 0:
+            for cat in CHANNEL_LAYOUT:
+                max_voices[cat] = max(max_voices[cat], audio.channel_manager.active_voices(cat))
+    elapsed = time.perf_counter() - start
+
+    assert loop_channel is not None and loop_channel.get_busy(), "Tipp-Schleife wurde abgeschnitten"
+    for cat, limit in CHANNEL_LAYOUT.items():
+        assert max_voices[cat] <= limit, f"Polyphonie-Limit in '{cat}' überschritten"
+
+    stats = dict(audio.channel_manager.stats)
+    audio.cleanup()
+    pygame.quit()
+    return {
+        "sounds": fired,
+        "sounds_per_second": round(fired / elapsed),
+        "stolen_voices": stats["stolen"],
+        "max_voices": max_voices,
+    }
+
+
+@benchmark("music_switch")
+def bench_music_switch(switches=200, frame_budget=1.0 / 30):
+    """Misst Kontextwechsel der Musik mit vorab dekodierten Titeln."""
+    import tempfile
+    import pygame
+    from audio import MIXER_SETTINGS
+    from generate_sfx import render, write_wav
+    from music import MusicPlayer
+
+    pygame.mixer.init(**MIXER_SETTINGS)
+    pygame.mixer.set_num_channels(8)
+    with tempfile.TemporaryDirectory() as tmp:
+        os.makedirs(os.path.join(tmp, "assets"))
+        playlists = {}
+        for i, context in enumerate(["main_menu", "development", "review"]):
+            name = f"music_{context}"
+            recipe = {"duration": 20.0, "volume": 0.3, "tones": [{"freq": 220 + i * 110}]}
+            write_wav(os.path.join(tmp, "assets", f"{name}.wav"), render(recipe))
+            playlists[context] = [name]
+
+        player = MusicPlayer(
+            [pygame.mixer.Channel(0), pygame.mixer.Channel(1)],
+            lambda rel: os.path.join(tmp, rel), playlists,
+        )
+        player.preload()
+        deadline = time.perf_counter() + 10.0
+        while any(not player._lookup(n)[0] for pl in playlists.values() for n in pl):
+            assert time.perf_counter() < deadline, "Dekodierung dauert zu lange"
+            time.sleep(0.01)
+
+        contexts = list(playlists)
+        worst = 0.0
+        for i in range(switches):
+            start = time.perf_counter()
+            player.set_context(contexts[i % len(contexts)])
+            player.update()
+            worst = max(worst, time.perf_counter() - start)
+        assert worst < frame_budget, f"Kontextwechsel dauerte {worst * 1000:.1f} ms"
+
+        # Kontextwechsel bei ausgeschalteter Musik: danach läuft die neue Playlist
+        player.set_context("main_menu")
+        player.set_enabled(False)
+        player.set_context("review")
+        player.set_enabled(True)
+        player.update()
+        assert player.track == playlists["review"][0], "Nach dem Einschalten läuft der alte Titel weiter"
+        assert player.channels[player._active].get_busy(), "Neue Playlist startet nicht"
+        player.shutdown()
+    pygame.mixer.quit()
+    return {"switches": switches, "worst_switch_ms": round(worst * 1000, 3)}
+
+
+@benchmark("sfx_render")
+def bench_sfx_render(rounds=200):
+    """Rendert alle Effekt-Rezepte; prüft Sweeps und gestaffelte Töne."""
+    import tempfile
+    import numpy as np
+    from generate_sfx import SAMPLE_RATE, SFX_RECIPES, generate_beep, render
+
+    def frequency(samples):
+        # Nulldurchgänge pro Sekunde / 2 = Grundfrequenz eines Sinus
+        crossings = np.count_nonzero(np.diff(np.signbit(samples)))
+        return crossings / 2 / (len(samples) / SAMPLE_RATE)
+
+    def window(samples, start, end):
+        return samples[int(start * SAMPLE_RATE):int(end * SAMPLE_RATE)]
+
+    error = render(SFX_RECIPES["error"])
+    early, late = frequency(window(error, 0.01, 0.05)), frequency(window(error, 0.10, 0.14))
+    assert early > late * 1.4, f"Fehler-Sweep fällt nicht ({early:.0f} Hz -> {late:.0f} Hz)"
+
+    confirm = render(SFX_RECIPES["confirm"])
+    low, high = frequency(window(confirm, 0.01, 0.045)), frequency(window(confirm, 0.055, 0.09))
+    assert abs(low - 660) < 60 and abs(high - 880) < 60, f"Bestätigung steigt nicht ({low:.0f} -> {high:.0f} Hz)"
+
+    success = render(SFX_RECIPES["success"])
+    levels = [np.abs(window(success, t, t + 0.04)).max() for t in (0.015, 0.075, 0.135)]
+    assert levels[0] < levels[1] < levels[2], f"Dreiklang setzt nicht gestaffelt ein: {levels}"
+
+    # Frischer Checkout ohne assets/: der Ordner wird angelegt
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "assets", "beep.wav")
+        generate_beep(path, 440, 0.05)
+        assert os.path.getsize(path) > 44, "Beep nicht geschrieben"
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for recipe in SFX_RECIPES.values():
+            render(recipe)
+    per_sound = (time.perf_counter() - start) / (rounds * len(SFX_RECIPES))
+    return {
+        "recipes": len(SFX_RECIPES),
+        "render_us": round(per_sound * 1e6, 1),
+        "error_sweep_hz": [round(early), round(late)],
+    }
+
+
+# ============================================================
+# HAUPTSCHLEIFE
+# ============================================================
+
+@benchmark("loop_idle")
+def bench_loop_idle(seconds=3.0):
+    """Aufwachvorgänge und CPU-Zeit pro Leerlauf-Minute in beiden Schleifen-Modi."""
+    import pygame
+    from audio import AudioManager, preinit_mixer
+    from logic import GameState
+    from game import Game
+    from main import LOOP_MODES
+
+    preinit_mixer()
+    pygame.init()
+    screen = pygame.display.set_mode((500, 300))
+    audio = AudioManager()
+    results = {}
+    for mode in LOOP_MODES:
+        game = Game(audio, GameState(), screen, loop_mode=mode)
+        game.current_menu.announce_entry()
+        pygame.event.clear()
+        game.run(max_seconds=seconds)
+        results[mode] = game.stats.summary()
+
+    # HUD: Änderungen am Spielzustand ohne Eingabe werden trotzdem gezeichnet
+    from hud import HudRenderer
+    state = GameState()
+    hud = HudRenderer(screen)
+    assert hud.draw(state, "game_menu"), "HUD nicht gezeichnet"
+    assert not hud.draw(state, "game_menu"), "HUD ohne Änderung neu gezeichnet"
+    state.money += 1000
+    assert hud.draw(state, "game_menu"), "Geldänderung ohne Eingabe nicht angezeigt"
+    audio.cleanup()
+    pygame.quit()
+
+    assert results["event"]["wakeups"] < results["poll"]["wakeups"], "Event-Modus wacht nicht seltener auf"
+    assert results["event"]["cpu_seconds_per_minute"] < results["poll"]["cpu_seconds_per_minute"], \
+        "Event-Modus braucht im Leerlauf mehr CPU als Polling"
+    return results
+
+
+@benchmark("profiler_overhead")
+def bench_profiler_overhead(frames=20000):
+    """Kosten der Spans pro Frame: ausgeschaltet muss es praktisch gratis sein."""
+    import pygame
+    from audio import NullAudioManager
+    from logic import GameState
+    from game import Game
+    from profiling import Profiler, HOT_METHODS
+
+    pygame.init()
+    results = {}
+    for enabled in (False, True):
+        game = Game(NullAudioManager(), GameState(), screen=None, profiler=Profiler(enabled=enabled))
+        start = time.perf_counter()
+        for _ in range(frames):
+            with game.profiler.span("update"):
+                game.update()
+        results["enabled" if enabled else "disabled"] = (time.perf_counter() - start) / frames
+        if enabled:
+            game.state.advance_week()
+            spans = game.profiler.summary()
+            game.profiler.disable()
+    pygame.quit()
+
+    assert "state.advance_week" in spans and "is_bankrupt" in spans, "Spans fehlen"
+    assert not any(hasattr(getattr(GameState, name), "__wrapped__") for name in HOT_METHODS), \
+        "GameState nach disable() noch instrumentiert"
+    null = Profiler()
+    start = time.perf_counter()
+    for _ in range(frames):
+        with null.span("x"):
+            pass
+    per_span = (time.perf_counter() - start) / frames
+    assert per_span < 2e-6, f"Ausgeschalteter Span kostet {per_span * 1e9:.0f} ns"
+    return {
+        "frame_disabled_us": round(results["disabled"] * 1e6, 2),
+        "frame_enabled_us": round(results["enabled"] * 1e6, 2),
+        "null_span_ns": round(per_span * 1e9),
+    }
+
+
+@benchmark("input_burst")
+def bench_input_burst(burst=10):
+    """Auto-Repeat-Salven: pro Salve nur eine Ansage und ein Klick."""
+    import pygame
+    from audio import SPOKEN_HISTORY, NullAudioManager
+    from logic import GameState
+    from game import Game
+
+    def key(k, char=""):
+        return pygame.event.Event(pygame.KEYDOWN, key=k, unicode=char, mod=0)
+
+    results = {}
+    for coalesce in (False, True):
+        audio = NullAudioManager()
+        game = Game(audio, GameState(), screen=None, coalesce_input=coalesce)
+        game.navigate("topic_menu")
+        spoken, clicks = audio.spoken_count, audio.sound_counts.get("click", 0)
+
+        game.dispatch_all([key(pygame.K_DOWN)] * burst)
+        game.dispatch_all([key(pygame.K_DOWN)] * 3 + [key(pygame.K_UP)] * 5)
+        game.dispatch_all([key(pygame.K_DOWN), key(pygame.K_UP)])
+        results["coalesced" if coalesce else "raw"] = {
+            "speech": audio.spoken_count - spoken,
+            "clicks": audio.sound_counts.get("click", 0) - clicks,
+            "index": game.current_menu.current_index,
+        }
+
+        # Enter trennt Serien: danach landen die Tasten im Genre-Menü
+        game.dispatch_all([key(pygame.K_DOWN)] * 2 + [key(pygame.K_RETURN)] + [key(pygame.K_DOWN)] * 3)
+        assert game.current_key == "genre_menu", game.current_key
+        assert game.current_menu.current_index == 3, "Tasten nach Enter gehören zum neuen Menü"
+
+    raw, merged = results["raw"], results["coalesced"]
+    assert raw["index"] == merged["index"] == burst - 2, "Netto-Bewegung weicht ab"
+    assert raw["speech"] == raw["clicks"] == burst + 10
+    assert merged["speech"] == merged["clicks"] == 2, merged
+
+    # Lange Läufe: der stumme Audio-Manager behält nur die letzten Ansagen
+    audio = NullAudioManager()
+    for i in range(SPOKEN_HISTORY * 5):
+        audio.speak(f"Ansage {i}")
+    assert len(audio.spoken) == SPOKEN_HISTORY, "Ansage-Verlauf wächst unbegrenzt"
+    assert audio.spoken_count == SPOKEN_HISTORY * 5 and audio.spoken[-1] == f"Ansage {SPOKEN_HISTORY * 5 - 1}"
+    return results
+
+
+# ============================================================
+# MENÜS
+# ============================================================
+
+@benchmark("menu_startup")
+def bench_menu_startup(rounds=50):
+    """Vergleicht das Erzeugen aller Menüs mit der Lazy-Registry bis zum Hauptmenü."""
+    from audio import NullAudioManager
+    from logic import GameState
+    from game import MENU_FACTORIES
+    from menus import MenuRegistry
+
+    audio = NullAudioManager()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        state = GameState()
+        for factory in MENU_FACTORIES.values():
+            factory(audio, state)
+    eager = (time.perf_counter() - start) / rounds
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        registry = MenuRegistry(MENU_FACTORIES, audio, GameState())
+        registry["main_menu"].announce_entry()
+    lazy = (time.perf_counter() - start) / rounds
+
+    registry = MenuRegistry(MENU_FACTORIES, audio, GameState(), max_resident=5)
+    for key in MENU_FACTORIES:
+        registry[key]
+    assert len(registry.resident_keys()) <= 5, "Eviction greift nicht"
+
+    assert lazy < eager, "Lazy-Registry ist nicht schneller"
+    return {
+        "eager_ms": round(eager * 1000, 3),
+        "lazy_ms": round(lazy * 1000, 3),
+        "evicted": registry.stats["evicted"],
+    }
+
+
+@benchmark("virtual_inbox")
+def bench_virtual_inbox(mails=20000):
+    """Betreten und Blättern in einem Posteingang mit 20.000 E-Mails."""
+    import pygame
+    from audio import NullAudioManager
+    from logic import GameState
+    from menus import EmailInboxMenu
+    from models import Email
+
+    state = GameState()
+    state.emails = [Email("Fan", f"Post {i}", "Hallo!", i // 10) for i in range(mails)]
+    audio = NullAudioManager()
+    menu = EmailInboxMenu(audio, state)
+
+    start = time.perf_counter()
+    menu.announce_entry()
+    enter = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for key in (pygame.K_END, pygame.K_PAGEUP, pygame.K_PAGEDOWN, pygame.K_HOME, pygame.K_UP):
+        menu.handle_input(pygame.event.Event(pygame.KEYDOWN, key=key))
+    navigate = time.perf_counter() - start
+
+    assert menu.current_index == mails, "Hoch vom Anfang sollte auf 'Zurück' springen"
+    assert audio.spoken[-1].startswith("Zurück."), audio.spoken[-1]
+    assert menu.handle_input(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN)) == "game_menu"
+    assert enter < 0.05, f"Betreten dauerte {enter * 1000:.1f} ms"
+
+    return {
+        "mails": mails,
+        "enter_ms": round(enter * 1000, 3),
+        "navigate_ms": round(navigate * 1000, 3),
+    }
+
+
+@benchmark("typeahead")
+def bench_typeahead(mails=20000, lookups=2000):
+    """Type-Ahead in Themenliste und großem Posteingang."""
+    import pygame
+    from audio import NullAudioManager
+    from logic import GameState
+    from menus import ChartsMenu, EmailInboxMenu, Menu, TopicMenu
+    from models import Email
+
+    def press(menu, char):
+        key = ord(char.lower()) if char.isalpha() else 0
+        return menu.handle_input(pygame.event.Event(pygame.KEYDOWN, key=key, unicode=char))
+
+    audio = NullAudioManager()
+    state = GameState()
+    topics = TopicMenu(audio, state)
+    topics.announce_entry()
+    before = audio.spoken_count
+    for char in "Wel":
+        press(topics, char)
+    assert topics.options[topics.current_index]['text'] == "Weltraum", topics.current_index
+    assert audio.spoken_count - before == 1, "Pro Sprung genau eine Ansage"
+    topics._typeahead.reset()
+    topics.current_index = 0
+    for _ in range(3):
+        press(topics, "s")
+    assert topics.options[topics.current_index]['text'] == "Sport", "S-Taste springt reihum"
+
+    state.emails = [Email("Fan", f"Post {i:05d}", "Hallo!", 1) for i in range(mails)]
+    inbox = EmailInboxMenu(audio, state)
+    inbox.announce_entry()
+    start = time.perf_counter()
+    press(inbox, "P")
+    build = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(lookups):
+        inbox._typeahead.reset()
+        target = random.randrange(mails)
+        for char in f"Post {target:05d}":
+            press(inbox, char)
+    lookup = (time.perf_counter() - start) / lookups
+    assert inbox.current_index == target, "Sprung im Posteingang landet falsch"
+
+    # Charts: gleiche erste/letzte Zeile, andere Reihenfolge dazwischen
+    charts = ChartsMenu(audio, state)
+    tops = {
+        "weekly": [("Alpha", "A", 4), ("Bravo", "B", 3), ("Charlie", "C", 2), ("Zulu", "Z", 1)],
+        "sales": [("Alpha", "A", 4), ("Charlie", "C", 3), ("Bravo", "B", 2), ("Zulu", "Z", 1)],
+    }
+    state.charts.top = lambda metric: tops.get(metric, tops["sales"])
+    charts.announce_entry()
+    press(charts, "b")
+    assert charts.current_index == 1, "Sprung in den Wochen-Charts landet falsch"
+    charts.handle_input(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RIGHT, unicode=""))
+    charts._typeahead.reset()
+    press(charts, "b")
+    assert charts.current_index == 2, "Type-Ahead-Index nach Chart-Wechsel veraltet"
+
+    # Geänderter Eintragstext ohne neue Options-Liste
+    menu = Menu("Test", [{'text': "Alpha"}, {'text': "Bravo"}], audio, state)
+    press(menu, "c")
+    menu.options[1]['text'] = "Charlie"
+    menu.invalidate_jump()
+    menu._typeahead.reset()
+    press(menu, "c")
+    assert menu.current_index == 1, "Type-Ahead-Index nach Textänderung veraltet"
+    return {
+        "index_build_ms": round(build * 1000, 2),
+        "lookup_us": round(lookup * 1e6, 1),
+    }
+
+
+# ============================================================
+# ÜBERSETZUNGEN
+# ============================================================
+
+@benchmark("translations")
+def bench_translations(calls=200000):
+    """get_text über den kompilierten Katalog im Vergleich zum direkten str.format."""
+    from logic import GameState
+    from translations import available_languages, load_pack
+    from catalog import validate_packs
+
+    def legacy_get_text(table, key, **kwargs):
+        text = table.get(key, key)
+        if kwargs:
+            try:
+                return text.format(**kwargs)
+            except Exception:
+                return text
+        return text
+
+    problems = validate_packs()
+    assert not problems, problems
+
+    state = GameState()
+    table = load_pack("de")
+    results = {}
+    for label, func in (
+        ("legacy", lambda key, **kw: legacy_get_text(table, key, **kw)),
+        ("catalog", state.get_text),
+    ):
+        start = time.perf_counter()
+        for i in range(calls):
+            func('week')
+            func('money', money=i)
+        results[f"{label}_ns"] = round((time.perf_counter() - start) / (2 * calls) * 1e9)
+
+    args = dict(money=1, bugs=2, slot=3, name="X", char="a", text="b")
+    for language in available_languages():
+        state.set_language(language)
+        table = load_pack(language)
+        fields = state._catalog.fields
+        for key in table:
+            assert state.get_text(key) == legacy_get_text(table, key), key
+            if fields[key] <= set(args):
+                assert state.get_text(key, **args) == legacy_get_text(table, key, **args), key
+
+    # Unbekannte Sprache: einmal auf die Referenz zurückfallen, danach kein Nachladen mehr
+    import catalog
+    loads = []
+    original = catalog.load_pack
+    catalog.load_pack = lambda language, directory=None: loads.append(language) or original(language, directory)
+    try:
+        state.settings["language"] = "xx"
+        for _ in range(200):
+            state.get_text('back')
+    finally:
+        catalog.load_pack = original
+        state.set_language("de")
+    assert loads.count("xx") == 1, f"Fehlendes Sprachpaket {loads.count('xx')}x geladen"
+    return results
+
+
+@benchmark("language_packs")
+def bench_language_packs(extra_locales=10, rounds=20):
+    """Zehn zusätzliche Sprachpakete dürfen Startzeit und Speicher nicht verändern."""
+    import shutil
+    import tempfile
+    import tracemalloc
+    import catalog
+    import translations
+
+    def measure(directory):
+        translations.LANG_DIR = directory
+        best, peak = float("inf"), 0
+        for _ in range(rounds):
+            catalog._active = None
+            tracemalloc.start()
+            start = time.perf_counter()
+            catalog.get_catalog("de").text("main_menu")
+            best = min(best, time.perf_counter() - start)
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+        return best, peak
+
+    original = translations.LANG_DIR
+    try:
+        with tempfile.TemporaryDirectory() as small, tempfile.TemporaryDirectory() as large:
+            for name in os.listdir(original):
+                shutil.copy(os.path.join(original, name), small)
+                shutil.copy(os.path.join(original, name), large)
+            for i in range(extra_locales):
+                shutil.copy(os.path.join(original, "en.json"), os.path.join(large, f"x{i}.json"))
+            base_time, base_mem = measure(small)
+            more_time, more_mem = measure(large)
+            translations.LANG_DIR = large
+            assert len(translations.available_languages()) == len(os.listdir(original)) + extra_locales
+    finally:
+        translations.LANG_DIR = original
+        catalog._active = None
+
+    assert more_mem <= base_mem * 1.05, f"Speicher {base_mem} -> {more_mem} Bytes"
+    assert more_time <= base_time * 1.5 + 0.001, f"Ladezeit {base_time:.4f}s -> {more_time:.4f}s"
+    return {
+        "load_ms": round(base_time * 1000, 3),
+        "load_ms_with_extra": round(more_time * 1000, 3),
+        "peak_kb": round(base_mem / 1024, 1),
+        "peak_kb_with_extra": round(more_mem / 1024, 1),
+    }
+
+
+# ============================================================
+# SPIELDATEN
+# ============================================================
+
+@benchmark("compat_matrix")
+def bench_compat_matrix(topics=600, genres=40, rounds=3):
+    """Kompatibilität bei Content-Packs mit hunderten Themen: Dict+list.index gegen Matrix."""
+    from game_data import TOPICS, GENRES, TOPIC_GENRE_COMPAT, CompatMatrix
+
+    rng = random.Random(7)
+    topic_names = list(TOPICS) + [f"Thema {i}" for i in range(topics - len(TOPICS))]
+    genre_names = list(GENRES) + [f"Genre {i}" for i in range(genres - len(GENRES))]
+    table = {t: [rng.randint(0, 3) for _ in genre_names] for t in topic_names}
+    table.update(TOPIC_GENRE_COMPAT)   # kurze Original-Zeilen: Rest neutral
+    pairs = [(t, g) for t in topic_names for g in genre_names]
+
+    def old_lookup(topic, genre):
+        if topic not in table:
+            return 1
+        row = table[topic]
+        genre_index = genre_names.index(genre) if genre in genre_names else 0
+        return row[genre_index] if genre_index < len(row) else 1
+
+    def timed(func):
+        best = float("inf")
+        for _ in range(rounds):
+            start = time.perf_counter()
+            result = func()
+            best = min(best, time.perf_counter() - start)
+        return best, result
+
+    build_time, compat = timed(lambda: CompatMatrix(topic_names, genre_names, table))
+    old_time, old_values = timed(lambda: [old_lookup(t, g) for t, g in pairs])
+    new_time, new_values = timed(lambda: [compat.value(t, g) for t, g in pairs])
+    assert old_values == new_values, "Matrix liefert andere Werte als die Tabelle"
+
+    def old_sort():
+        return [sorted(genre_names, key=lambda g: -old_lookup(t, g)) for t in topic_names]
+
+    def new_sort():
+        return [compat.genres_by_compatibility(t) for t in topic_names]
+
+    old_sort_time, old_orders = timed(old_sort)
+    new_sort_time, new_orders = timed(new_sort)
+    assert old_orders == new_orders, "Sortierung weicht ab"
+    column_time, _ = timed(lambda: [compat.topics_by_compatibility(g) for g in genre_names])
+
+    assert new_time < old_time, f"Matrix-Lookup langsamer ({new_time:.4f}s gegen {old_time:.4f}s)"
+    assert new_sort_time < old_sort_time, "Zeilen-Sortierung langsamer als sorted()"
+    return {
+        "topics": len(topic_names),
+        "genres": len(genre_names),
+        "build_ms": round(build_time * 1000, 3),
+        "lookup_ns_old": round(old_time / len(pairs) * 1e9, 1),
+        "lookup_ns_matrix": round(new_time / len(pairs) * 1e9, 1),
+        "sort_rows_ms_old": round(old_sort_time * 1000, 3),
+        "sort_rows_ms_matrix": round(new_sort_time * 1000, 3),
+        "sort_columns_ms_matrix": round(column_time * 1000, 3),
+    }
+
+
+@benchmark("release_timeline")
+def bench_release_timeline(platforms=3000, features=3000, weeks=10000, random_jumps=2000):
+    """Verfügbarkeit über eine 10.000-Wochen-Ära: Vollscan gegen Zeitleisten-Index."""
+    from timeline import ReleaseTimeline
+
+    rng = random.Random(11)
+    platform_list = []
+    for i in range(platforms):
+        start = rng.randint(1, weeks)
+        end = None if rng.random() < 0.2 else start + rng.randint(20, 400)
+        platform_list.append({"name": f"Plattform {i}", "available_week": start, "end_week": end})
+    feature_list = [{"name": f"Feature {i}", "week": rng.randint(1, weeks)} for i in range(features)]
+
+    def old_platforms(week):
+        current_week = float(week)
+        available = []
+        for p in platform_list:
+            start = float(p["available_week"]) if p["available_week"] is not None else 0.0
+            end = float(p["end_week"]) if p["end_week"] is not None else 99999.0
+            if start <= current_week <= end:
+                available.append(p)
+        return available
+
+    def old_features(week):
+        return [f for f in feature_list if int(f["week"]) <= week]
+
+    sample_weeks = range(1, weeks + 1, 97)
+    start = time.perf_counter()
+    for week in sample_weeks:
+        old_platforms(week)
+        old_features(week)
+    old_per_week = (time.perf_counter() - start) / len(sample_weeks)
+
+    plat_index = ReleaseTimeline(platform_list, "available_week", "end_week")
+    feat_index = ReleaseTimeline(feature_list, "week")
+    start = time.perf_counter()
+    for week in range(1, weeks + 1):
+        plat_index.available(week)
+        feat_index.available(week)
+    new_per_week = (time.perf_counter() - start) / weeks
+
+    jumps = [rng.randint(0, weeks + 50) for _ in range(random_jumps)]
+    start = time.perf_counter()
+    for week in jumps:
+        plat_index.available(week)
+    jump_time = (time.perf_counter() - start) / random_jumps
+
+    for week in jumps[:50] + list(sample_weeks[:20]):
+        assert plat_index.available(week) == old_platforms(week), f"Plattformen weichen ab (Woche {week})"
+        assert feat_index.available(week) == old_features(week), f"Features weichen ab (Woche {week})"
+
+    assert new_per_week < old_per_week, "Index langsamer als Vollscan"
+    return {
+        "items": platforms + features,
+        "weeks": weeks,
+        "scan_us_per_week": round(old_per_week * 1e6, 1),
+        "index_us_per_week": round(new_per_week * 1e6, 2),
+        "random_jump_us": round(jump_time * 1e6, 1),
+    }
+
+
+@benchmark("content_packs")
+def bench_content_packs(entries=5000, rounds=5):
+    """Content-Pack mit 5.000 Einträgen: erster Start (parsen) gegen Start mit Cache."""
+    import json
+    import tempfile
+    import content
+    import game_data
+
+    rng = random.Random(5)
+    n = entries // 4
+    genres = [f"Genre {i}" for i in range(n // 20)]
+    pack = {
+        "topics": [f"Thema {i}" for i in range(n)],
+        "genres": genres,
+        "compatibility": {
+            f"Thema {i}": {g: rng.randint(0, 3) for g in rng.sample(genres, 5)} for i in range(n)
+        },
+        "platforms": [
+            {"name": f"Plattform {i}", "available_week": rng.randint(1, 5000),
+             "end_week": None if i % 5 == 0 else 5000 + i, "license_fee": rng.randint(0, 50000)}
+            for i in range(n)
+        ],
+        "features": [
+            {"category": "Grafik", "name": f"Feature {i}", "week": rng.randint(1, 5000),
+             "cost": rng.randint(0, 90000), "tech_bonus": rng.randint(1, 5)}
+            for i in range(n)
+        ],
+    }
+
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, "gross.json"), "w", encoding="utf-8") as f:
+                json.dump(pack, f)
+            cache_path = os.path.join(directory, "cache.pickle")
+
+            cold = float("inf")
+            for _ in range(rounds):
+                if os.path.exists(cache_path):
+                    os.remove(cache_path)
+                info = content.load_content_packs(directory, cache_path)
+                assert not info["cached"] and info["problems"] == 0
+                cold = min(cold, info["seconds"])
+            warm = float("inf")
+            for _ in range(rounds):
+                info = content.load_content_packs(directory, cache_path)
+                assert info["cached"]
+                warm = min(warm, info["seconds"])
+
+            cache_kb = os.path.getsize(cache_path) / 1024
+
+            # Eine Datei ohne passende Kopfzeile (fremd oder veraltet) wird nicht entpickelt
+            import pickle
+            with open(cache_path, "rb") as f:
+                f.readline()
+                cached = pickle.load(f)
+            with open(cache_path, "wb") as f:
+                pickle.dump(cached, f)
+            info = content.load_content_packs(directory, cache_path)
+            assert not info["cached"], "Cache ohne Kopfzeile wurde geladen"
+            assert content.load_content_packs(directory, cache_path)["cached"], "Cache nicht neu geschrieben"
+
+            assert len(game_data.TOPICS) >= n and len(game_data.PLATFORMS) >= n
+            assert game_data.COMPAT.matrix.shape == (len(game_data.TOPICS), len(game_data.GENRES))
+            assert any(p["name"] == "Plattform 0" for p in game_data.get_available_platforms(5000))
+    finally:
+        content.reset_content()
+
+    assert len(game_data.TOPICS) == 25, "Basisdaten nicht wiederhergestellt"
+    assert warm < content.CONTENT_BUDGET, f"Start mit Cache {warm:.3f}s über Budget"
+    assert warm < cold, "Cache bringt nichts"
+    return {
+        "entries": entries,
+        "cold_ms": round(cold * 1000, 2),
+        "cached_ms": round(warm * 1000, 2),
+        "budget_ms": content.CONTENT_BUDGET * 1000,
+        "cache_kb": round(cache_kb, 1),
+    }
+
+
+@benchmark("content_scale")
+def bench_content_scale(scales=(1, 10, 100), seed=3, sim_weeks=150):
+    """Alle Hot-Paths mit generierten Spieldaten in 1-, 10- und 100-facher Größe."""
+    import pygame
+    import content
+    import game_data
+    import headless
+    import procgen
+    from audio import NullAudioManager
+    from logic import GameState
+    from menus import GenreMenu, TopicMenu
+    from models import GameProject
+
+    pygame.init()
+    assert procgen.generate_content(2, seed) == procgen.generate_content(2, seed), "Generator nicht reproduzierbar"
+
+    def per_call(func, args_list):
+        start = time.perf_counter()
+        for args in args_list:
+            func(*args)
+        return (time.perf_counter() - start) / len(args_list) * 1e6
+
+    results = {}
+    try:
+        for scale in scales:
+            tables = procgen.generate_content(scale, seed)
+            start = time.perf_counter()
+            content.install_tables(tables)
+            install_ms = (time.perf_counter() - start) * 1000
+            topics, genres = game_data.TOPICS, game_data.GENRES
+            rng = random.Random(scale)
+            random.seed(scale)
+            pairs = [(rng.choice(topics), rng.choice(genres)) for _ in range(20000)]
+            weeks = range(1, 2001)
+
+            state = GameState()
+            state.company_name = "Benchmark"
+            project = GameProject(
+                "Test", topics[0], genres[0], sliders={s: 5 for s in game_data.SLIDER_NAMES},
+                platform=game_data.PLATFORMS[-1]["name"], engine=state.engines[0],
+            )
+            project.review = state.calculate_review(project)
+
+            def researchable(week):
+                state.week = week
+                state.get_researchable_features()
+
+            audio = NullAudioManager()
+            state.week = 1
+
+            def menus(topic):
+                state.current_draft["topic"] = topic
+                TopicMenu(audio, state).jump_index()
+                GenreMenu(audio, state).announce_entry()
+
+            row = {
+                "install_ms": round(install_ms, 2),
+                "compat_us": per_call(game_data.get_compatibility, pairs),
+                "genre_sort_us": per_call(game_data.genres_by_compatibility, [(t,) for t, _ in pairs[:500]]),
+                "platforms_week_us": per_call(game_data.get_available_platforms, [(w,) for w in weeks]),
+                "researchable_us": per_call(researchable, [(w,) for w in weeks]),
+                "review_us": per_call(state.calculate_review, [(project,)] * 500),
+                "sales_us": per_call(state.calculate_sales, [(project,)] * 2000),
+                "menus_us": per_call(menus, [(t,) for t, _ in pairs[:50]]),
+            }
+            sim_state = GameState()
+            start = time.perf_counter()
+            headless.simulate(sim_state, sim_weeks)
+            row["sim_weeks_per_s"] = sim_weeks / (time.perf_counter() - start)
+            results[f"{scale}x"] = {k: round(v, 2) for k, v in row.items()}
+    finally:
+        content.reset_content()
+
+    assert len(game_data.TOPICS) == 25, "Basisdaten nicht wiederhergestellt"
+    small, large = results[f"{scales[0]}x"], results[f"{scales[-1]}x"]
+    assert large["compat_us"] < small["compat_us"] * 5, "Kompatibilität wächst mit der Datenmenge"
+    return results
+
+
+# ============================================================
+# KONKURRENZ
+# ============================================================
+
+@benchmark("competitors")
+def bench_competitors(counts=(0, 40, 500), weeks=1000):
+    """Zusatzkosten pro Woche durch 0, 40 und 500 Konkurrenz-Studios."""
+    from competitors import CompetitorMarket
+    from logic import GameState
+    from models import GameProject, ReviewScore
+
+    results = {}
+    for count in counts:
+        random.seed(count)
+        state = GameState()
+        state.competitors = CompetitorMarket(count, seed=count, week=state.week)
+        state.money = 10 ** 9
+        game = GameProject("Test", "Fantasy", "RPG", platform="PC (Windows)")
+        game.review = ReviewScore([7, 7, 7, 7])
+        state.game_history.append(game)
+        factors = []
+        start = time.perf_counter()
+        for _ in range(weeks):
+            game.is_active = True
+            game.weeks_on_market = 0
+            state.advance_week()
+            factors.append(state.competitors.sales_factor("Fantasy", "RPG"))
+        per_week = (time.perf_counter() - start) / weeks
+        released = int(state.competitors.games_released.sum())
+        results[count] = {
+            "week_us": round(per_week * 1e6, 1),
+            "games_released": released,
+            "mean_share": round(sum(factors) / len(factors), 3),
+        }
+        if count:
+            assert released > count, "Konkurrenz veröffentlicht nichts"
+            assert min(factors) < 1.0, "Konkurrenz nimmt keine Marktanteile"
+
+    base = results[counts[0]]["week_us"]
+    for count in counts[1:]:
+        results[count]["added_us"] = round(results[count]["week_us"] - base, 1)
+    most = results[counts[-1]]
+    assert most["added_us"] < 1000, f"{counts[-1]} Studios kosten {most['added_us']} us pro Woche"
+    assert most["added_us"] < max(results[counts[1]]["added_us"], 1.0) * 3, "Kosten wachsen mit der Zahl der Studios"
+    return {f"{count}_studios": row for count, row in results.items()}
+
+
+@benchmark("charts")
+def bench_charts(studios=500, weeks=800):
+    """Top-K-Charts über 500 Studios gegen komplettes Sortieren aller Titel."""
+    import json
+
+    import numpy as np
+
+    from charts import Charts, RIVAL_PRICE
+    from competitors import CompetitorMarket
+
+    market = CompetitorMarket(studios, seed=11)
+    charts = Charts()
+    history = {}          # Titel-Schlüssel -> höchste Verkäufe (Referenz)
+    revenue = {}
+    step_time = chart_time = sort_time = 0.0
+    for _ in range(weeks):
+        start = time.perf_counter()
+        market.step()
+        step_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        charts.close_week(market)
+        chart_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        for i in np.flatnonzero(market.active).tolist():
+            key = (i, int(market.games_released[i]))
+            history[key] = max(history.get(key, 0), int(market.title_sales[i]))
+            revenue[key] = max(revenue.get(key, 0), int(market.title_sales[i] * RIVAL_PRICE))
+        expected = sorted(history.values(), reverse=True)[:charts.k]
+        weekly = sorted(market.weekly_sales[market.weekly_sales > 0].astype(int).tolist(), reverse=True)[:charts.k]
+        sort_time += time.perf_counter() - start
+
+        assert [value for *_, value in charts.top("sales")] == expected, f"Bestenliste falsch in Woche {market.week}"
+        assert [value for *_, value in charts.top("weekly")] == weekly, f"Wochen-Charts falsch in Woche {market.week}"
+
+    top_revenue = sorted(revenue.values(), reverse=True)[:charts.k]
+    assert [value for *_, value in charts.top("revenue")] == top_revenue, "Umsatz-Liste weicht ab"
+    restored = Charts.from_dict(json.loads(json.dumps(charts.to_dict())))
+    assert all(restored.top(m) == charts.top(m) for m in ("weekly", "sales", "revenue", "review")), "Laden verändert Charts"
+
+    chart_us = chart_time / weeks * 1e6
+    assert chart_us < 500, f"Charts kosten {chart_us:.0f} us pro Woche"
+    return {
+        "titles": len(history),
+        "market_week_us": round(step_time / weeks * 1e6, 1),
+        "charts_week_us": round(chart_us, 1),
+        "full_sort_week_us": round(sort_time / weeks * 1e6, 1),
+    }
+
+
+@benchmark("platform_market")
+def bench_platform_market(scales=(1, 100), seed=5, lookups=50000):
+    """Markt-Multiplikator pro Woche: vorberechnete Kurven gegen Suche in der Plattform-Liste."""
+    import content
+    import game_data
+    import procgen
+    from market import MAX_POINTS, PlatformMarket, install_curve
+    from logic import GameState
+    from models import GameProject, ReviewScore
+
+    def scan(name, week):
+        # alte Variante: Liste durchsuchen, Kurve bei jedem Aufruf berechnen
+        for p in game_data.PLATFORMS:
+            if p["name"] == name:
+                curve = install_curve(p["available_week"], p["end_week"])
+                step = -(-len(curve) // MAX_POINTS)
+                offset = min(max(week - p["available_week"], 0) // step * step, (len(curve) - 1) // step * step)
+                return curve[offset] * p["market_multi"]
+        return 1.0
+
+    results = {}
+    try:
+        for scale in scales:
+            content.install_tables(procgen.generate_content(scale, seed))
+            start = time.perf_counter()
+            market = PlatformMarket(game_data.PLATFORMS)
+            build_ms = (time.perf_counter() - start) * 1000
+            rng = random.Random(scale)
+            names = [p["name"] for p in game_data.PLATFORMS]
+            queries = [(rng.choice(names), rng.randint(-50, 5000)) for _ in range(lookups)]
+
+            for name, week in queries[:300]:
+                assert abs(market.multiplier(name, week) - scan(name, week)) < 1e-3, f"Kurve von {name} weicht ab"
+
+            # Woche 0 ist ein gültiger Start und wird nicht auf Woche 1 verschoben
+            early = PlatformMarket([{"name": "Früh", "available_week": 0, "end_week": 20}])
+            assert early.starts == [0], "Start in Woche 0 wird verschoben"
+            assert abs(early.multiplier("Früh", 7) - install_curve(0, 20)[7]) < 1e-3, "Kurve ab Woche 0 weicht ab"
+
+            start = time.perf_counter()
+            for name, week in queries:
+                market.multiplier(name, week)
+            lookup_us = (time.perf_counter() - start) / lookups * 1e6
+            start = time.perf_counter()
+            for name, week in queries[:500]:
+                scan(name, week)
+            scan_us = (time.perf_counter() - start) / 500 * 1e6
+
+            # Wöchentliche Verkaufsschleife mit vielen Spielen auf dem Markt
+            random.seed(scale)
+            state = GameState()
+            state.money = 10 ** 9
+            for i in range(200):
+                game = GameProject(f"Spiel {i}", game_data.TOPICS[0], game_data.GENRES[0], platform=rng.choice(names))
+                game.review = ReviewScore([8, 8, 8, 8])
+                state.game_history.append(game)
+            start = time.perf_counter()
+            for game in state.game_history:
+                for week in range(1, 101):
+                    state.week = week
+                    state.calculate_sales(game)
+            sales_us = (time.perf_counter() - start) / (len(state.game_history) * 100) * 1e6
+
+            results[f"{scale}x"] = {
+                "platforms": len(market),
+                "build_ms": round(build_ms, 2),
+                "lookup_us": round(lookup_us, 3),
+                "scan_us": round(scan_us, 2),
+                "sales_us": round(sales_us, 2),
+            }
+    finally:
+        content.reset_content()
+
+    small, large = results[f"{scales[0]}x"], results[f"{scales[-1]}x"]
+    assert large["lookup_us"] < max(small["lookup_us"], 0.1) * 3, "Nachschlagen wächst mit der Zahl der Plattformen"
+    assert large["sales_us"] < small["sales_us"] * 3, "Verkaufsberechnung wächst mit der Zahl der Plattformen"
+    curve = install_curve(100, 300)
+    assert curve[0] < curve.max() and curve[200] < curve.max() and curve[-1] < curve[200], "Lebenszyklus ohne Auf und Ab"
+    return results
+
+
+# ============================================================
+# PERSONAL
+# ============================================================
+
+@benchmark("candidate_pool")
+def bench_candidate_pool(pool_size=3000, queries=2000):
+    """Bewerber blockweise erzeugen und gefiltert abfragen gegen einzelne Employee-Objekte."""
+    import pygame
+    import game_data
+    from audio import NullAudioManager
+    from candidates import ANY_SPECIALIZATION, SALARY_LIMITS, CandidatePool
+    from logic import GameState
+    from menus import HireMenu
+    from models import Employee
+
+    random.seed(7)
+    start = time.perf_counter()
+    single = [
+        Employee(role_data=random.choice(game_data.EMPLOYEE_ROLES), skill_level=random.randint(1, 3))
+        for _ in range(pool_size)
+    ]
+    single_ms = (time.perf_counter() - start) * 1000
+
+    pool = CandidatePool(seed=7)
+    start = time.perf_counter()
+    pool.sync(1, pool_size, 3)
+    batch_ms = (time.perf_counter() - start) * 1000
+    assert len(pool) == pool_size, "Pool nicht aufgefüllt"
+
+    # Gleiche Verteilung wie Employee._generate_skills (mittleres Gehalt je Level)
+    for level in (1, 2, 3):
+        ref = [e.salary for e in single if e.skill_level == level]
+        got = pool.salary[pool.level == level]
+        assert abs(got.mean() - sum(ref) / len(ref)) < 60, f"Gehälter auf Level {level} weichen ab"
+
+    rng = random.Random(3)
+    filters = [
+        (rng.choice([None] + list(range(len(game_data.EMPLOYEE_ROLES)))), rng.randint(1, 3),
+         rng.choice([None, ANY_SPECIALIZATION, 0]), rng.choice(SALARY_LIMITS))
+        for _ in range(queries)
+    ]
+    for role, level, spec, salary in filters[:200]:
+        expected = [
+            i for i in range(len(pool))
+            if (role is None or pool.role[i] == role) and pool.level[i] >= level
+            and (spec is None or (pool.spec[i] >= 0 if spec == ANY_SPECIALIZATION else pool.spec[i] == spec))
+            and (salary is None or pool.salary[i] <= salary)
+        ]
+        assert sorted(pool.query(role, level, spec, salary)) == expected, "Filter liefert andere Bewerber"
+    pool._queries.clear()
+    start = time.perf_counter()
+    for role, level, spec, salary in filters:
+        pool._queries.clear()
+        pool.query(role, level, spec, salary)
+    query_us = (time.perf_counter() - start) / queries * 1e6
+
+    start = time.perf_counter()
+    for week in range(2, 202):
+        pool.sync(week, pool_size, 3)
+    week_us = (time.perf_counter() - start) / 200 * 1e6
+
+    # Menü mit dem größten Büro: Betreten, blättern, filtern
+    pygame.init()
+    state = GameState()
+    state.office_level = len(game_data.OFFICE_LEVELS) - 1
+    menu = HireMenu(NullAudioManager(), state)
+    key = lambda k: pygame.event.Event(pygame.KEYDOWN, key=k, unicode="", mod=0)
+    start = time.perf_counter()
+    menu.announce_entry()
+    for _ in range(20):
+        menu.handle_input(key(pygame.K_PAGEDOWN))
+    menu.handle_input(key(pygame.K_END))
+    for _ in range(6):
+        menu.handle_input(key(pygame.K_UP))
+    for _ in range(4):
+        menu.handle_input(key(pygame.K_RETURN))
+    menu_ms = (time.perf_counter() - start) * 1000
+    assert menu.role is not None, "Rollen-Filter nicht gewechselt"
+
+    assert batch_ms < single_ms, "Blockweise Erzeugung nicht schneller"
+    assert query_us < 200, f"Filter-Abfrage kostet {query_us:.0f} us"
+    return {
+        "candidates": pool_size,
+        "single_ms": round(single_ms, 2),
+        "batch_ms": round(batch_ms, 2),
+        "query_us": round(query_us, 1),
+        "weekly_refresh_us": round(week_us, 1),
+        "menu_ms": round(menu_ms, 2),
+        "menu_pool": len(state.candidates),
+    }
+
+
+@benchmark("phase_staffing")
+def bench_phase_staffing(sizes=(20, 1000), exact_trials=200):
+    """Optimale Phasen-Besetzung: exakt gegen Brute Force, 20 und 1000 Mitarbeiter auf Zeit."""
+    import itertools
+
+    import numpy as np
+
+    import game_data
+    from candidates import CandidatePool
+    from staffing import assign, phase_capacities, phase_values
+
+    phases = game_data.DEV_PHASES
+    rng = np.random.default_rng(4)
+    for _ in range(exact_trials):
+        n = int(rng.integers(1, 7))
+        values = rng.integers(0, 100, (n, len(phases))).astype(float)
+        caps = phase_capacities(n, phases)
+        best = max(
+            sum(values[i, p] for i, p in enumerate(combo))
+            for combo in itertools.product(range(len(phases)), repeat=n)
+            if all(combo.count(p) <= cap for p, cap in enumerate(caps))
+        )
+        result = assign(values, caps)
+        assert all(result.count(p) <= cap for p, cap in enumerate(caps)), "Kapazität überschritten"
+        assert abs(sum(values[i, p] for i, p in enumerate(result)) - best) < 1e-9, "Zuordnung nicht optimal"
+
+    results = {}
+    for size in sizes:
+        pool = CandidatePool(seed=size)
+        pool.sync(1, size, 5)
+        team = [pool.employee(i) for i in range(size)]
+        values = phase_values(team, phases)
+        caps = phase_capacities(size, phases)
+        start = time.perf_counter()
+        result = assign(values, caps)
+        solve_ms = (time.perf_counter() - start) * 1000
+        # Vergleich: jeder nimmt seine beste Phase, solange dort Platz ist
+        load = [0] * len(phases)
+        greedy = 0.0
+        for i in range(size):
+            for p in np.argsort(-values[i]).tolist():
+                if load[p] < caps[p]:
+                    load[p] += 1
+                    greedy += float(values[i, p])
+                    break
+        optimal = float(sum(values[i, p] for i, p in enumerate(result)))
+        assert optimal >= greedy - 1e-9, "Optimierer schlechter als gierige Verteilung"
+        results[f"{size}_employees"] = {
+            "solve_ms": round(solve_ms, 2),
+            "mean_value": round(optimal / size, 2),
+            "greedy_mean_value": round(greedy / size, 2),
+        }
+
+    assert results[f"{sizes[0]}_employees"]["solve_ms"] < 16, "20 Mitarbeiter nicht sofort verteilt"
+    assert results[f"{sizes[-1]}_employees"]["solve_ms"] < 500, "1000 Mitarbeiter zu langsam"
+    return results
+
+
+@benchmark("mega_studio")
+def bench_mega_studio(team_size=5000, weeks=52):
+    """Team-Werte über das Roster (NumPy) gegen Schleifen über Skill-Dicts, dazu HR-Menüs."""
+    import pygame
+    import game_data
+    from audio import NullAudioManager
+    from candidates import CandidatePool
+    from logic import GameState
+    from menus import EmployeeListMenu, FireMenu, TrainingEmployeeSelectMenu
+    from roster import Roster
+
+    sliders = game_data.SLIDER_NAMES
+    pool = CandidatePool(seed=49)
+    pool.sync(1, team_size, 5)
+    loose = [pool.employee(i) for i in range(team_size)]
+    copies = [pool.employee(i) for i in range(team_size)]
+    start = time.perf_counter()
+    roster = Roster(copies)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    # Wochen-Werte wie früher: Schleifen über Employee-Objekte
+    start = time.perf_counter()
+    for _ in range(weeks):
+        payroll = sum(e.salary for e in loose)
+        quality = sum(sum(e.skills.values()) / len(e.skills) / 1000.0 for e in loose)
+        sliders_ref = {s: sum(e.skills[s] for e in loose) / len(loose) / 100.0 for s in sliders}
+        for e in loose:
+            e.morale = max(0, min(100, e.morale + 5))
+            e.weeks_employed += 1
+    loop_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    for _ in range(weeks):
+        roster_payroll = roster.payroll()
+        roster_quality = roster.quality_bonus()
+        roster_sliders = roster.slider_bonus()
+        roster.adjust_morale(5)
+        roster.add_weeks(1)
+    array_ms = (time.perf_counter() - start) * 1000
+
+    assert roster_payroll == payroll, "Gehaltssumme weicht ab"
+    assert abs(roster_quality - quality) < 1e-6, "Team-Bonus weicht ab"
+    assert all(abs(roster_sliders[i] - sliders_ref[s]) < 1e-9 for i, s in enumerate(sliders)), "Slider-Bonus weicht ab"
+    assert [e.morale for e in roster] == [e.morale for e in loose], "Moral weicht ab"
+
+    # Training des ganzen Teams gegen die Einzel-Formel
+    start = time.perf_counter()
+    for e in loose:
+        e.skills[e.primary_skill] = min(100, e.skills[e.primary_skill] + 10)
+        e.skills[e.secondary_skill] = min(100, e.skills[e.secondary_skill] + 5)
+        e.salary = sum(e.skills.values()) * 5 + 500
+    train_loop_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    roster.train(slice(None), 10)
+    train_ms = (time.perf_counter() - start) * 1000
+    assert [e.skills for e in roster[:200]] == [e.skills for e in loose[:200]], "Training weicht ab"
+    assert roster.payroll() == sum(e.salary for e in loose), "Gehälter nach Training weichen ab"
+
+    # Einzelne Skills im Team ändern (wie beim früheren Dict)
+    member = roster[10]
+    before = member.skills[member.primary_skill]
+    member.skills[member.primary_skill] -= 1
+    assert roster.skills[10, roster.slider_ids[member.primary_skill]] == before - 1, "Skill-Änderung geht verloren"
+    member.skills[member.primary_skill] += 1
+
+    # Entlassen: Werte wandern zurück ans Objekt, die Zeilen rücken nach
+    gone = roster.pop(10)
+    assert gone.skills == loose[10].skills and gone.salary == loose[10].salary, "Entlassener verliert Werte"
+    assert roster[10] is copies[11] and roster[10].salary == loose[11].salary, "Roster-Zeilen verschoben"
+
+    # HR-Menüs mit dem ganzen Team: Betreten und blättern
+    pygame.init()
+    state = GameState()
+    state.office_level = len(game_data.OFFICE_LEVELS) - 1
+    state.employees = roster
+    key = lambda k: pygame.event.Event(pygame.KEYDOWN, key=k, unicode="", mod=0)
+    audio = NullAudioManager()
+    start = time.perf_counter()
+    for menu_class in (EmployeeListMenu, FireMenu, TrainingEmployeeSelectMenu):
+        menu = menu_class(audio, state)
+        menu.announce_entry()
+        for _ in range(20):
+            menu.handle_input(key(pygame.K_PAGEDOWN))
+        menu.handle_input(key(pygame.K_END))
+    menu_ms = (time.perf_counter() - start) * 1000
+
+    assert array_ms * 5 < loop_ms, "Roster nicht deutlich schneller als Schleifen"
+    assert menu_ms < 100, f"HR-Menüs brauchen {menu_ms:.0f} ms"
+    return {
+        "employees": team_size,
+        "roster_build_ms": round(build_ms, 2),
+        "loop_weeks_ms": round(loop_ms, 2),
+        "roster_weeks_ms": round(array_ms, 2),
+        "train_loop_ms": round(train_loop_ms, 2),
+        "train_roster_ms": round(train_ms, 3),
+        "hr_menus_ms": round(menu_ms, 2),
+    }
+
+
+# ============================================================
+# ENTWICKLUNG
+# ============================================================
+
+@benchmark("dev_pipeline")
+def bench_dev_pipeline(projects=50000, weeks=400, studio_weeks=200):
+    """Phasenwechsel per Kalender-Warteschlange gegen wöchentliches Durchsuchen; parallele Projekte im GameState."""
+    import pygame
+    import game_data
+    from audio import NullAudioManager
+    from game import Game
+    from logic import GameState
+    from models import GameProject
+    from pipeline import TIME_SCALES, DevPipeline, phase_weeks
+
+    rng = random.Random(50)
+    phases = game_data.DEV_PHASES
+    plans = [
+        (rng.randint(1, weeks - 30), phase_weeks(phases, rng.choice(game_data.GAME_SIZES)["time_multi"]))
+        for _ in range(projects)
+    ]
+    for size in game_data.GAME_SIZES:
+        expected = max(1, int(sum(p["duration_weeks"] for p in phases) * size["time_multi"]))
+        assert sum(phase_weeks(phases, size["time_multi"])) == expected, "Entwicklungsdauer geändert"
+
+    starts = {}
+    for i, (week, _) in enumerate(plans):
+        starts.setdefault(week, []).append(i)
+
+    # Referenz: jede Woche alle laufenden Projekte auf fällige Phasen prüfen
+    running = []
+    reference = []
+    scan_s = 0.0
+    for week in range(1, weeks + 1):
+        for i in starts.get(week, ()):
+            bounds, total = [], week
+            for length in plans[i][1]:
+                total += length
+                bounds.append(total)
+            running.append([i, 0, bounds])
+        start = time.perf_counter()
+        still = []
+        for entry in running:
+            i, phase, bounds = entry
+            while phase < len(bounds) and bounds[phase] <= week:
+                reference.append((week, i, phase))
+                phase += 1
+            entry[1] = phase
+            if phase < len(bounds):
+                still.append(entry)
+        running = still
+        scan_s += time.perf_counter() - start
+
+    pipeline = DevPipeline()
+    found = []
+    queue_s = 0.0
+    peak = 0
+    for week in range(1, weeks + 1):
+        for i in starts.get(week, ()):
+            pipeline.start(i, week, 1, plans[i][1])
+        peak = max(peak, len(pipeline))
+        start = time.perf_counter()
+        events = pipeline.advance(week)
+        queue_s += time.perf_counter() - start
+        found.extend((week, job.project, phase) for job, phase in events)
+    scan_ms, queue_ms = scan_s * 1000, queue_s * 1000
+    assert sorted(found) == sorted(reference), "Warteschlange liefert andere Phasenwechsel"
+    assert not pipeline, "Projekte nicht fertig geworden"
+
+    # Studio mit vielen Teams: Wochen laufen einzeln, fertige Spiele blockieren nichts
+    random.seed(50)
+    state = GameState()
+    state.money = 10 ** 9
+    state.office_level = 5
+    state.hire_candidates(state.candidate_pool().query()[:60])
+    parallel = state.max_parallel_projects()
+    started = 0
+    start = time.perf_counter()
+
+    def fill_pipeline():
+        nonlocal started
+        while state.can_start_project():
+            project = GameProject(
+                f"Projekt {started}", rng.choice(game_data.TOPICS), rng.choice(game_data.GENRES),
+                sliders={s: 3 for s in game_data.SLIDER_NAMES}, platform="PC",
+                engine=state.engines[0], size=rng.choice(game_data.GAME_SIZES)["name"],
+            )
+            estimate = state.calculate_dev_cost(project, team=state.next_project_team())
+            assert state.start_project(project) is not None, "Freies Team nicht genutzt"
+            assert project.dev_cost == estimate, "Angesagte Kosten weichen von den berechneten ab"
+            started += 1
+
+    for _ in range(studio_weeks):
+        fill_pipeline()
+        week = state.week
+        state.advance_week()
+        assert state.week == week + 1, "Kalender springt"
+    studio_ms = (time.perf_counter() - start) * 1000
+    assert state.games_made == started - len(state.pipeline), "Spiele gehen verloren"
+    assert state.games_made > studio_weeks // 9 * parallel // 2, "Projekte laufen nicht parallel"
+
+    # Echtzeit-Uhr: Turbo, 40 Wochen simulierte Zeit
+    pygame.init()
+    state.settings["time_scale"] = "turbo"
+    game = Game(NullAudioManager(), state)
+    game.current_key = "game_menu"
+    now = 1000.0
+    game.run_clock(now)
+    week = state.week
+    for _ in range(40):
+        fill_pipeline()
+        now += TIME_SCALES["turbo"]
+        game.run_clock(now)
+    assert state.week - week == 40, "Spielwochen laufen nicht im eingestellten Tempo"
+
+    # In Einstellungen und beim Speichern steht die Uhr
+    from game import PAUSED_MENUS
+    for key in ("settings_menu_ingame", "save_menu"):
+        assert key in PAUSED_MENUS, f"{key} hält die Spielzeit nicht an"
+        game.current_key = key
+        week = state.week
+        for _ in range(10):
+            now += TIME_SCALES["turbo"]
+            game.run_clock(now)
+        assert state.week == week, f"Spielzeit läuft in {key} weiter"
+    game.current_key = "game_menu"
+
+    # Projektübersicht: Zeilen werden beim Öffnen gebaut und nach Wochenwechseln erneuert
+    from menus import DevProgressMenu
+    progress = DevProgressMenu(game.audio, state)
+    progress.announce_entry()
+    assert progress.item_count() == len(state.pipeline) + len(state.unread_reviews)
+    texts = [progress.item_text(i) for i in range(progress.item_count())]
+    assert all(texts), "Leere Projektzeile"
+    state.advance_week()
+    progress.update()
+    assert [row[1] for row in progress.rows if row[0] == 'job'] == list(state.pipeline), "Projektzeilen veraltet"
+
+    assert queue_ms < scan_ms, "Warteschlange nicht schneller als wöchentliches Durchsuchen"
+    assert queue_ms / weeks < 1.0, f"Phasenwechsel kosten {queue_ms / weeks:.2f} ms pro Woche"
+    return {
+        "projects": projects,
+        "peak_parallel": peak,
+        "phase_events": len(found),
+        "scan_ms": round(scan_ms, 2),
+        "queue_ms": round(queue_ms, 2),
+        "parallel_projects": parallel,
+        "studio_games": state.games_made,
+        "studio_week_us": round(studio_ms / studio_weeks * 1000, 1),
+    }
+
+
+# ============================================================
+# START
+# ============================================================
+
+@benchmark("startup")
+def bench_startup(runs=3):
+    """Startet main.py als eigenen Prozess und prüft das Startbudget."""
+    import json
+    import subprocess
+    import tempfile
+    from startup import STARTUP_BUDGET
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    best = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        log = os.path.join(tmp, "startup_profile.log")
+        for _ in range(runs):
+            subprocess.run(
+                [sys.executable, os.path.join(here, "main.py"), "--profile-startup", log, "--startup-only"],
+                cwd=here, env=dict(os.environ), check=True,
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            )
+            with open(log, "r", encoding="utf-8") as f:
+                summary = json.loads(f.read().rsplit("SUMMARY ", 1)[1])
+            for name, at in summary["marks"].items():
+                best[name] = min(at, best.get(name, at))
+
+    for name, limit in STARTUP_BUDGET.items():
+        assert name in best, f"Marke {name} fehlt im Profil"
+        assert best[name] <= limit, f"{name} nach {best[name]:.3f}s (Budget {limit:.3f}s)"
+    return best
+
+
+# ============================================================
+# AUSFÜHRUNG
+# ============================================================
+
+def main(argv=None):
+    names = (argv if argv is not None else sys.argv[1:]) or list(BENCHMARKS)
+    failed = False
+    for name in names:
+        func = BENCHMARKS.get(name)
+        if func is None:
+            print(f"[BENCHMARK] Unbekanntes Szenario: {name}")
+            failed = True
+            continue
+        start = time.perf_counter()
+        try:
+            result = func()
+        except AssertionError as e:
+            print(f"[BENCHMARK] {name}: FEHLGESCHLAGEN - {e}")
+            failed = True
+            continue
+        elapsed = time.perf_counter() - start
+        print(f"[BENCHMARK] {name} ({elapsed:.2f}s): {result}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+"""
+Bewerber-Markt für Audio Studio Tycoon - Audio Edition.
+
+Statt bei jedem Öffnen des Einstellungs-Menüs einzelne Bewerber per
+random.choice zu würfeln, gibt es einen dauerhaften Pool. Bewerber
+werden blockweise erzeugt (alle Skills eines Blocks in wenigen
+NumPy-Aufrufen) und liegen spaltenweise in Arrays. Alle REFRESH_WEEKS
+Wochen verlässt ein Teil der Bewerber den Markt und neue kommen nach;
+verpasste Termine werden beim nächsten Zugriff in einem Schritt
+nachgeholt.
+
+Filter (Rolle, Mindest-Level, Spezialisierung, Höchstgehalt) laufen
+über einen vorsortierten Index je Rolle; ein Employee-Objekt entsteht
+erst beim Einstellen.
+"""
+
+from itertools import compress
+
+import numpy as np
+
+import game_data
+from models import Employee
+
+# Bewerber im Pool pro Arbeitsplatz im Büro (mindestens MIN_POOL, höchstens MAX_POOL)
+CANDIDATES_PER_SLOT = 15
+MIN_POOL = 12
+MAX_POOL = 3000
+# Alle REFRESH_WEEKS Wochen verlässt TURNOVER des Pools den Markt
+REFRESH_WEEKS = 1
+TURNOVER = 0.15
+# Anteil der Bewerber mit Spezialisierung
+SPECIALIZATION_CHANCE = 0.3
+# Stufen des Gehaltsfilters (None = unbegrenzt)
+SALARY_LIMITS = [None, 1000, 1250, 1500, 2000, 2500]
+# Spezialisierungsfilter: None = alle Bewerber, ANY_SPECIALIZATION = nur mit Spezialisierung
+ANY_SPECIALIZATION = -1
+
+_COLUMNS = ("role", "level", "spec", "skills", "salary")
+
+
+class CandidatePool:
+    """Alle Bewerber am Arbeitsmarkt; ein Array-Eintrag pro Bewerber."""
+
+    def __init__(self, seed=None, week=1):
+        self.rng = np.random.default_rng(seed)
+        self.week = week                   # letzter Wechsel-Termin
+        self.names = []
+        self.role = np.zeros(0, dtype=np.int32)
+        self.level = np.zeros(0, dtype=np.int32)
+        self.spec = np.zeros(0, dtype=np.int32)       # -1 = keine
+        self.skills = np.zeros((0, len(game_data.SLIDER_NAMES)), dtype=np.int32)
+        self.salary = np.zeros(0, dtype=np.int64)
+        self._reindex()
+
+    def __len__(self):
+        return len(self.names)
+
+    # ---------- Pool pflegen ----------
+
+    def sync(self, week, size, max_level):
+        """Holt fällige Wechsel bis week nach und füllt den Pool auf size auf."""
+        periods = (week - self.week) // REFRESH_WEEKS
+        if periods > 0:
+            self.week += periods * REFRESH_WEEKS
+            stay = (1.0 - TURNOVER) ** periods
+            self._keep(self.rng.random(len(self)) < stay)
+        if len(self) < size:
+            self._add(size - len(self), max_level)
+
+    def refresh(self, size, max_level):
+        """Ersetzt den kompletten Pool durch neue Bewerber."""
+        self._keep(np.zeros(len(self), dtype=bool))
+        self._add(size, max_level)
+
+    def generate(self, count, max_level):
+        """Erzeugt count Bewerber als Spalten (role, level, spec, skills, salary, names)."""
+        rng = self.rng
+        roles = game_data.EMPLOYEE_ROLES
+        sliders = game_data.SLIDER_NAMES
+        slider_ids = {name: i for i, name in enumerate(sliders)}
+        primary = np.array([slider_ids.get(r["primary"], 0) for r in roles])
+        secondary = np.array([slider_ids.get(r["secondary"], 0) for r in roles])
+
+        role = rng.integers(0, len(roles), count).astype(np.int32)
+        level = rng.integers(1, max(1, max_level) + 1, count).astype(np.int32)
+        spec = np.where(
+            rng.random(count) < SPECIALIZATION_CHANCE,
+            rng.integers(0, len(game_data.EMPLOYEE_SPECIALIZATIONS), count), -1,
+        ).astype(np.int32)
+
+        # Wie Employee._generate_skills, nur für alle Bewerber auf einmal
+        base = level * 10 + rng.integers(5, 16, count)
+        skills = np.maximum(5, base[:, None] - rng.integers(5, 21, (count, len(sliders))))
+        rows = np.arange(count)
+        skills[rows, secondary[role]] = np.minimum(100, base + rng.integers(0, 11, count))
+        skills[rows, primary[role]] = np.minimum(100, base + rng.integers(10, 26, count))
+        skills = skills.astype(np.int32)
+        salary = skills.sum(axis=1).astype(np.int64) * 5 + 500
+
+        first = rng.integers(0, len(game_data.EMPLOYEE_FIRST_NAMES), count).tolist()
+        last = rng.integers(0, len(game_data.EMPLOYEE_LAST_NAMES), count).tolist()
+        names = [
+            f"{game_data.EMPLOYEE_FIRST_NAMES[f]} {game_data.EMPLOYEE_LAST_NAMES[l]}"
+            for f, l in zip(first, last)
+        ]
+        return (role, level, spec, skills, salary), names
+
+    def _add(self, count, max_level):
+        columns, names = self.generate(count, max_level)
+        for name, values in zip(_COLUMNS, columns):
+            setattr(self, name, np.concatenate([getattr(self, name), values]))
+        self.names.extend(names)
+        self._reindex()
+
+    def _keep(self, mask):
+        for name in _COLUMNS:
+            setattr(self, name, getattr(self, name)[mask])
+        self.names = list(compress(self.names, mask.tolist()))
+        self._reindex()
+
+    def _reindex(self):
+        # Beste zuerst: Level absteigend, bei gleichem Level das niedrigere Gehalt
+        self.order = np.lexsort((self.salary, -self.level))
+        ordered_roles = self.role[self.order]
+        self.by_role = {r: self.order[ordered_roles == r] for r in range(len(game_data.EMPLOYEE_ROLES))}
+        self._queries = {}
+
+    # ---------- Abfragen ----------
+
+    def query(self, role=None, min_level=1, specialization=None, max_salary=None):
+        """
+        Indizes passender Bewerber, beste zuerst.
+        role: Index in EMPLOYEE_ROLES; specialization: Index in
+        EMPLOYEE_SPECIALIZATIONS oder ANY_SPECIALIZATION.
+        """
+        key = (role, min_level, specialization, max_salary)
+        cached = self._queries.get(key)
+        if cached is not None:
+            return cached
+        found = self.order if role is None else self.by_role.get(role, self.order[:0])
+        mask = self.level[found] >= min_level
+        if specialization == ANY_SPECIALIZATION:
+            mask &= self.spec[found] >= 0
+        elif specialization is not None:
+            mask &= self.spec[found] == specialization
+        if max_salary is not None:
+            mask &= self.salary[found] <= max_salary
+        result = found[mask].tolist()
+        self._queries[key] = result
+        return result
+
+    def describe(self, index):
+        """(Name, Rolle, Level, Gehalt, Spezialisierung oder None) ohne Employee-Objekt."""
+        spec = int(self.spec[index])
+        return (
+            self.names[index],
+            game_data.EMPLOYEE_ROLES[int(self.role[index])]["role"],
+            int(self.level[index]),
+            int(self.salary[index]),
+            game_data.EMPLOYEE_SPECIALIZATIONS[spec] if spec >= 0 else None,
+        )
+
+    def employee(self, index):
+        """Baut den Mitarbeiter zu einem Bewerber (der Pool bleibt unverändert)."""
+        name, _, level, _, spec = self.describe(index)
+        skills = dict(zip(game_data.SLIDER_NAMES, self.skills[index].tolist()))
+        return Employee(
+            name=name, role_data=game_data.EMPLOYEE_ROLES[int(self.role[index])],
+            skill_level=level, specialization=spec, skills=skills,
+        )
+
+    def remove(self, index):
+        """Nimmt einen oder mehrere Bewerber (Liste) vom Markt, z.B. nach dem Einstellen."""
+        mask = np.ones(len(self), dtype=bool)
+        mask[index] = False
+        self._keep(mask)
+
+    # ---------- Speichern / Laden ----------
+
+    def to_dict(self):
+        roles = game_data.EMPLOYEE_ROLES
+        specs = game_data.EMPLOYEE_SPECIALIZATIONS
+        return {
+            "week": self.week,
+            "names": self.names,
+            "role": [roles[i]["role"] for i in self.role.tolist()],
+            "level": self.level.tolist(),
+            "spec": [specs[i]["name"] if i >= 0 else None for i in self.spec.tolist()],
+            "skills": self.skills.tolist(),
+            "rng": self.rng.bit_generator.state,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        pool = cls(week=data["week"])
+        role_ids = {r["role"]: i for i, r in enumerate(game_data.EMPLOYEE_ROLES)}
+        spec_ids = {s["name"]: i for i, s in enumerate(game_data.EMPLOYEE_SPECIALIZATIONS)}
+        pool.names = list(data["names"])
+        pool.role = np.array([role_ids.get(r, 0) for r in data["role"]], dtype=np.int32)
+        pool.level = np.array(data["level"], dtype=np.int32)
+        pool.spec = np.array([spec_ids.get(s, -1) for s in data["spec"]], dtype=np.int32)
+        pool.skills = np.array(data["skills"], dtype=np.int32).reshape(len(pool.names), len(game_data.SLIDER_NAMES))
+        pool.salary = pool.skills.sum(axis=1).astype(np.int64) * 5 + 500
+        pool.rng.bit_generator.state = data["rng"]
+        pool._reindex()
+        return pool
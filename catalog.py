@@ -0,0 +1,155 @@
+"""
+Übersetzungs-Katalog für Audio Studio Tycoon - Audio Edition.
+
+Ein Sprachpaket (siehe translations.py) wird beim ersten Gebrauch
+geladen und einmal kompiliert:
+- Texte mit Platzhaltern werden geprüft und als fertige Formatierer abgelegt
+- Texte ohne Platzhalter liegen fertig in einem eigenen Dict
+- Fehlende Schlüssel werden nur einmal gemeldet
+
+Im Speicher bleibt nur die aktive Sprache; die Referenzsprache wird
+erst nachgeladen, wenn der aktiven ein Schlüssel fehlt. Ein
+Sprachwechsel tauscht nur die Referenz auf den Katalog.
+validate_packs() prüft alle Pakete gegen die Referenzsprache
+(Schlüssel und Platzhalter).
+"""
+
+from string import Formatter
+
+from translations import available_languages, load_pack, report_once
+
+REFERENCE_LANGUAGE = "de"
+
+
+def compile_template(text):
+    """
+    Prüft eine Vorlage und liefert (Platzhalter-Namen, Formatierer).
+    Reiner Text ohne Platzhalter liefert (leere Menge, None). Der
+    Formatierer ist die gebundene format_map-Methode des Textes, die
+    Vorlage muss also pro Aufruf nicht mehr nachgeschlagen werden.
+    """
+    fields = set()
+    for _, field, spec, _ in Formatter().parse(text):
+        if field is not None:
+            if field == "" or field.isdigit():
+                raise ValueError("nur benannte Platzhalter erlaubt")
+            fields.add(field.split(".")[0].split("[")[0])
+            if spec and "{" in spec:
+                raise ValueError("verschachtelte Format-Angaben werden nicht unterstützt")
+    if not fields:
+        return fields, None
+    return fields, text.format_map
+
+
+class Catalog:
+    """Kompilierte Texte einer Sprache (fehlende Schlüssel aus der Referenzsprache)."""
+
+    def __init__(self, language, table, fallback_language=None):
+        self.language = language
+        self.requested_language = language   # angeforderter Code (unbekannte Sprache -> Referenz)
+        self.fallback_language = fallback_language
+        self._fallback = None
+        self.plain = {}         # Schlüssel -> Text ohne Platzhalter (oder Rohtext)
+        self.formatters = {}    # Schlüssel -> Formatierer(dict)
+        self.fields = {}        # Schlüssel -> Platzhalter-Namen
+        for key, text in table.items():
+            try:
+                fields, formatter = compile_template(text)
+            except ValueError as e:
+                report_once(f"{language}.{key}: ungültige Vorlage ({e})")
+                fields, formatter = set(), None
+            self.plain[key] = text
+            self.fields[key] = fields
+            if formatter:
+                self.formatters[key] = formatter
+
+    @property
+    def fallback(self):
+        """Katalog der Referenzsprache, erst bei Bedarf geladen."""
+        if self._fallback is None and self.fallback_language:
+            table = load_pack(self.fallback_language)
+            if table is not None:
+                self._fallback = Catalog(self.fallback_language, table)
+            self.fallback_language = None if table is None else self.fallback_language
+        return self._fallback
+
+    def __contains__(self, key):
+        return key in self.plain
+
+    def text(self, key, kwargs=None):
+        """Übersetzter Text; bei Formatfehlern der Rohtext, bei fehlendem Schlüssel der Schlüssel."""
+        if not kwargs:
+            text = self.plain.get(key)
+            if text is not None:
+                return text
+        else:
+            formatter = self.formatters.get(key)
+            if formatter is not None:
+                try:
+                    return formatter(kwargs)
+                except (KeyError, ValueError, TypeError):
+                    report_once(f"{self.language}.{key}: Argumente passen nicht ({', '.join(sorted(kwargs))})")
+                    return self.plain[key]
+            text = self.plain.get(key)
+            if text is not None:
+                return text
+
+        if self.fallback is not None and key in self.fallback:
+            report_once(f"{self.language}.{key} fehlt, verwende {self.fallback.language}")
+            return self.fallback.text(key, kwargs)
+        report_once(f"Schlüssel '{key}' fehlt")
+        return key
+
+    def validate(self, reference):
+        """Meldet fehlende Schlüssel und abweichende Platzhalter gegenüber der Referenz."""
+        problems = []
+        for key, fields in reference.fields.items():
+            if key not in self.fields:
+                problems.append(f"{self.language}.{key} fehlt")
+            elif self.fields[key] != fields:
+                problems.append(
+                    f"{self.language}.{key}: Platzhalter {sorted(self.fields[key])} "
+                    f"statt {sorted(fields)}"
+                )
+        return problems
+
+
+_active = None
+
+
+def get_catalog(language):
+    """
+    Katalog einer Sprache. Nur der zuletzt angeforderte bleibt geladen;
+    unbekannte Sprachen fallen auf die Referenzsprache zurück.
+    """
+    global _active
+    if _active is not None and language in (_active.language, _active.requested_language):
+        return _active
+    table = load_pack(language)
+    if table is None and language != REFERENCE_LANGUAGE:
+        report_once(f"Sprachpaket '{language}' fehlt, verwende {REFERENCE_LANGUAGE}")
+        catalog = get_catalog(REFERENCE_LANGUAGE)
+        # Unter dem angeforderten Code merken, sonst lädt jede Abfrage das Paket erneut
+        catalog.requested_language = language
+        return catalog
+    fallback = None if language == REFERENCE_LANGUAGE else REFERENCE_LANGUAGE
+    _active = Catalog(language, table or {}, fallback_language=fallback)
+    return _active
+
+
+def validate_packs(reference=REFERENCE_LANGUAGE):
+    """Prüft alle Sprachpakete gegen die Referenz; liefert eine Liste von Problemen."""
+    base_table = load_pack(reference)
+    if base_table is None:
+        return [f"Referenz-Sprachpaket '{reference}' fehlt"]
+    base = Catalog(reference, base_table)
+    problems = []
+    for language in available_languages():
+        if language == reference:
+            continue
+        table = load_pack(language)
+        if table is None:
+            problems.append(f"{language}: nicht lesbar")
+            continue
+        problems.extend(Catalog(language, table).validate(base))
+    return problems
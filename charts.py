@@ -0,0 +1,170 @@
+"""
+Verkaufs-Charts für Audio Studio Tycoon - Audio Edition.
+
+Wochen-Charts (Verkäufe der letzten Woche) und ewige Bestenlisten
+(Gesamtverkäufe, Umsatz, Bewertung) für Spiele des Spielers und der
+Konkurrenz gemeinsam. Nichts wird komplett sortiert:
+- Bestenlisten sind Min-Heaps der Größe K; ein Titel kommt nur hinein,
+  wenn er den schwächsten Eintrag schlägt. Steigt der Wert eines Titels,
+  der schon drin ist, wird ein neuer Heap-Eintrag angelegt und der alte
+  beim nächsten Blick auf die Heap-Spitze verworfen ("lazy deletion").
+- Von der Konkurrenz werden pro Woche nur die Studios angesehen, deren
+  Werte die aktuelle Schwelle überschreiten (NumPy-Maske).
+- Die Wochen-Charts entstehen per heapq.nlargest aus den K besten
+  Konkurrenz-Titeln (argpartition) und den Spielen des Spielers.
+"""
+
+import heapq
+
+import numpy as np
+
+# Einträge pro Liste
+CHART_SIZE = 10
+# Durchschnittspreis eines Konkurrenz-Spiels (für den Umsatz)
+RIVAL_PRICE = 30
+METRICS = ("sales", "revenue", "review")
+
+
+class TopK:
+    """Die K größten Werte je Schlüssel (Werte eines Schlüssels steigen nur)."""
+
+    def __init__(self, k=CHART_SIZE):
+        self.k = k
+        self.heap = []       # (Wert, Schlüssel), evtl. mit veralteten Einträgen
+        self.values = {}     # Schlüssel -> aktueller Wert (nur Mitglieder)
+        self.labels = {}     # Schlüssel -> (Titel, Studio)
+
+    def __len__(self):
+        return len(self.values)
+
+    def _prune(self):
+        heap, values = self.heap, self.values
+        while heap and values.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+
+    def threshold(self):
+        """Wert, den ein neuer Titel übertreffen muss (None, solange die Liste nicht voll ist)."""
+        if len(self.values) < self.k:
+            return None
+        self._prune()
+        return self.heap[0][0]
+
+    def offer(self, key, value, label):
+        """Meldet einen (neuen oder gestiegenen) Wert; True, wenn der Titel in der Liste ist."""
+        values = self.values
+        current = values.get(key)
+        if current is not None:
+            if value > current:
+                values[key] = value
+                heapq.heappush(self.heap, (value, key))
+                if len(self.heap) > 4 * self.k:
+                    self.heap = [(v, k) for k, v in values.items()]
+                    heapq.heapify(self.heap)
+            return True
+        if len(values) >= self.k:
+            self._prune()
+            lowest, lowest_key = self.heap[0]
+            if value <= lowest:
+                return False
+            heapq.heappop(self.heap)
+            del values[lowest_key]
+            del self.labels[lowest_key]
+        values[key] = value
+        self.labels[key] = label
+        heapq.heappush(self.heap, (value, key))
+        return True
+
+    def top(self):
+        """[(Titel, Studio, Wert)], bester zuerst."""
+        ranked = sorted(self.values.items(), key=lambda item: item[1], reverse=True)
+        return [(*self.labels[key], value) for key, value in ranked]
+
+    def to_list(self):
+        return [[key, value, *self.labels[key]] for key, value in self.values.items()]
+
+    def load(self, rows):
+        for key, value, title, studio in rows:
+            self.offer(key, value, (title, studio))
+
+
+class Charts:
+    """Wochen-Charts und ewige Bestenlisten aller Titel."""
+
+    def __init__(self, k=CHART_SIZE):
+        self.k = k
+        self.all_time = {metric: TopK(k) for metric in METRICS}
+        self.weekly = []         # [(Titel, Studio, Verkäufe)] der letzten Woche
+        self.week = 0
+        self._pending = []       # Spieler-Verkäufe der laufenden Woche
+
+    # ---------- Spieler ----------
+
+    def record_game(self, index, game, studio, week_sales):
+        """Meldet Wochenverkäufe und Gesamtwerte eines Spieler-Spiels."""
+        key = f"p{index}"
+        label = (game.name, studio)
+        if week_sales > 0:
+            self._pending.append((week_sales, key, label))
+        self.all_time["sales"].offer(key, game.sales, label)
+        self.all_time["revenue"].offer(key, game.revenue, label)
+        if game.review:
+            self.all_time["review"].offer(key, round(game.review.average, 2), label)
+
+    # ---------- Konkurrenz & Wochenabschluss ----------
+
+    def close_week(self, market):
+        """Übernimmt die Woche des Konkurrenz-Markts und baut die Wochen-Charts."""
+        self.week = market.week
+        numbers = market.games_released
+        for metric, values in (
+            ("sales", market.title_sales),
+            ("revenue", market.title_sales * RIVAL_PRICE),
+            ("review", market.quality),
+        ):
+            chart = self.all_time[metric]
+            limit = chart.threshold()
+            mask = market.active if limit is None else market.active & (values > limit)
+            candidates = np.flatnonzero(mask)
+            for i, value in zip(candidates.tolist(), values[candidates].tolist()):
+                value = round(value, 2) if metric == "review" else int(value)
+                chart.offer(f"r{i}:{numbers[i]}", value, (market.titles[i], market.names[i]))
+
+        weekly = market.weekly_sales
+        if weekly.size > self.k:
+            best = np.argpartition(weekly, -self.k)[-self.k:]
+        else:
+            best = np.arange(weekly.size)
+        entries = [
+            (int(weekly[i]), f"r{i}", (market.titles[i], market.names[i]))
+            for i in best.tolist() if weekly[i] > 0
+        ]
+        entries.extend(self._pending)
+        self._pending = []
+        self.weekly = [(*label, sales) for sales, _, label in heapq.nlargest(self.k, entries)]
+
+    # ---------- Abfragen ----------
+
+    def top(self, metric):
+        """metric: 'weekly' oder einer aus METRICS."""
+        if metric == "weekly":
+            return list(self.weekly)
+        return self.all_time[metric].top()
+
+    # ---------- Speichern / Laden ----------
+
+    def to_dict(self):
+        return {
+            "week": self.week,
+            "weekly": [list(entry) for entry in self.weekly],
+            "all_time": {metric: chart.to_list() for metric, chart in self.all_time.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data, k=CHART_SIZE):
+        charts = cls(k)
+        charts.week = data.get("week", 0)
+        charts.weekly = [tuple(entry) for entry in data.get("weekly", [])]
+        for metric, rows in data.get("all_time", {}).items():
+            if metric in charts.all_time:
+                charts.all_time[metric].load(rows)
+        return charts
@@ -0,0 +1,211 @@
+"""
+Konkurrenz-Studios für Audio Studio Tycoon - Audio Edition.
+
+Dutzende bis hunderte KI-Studios entwickeln Spiele, folgen dem aktuellen
+Markttrend und nehmen den Spielen des Spielers Marktanteile ab. Alle
+Studios liegen spaltenweise in NumPy-Arrays (ein Eintrag pro Studio),
+eine Woche ist damit eine Handvoll Array-Operationen - unabhängig davon,
+wie viele Studios es gibt.
+
+Jedes Studio hat höchstens ein Spiel gleichzeitig auf dem Markt. Die
+wöchentlichen Verkäufe aller Konkurrenz-Spiele werden je Genre und Thema
+summiert; daraus ergibt sich der Marktanteil-Faktor für die Spiele des
+Spielers (sales_factor).
+"""
+
+import numpy as np
+
+import game_data
+
+# Anzahl der Konkurrenz-Studios in einem neuen Spiel
+COMPETITOR_COUNT = 40
+# Entwicklungszeit eines Konkurrenz-Spiels in Wochen (von, bis)
+DEV_WEEKS = (6, 20)
+# Verkäufe in der Startwoche bei Qualität 10
+BASE_LAUNCH_SALES = 6000
+# Ab dieser Konkurrenz-Nachfrage pro Woche halbieren sich die Verkäufe des Spielers
+MARKET_SIZE = 60000
+# Untergrenze des Marktanteil-Faktors
+MIN_SHARE = 0.3
+
+NAME_PREFIXES = [
+    "Pixel", "Byte", "Nova", "Retro", "Quantum", "Blue", "Iron", "Silver",
+    "Lunar", "Turbo", "Red", "Polar", "Neon", "Golden", "Hyper", "Cosmic",
+]
+NAME_SUFFIXES = ["Games", "Studios", "Interactive", "Soft", "Works", "Entertainment", "Labs"]
+TITLE_WORDS = [
+    "Legends", "Chronicles", "Tycoon", "Rush", "Saga", "Quest",
+    "Arena", "Story", "Simulator", "Heroes", "Origins", "Unleashed",
+]
+
+
+def studio_names(count):
+    """Eindeutige Studio-Namen (ab der ersten Wiederholung durchnummeriert)."""
+    names = []
+    combos = len(NAME_PREFIXES) * len(NAME_SUFFIXES)
+    for i in range(count):
+        prefix = NAME_PREFIXES[i % len(NAME_PREFIXES)]
+        suffix = NAME_SUFFIXES[(i // len(NAME_PREFIXES)) % len(NAME_SUFFIXES)]
+        name = f"{prefix} {suffix}"
+        names.append(name if i < combos else f"{name} {i // combos + 1}")
+    return names
+
+
+class CompetitorMarket:
+    """Alle Konkurrenz-Studios; ein Array-Eintrag pro Studio."""
+
+    def __init__(self, count=COMPETITOR_COUNT, seed=None, week=1):
+        rng = self.rng = np.random.default_rng(seed)
+        self.week = week
+        self.names = studio_names(count)
+        self.titles = [""] * count                       # aktuelles/letztes Spiel
+        self.skill = rng.uniform(3.0, 7.5, count)        # Grundqualität 1-10
+        self.trend_chase = rng.uniform(0.1, 0.9, count)  # Neigung, dem Trend zu folgen
+        self.dev_left = rng.integers(1, DEV_WEEKS[1], count)
+        self.topic = np.zeros(count, dtype=np.int32)
+        self.genre = np.zeros(count, dtype=np.int32)
+        self.quality = np.zeros(count)
+        self.launch_sales = np.zeros(count)
+        self.weeks_on_market = np.zeros(count, dtype=np.int32)
+        self.active = np.zeros(count, dtype=bool)
+        self.weekly_sales = np.zeros(count)
+        self.title_sales = np.zeros(count)               # Gesamtverkäufe des aktuellen Spiels
+        self.games_released = np.zeros(count, dtype=np.int32)
+        self.released = np.zeros(0, dtype=np.intp)       # Studios mit Release in der letzten Woche
+        self._topic_pressure = []
+        self._genre_pressure = []
+        self._update_pressure()
+
+    def __len__(self):
+        return len(self.names)
+
+    # ---------- Woche ----------
+
+    def advance_to(self, week, trend=None):
+        """Simuliert alle Wochen bis einschließlich week."""
+        while self.week < week:
+            self.step(trend)
+
+    def step(self, trend=None):
+        """Eine Woche für alle Studios: Releases, Verkäufe, Rückzug vom Markt."""
+        self.week += 1
+        rng = self.rng
+        compat = game_data.COMPAT
+
+        self.weeks_on_market += self.active
+        self.dev_left -= 1
+        release = np.flatnonzero(self.dev_left <= 0)
+        self.released = release
+        if release.size:
+            self._release(release, rng, compat, trend or {})
+
+        sales = self.launch_sales / (1.0 + self.weeks_on_market * 0.2)
+        sales[~self.active] = 0.0
+        self.weekly_sales = sales
+        self.title_sales += sales
+        self.active &= (self.weeks_on_market <= 20) & (sales >= 100)
+        self._update_pressure()
+
+    def _release(self, release, rng, compat, trend):
+        k = release.size
+        # Alle Zufallszahlen der Releases in einem Aufruf (je Zeile eine Verwendung)
+        u = rng.random((8, k))
+        topics = (u[0] * len(compat.topics)).astype(np.int32)
+        genres = (u[1] * len(compat.genres)).astype(np.int32)
+        trend_topic = compat.topic_ids.get(trend.get("topic"), -1)
+        trend_genre = compat.genre_ids.get(trend.get("genre"), -1)
+        chase = u[2] < self.trend_chase[release]
+        if trend_topic >= 0:
+            topics[chase] = trend_topic
+        if trend_genre >= 0:
+            genres[chase] = trend_genre
+
+        # Summe dreier Gleichverteilungen: annähernd normalverteilt (Streuung ~1)
+        noise = (u[3] + u[4] + u[5] - 1.5) * 2.0
+        trend_hits = (topics == trend_topic).astype(float) + (genres == trend_genre)
+        skill = self.skill[release]
+        quality = np.clip(skill + compat.matrix[topics, genres] * 0.8 + trend_hits * 0.7 + noise - 1.2, 1.0, 10.0)
+
+        self.topic[release] = topics
+        self.genre[release] = genres
+        self.quality[release] = quality
+        self.launch_sales[release] = BASE_LAUNCH_SALES * (quality / 10.0) ** 2 * (0.8 + 0.4 * u[6])
+        self.weeks_on_market[release] = 0
+        self.title_sales[release] = 0.0
+        self.active[release] = True
+        self.games_released[release] += 1
+        # Erfahrung: mit jedem Spiel etwas besser, gute Spiele zählen mehr
+        self.skill[release] = np.minimum(skill + 0.01 + 0.02 * (quality > skill), 9.5)
+        self.dev_left[release] = DEV_WEEKS[0] + (u[7] * (DEV_WEEKS[1] - DEV_WEEKS[0])).astype(np.int64)
+
+        numbers = self.games_released[release].tolist()
+        for n, (i, topic) in enumerate(zip(release.tolist(), topics.tolist())):
+            title = f"{compat.topics[topic]} {TITLE_WORDS[(i + numbers[n]) % len(TITLE_WORDS)]}"
+            self.titles[i] = title if numbers[n] == 1 else f"{title} {numbers[n]}"
+
+    def _update_pressure(self):
+        compat = game_data.COMPAT
+        sales = self.weekly_sales
+        self._topic_pressure = np.bincount(self.topic, weights=sales, minlength=len(compat.topics)).tolist()
+        self._genre_pressure = np.bincount(self.genre, weights=sales, minlength=len(compat.genres)).tolist()
+
+    # ---------- Abfragen ----------
+
+    def sales_factor(self, topic, genre):
+        """Anteil der Nachfrage, der bei Konkurrenz im selben Thema/Genre beim Spieler bleibt."""
+        compat = game_data.COMPAT
+        pressure = 0.0
+        topic_id = compat.topic_ids.get(topic)
+        if topic_id is not None and topic_id < len(self._topic_pressure):
+            pressure += self._topic_pressure[topic_id]
+        genre_id = compat.genre_ids.get(genre)
+        if genre_id is not None and genre_id < len(self._genre_pressure):
+            pressure += self._genre_pressure[genre_id]
+        return max(MIN_SHARE, 1.0 / (1.0 + pressure / MARKET_SIZE))
+
+    def active_titles(self):
+        """Indizes aller Studios, die gerade ein Spiel auf dem Markt haben."""
+        return np.flatnonzero(self.active)
+
+    # ---------- Speichern / Laden ----------
+
+    def to_dict(self):
+        compat = game_data.COMPAT
+        return {
+            "week": self.week,
+            "names": self.names,
+            "titles": self.titles,
+            "skill": self.skill.tolist(),
+            "trend_chase": self.trend_chase.tolist(),
+            "dev_left": self.dev_left.tolist(),
+            "topic": [compat.topics[i] for i in self.topic.tolist()],
+            "genre": [compat.genres[i] for i in self.genre.tolist()],
+            "quality": self.quality.tolist(),
+            "launch_sales": self.launch_sales.tolist(),
+            "weeks_on_market": self.weeks_on_market.tolist(),
+            "active": self.active.tolist(),
+            "weekly_sales": self.weekly_sales.tolist(),
+            "title_sales": self.title_sales.tolist(),
+            "games_released": self.games_released.tolist(),
+            "rng": self.rng.bit_generator.state,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        market = cls(count=len(data["names"]), week=data["week"])
+        compat = game_data.COMPAT
+        market.names = list(data["names"])
+        market.titles = list(data["titles"])
+        # Themen/Genres über den Namen zuordnen (Content-Packs können sich geändert haben)
+        market.topic = np.array([compat.topic_ids.get(t, 0) for t in data["topic"]], dtype=np.int32)
+        market.genre = np.array([compat.genre_ids.get(g, 0) for g in data["genre"]], dtype=np.int32)
+        for name, dtype in (
+            ("skill", float), ("trend_chase", float), ("dev_left", np.int64),
+            ("quality", float), ("launch_sales", float), ("weeks_on_market", np.int32),
+            ("active", bool), ("weekly_sales", float), ("title_sales", float),
+            ("games_released", np.int32),
+        ):
+            setattr(market, name, np.array(data[name], dtype=dtype))
+        market.rng.bit_generator.state = data["rng"]
+        market._update_pressure()
+        return market
@@ -0,0 +1,455 @@
+"""
+Content-Packs für Audio Studio Tycoon - Audio Edition.
+
+Zusätzliche Themen, Genres, Plattformen, Engine-Features, Ereignisse und
+Texte liegen als JSON- oder TOML-Dateien im Ordner content/. Beim Start
+werden alle Packs (alphabetisch) geprüft und über die Basisdaten aus
+game_data.py gelegt; spätere Packs überschreiben Einträge gleichen
+Namens. Danach werden die Nachschlage-Indizes neu gebaut.
+
+Das Ergebnis (Tabellen + Indizes) landet in einer Cache-Datei neben
+diesem Modul, deren Schlüssel aus den Hashes aller Pack-Dateien und der
+Basisdaten besteht. Der Schlüssel steht als Klartext-Kopfzeile vor dem
+Pickle; passt er nicht, wird die Datei gar nicht erst entpickelt. Bei
+unveränderten Packs wird beim nächsten Start nichts geparst.
+
+Aufbau eines Packs (alle Abschnitte optional):
+    topics, genres          Listen von Namen
+    compatibility           Thema -> {Genre: 0-3} (oder Liste in Genre-Reihenfolge)
+    ideal_sliders           Genre -> {Slider: Wert}
+    platforms, features,
+    events                  Listen von Objekten (Felder siehe ENTRY_SCHEMAS)
+    review_templates        Kategorie -> Liste von Texten (wird angehängt)
+    mail_templates          Art -> {subject, body}
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import sys
+import time
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11: nur JSON-Packs
+    tomllib = None
+
+import game_data
+import market
+import timeline
+from catalog import compile_template
+
+PACK_SUFFIXES = (".json", ".toml")
+CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "content_cache.pickle")
+CACHE_VERSION = 2
+# Kopfzeile der Cache-Datei: Kennung + Schlüssel, danach das Pickle
+CACHE_MAGIC = b"AST-CONTENT "
+# Höchstdauer (Sekunden) für das Laden aller Packs beim Start
+CONTENT_BUDGET = 0.3
+
+REQUIRED = object()
+NUMBER = (int, float)
+
+# Abschnitt -> (Tabelle in game_data, Schlüsselfeld, {Feld: (Typen, Standardwert)})
+ENTRY_SCHEMAS = {
+    "platforms": ("PLATFORMS", "name", {
+        "name": (str, REQUIRED),
+        "license_fee": (NUMBER, 0),
+        "market_multi": (NUMBER, 1.0),
+        "available_week": (NUMBER, REQUIRED),
+        "end_week": (NUMBER + (type(None),), None),
+        "type": (str, "PC"),
+    }),
+    "features": ("ENGINE_FEATURES", "name", {
+        "category": (str, REQUIRED),
+        "name": (str, REQUIRED),
+        "tech_bonus": (NUMBER, 1),
+        "cost": (NUMBER, 0),
+        "week": (NUMBER, 1),
+    }),
+    "events": ("RANDOM_EVENTS", "title", {
+        "title": (str, REQUIRED),
+        "text": (str, REQUIRED),
+        "effect": (str, REQUIRED),
+        "value": (NUMBER, REQUIRED),
+    }),
+}
+EVENT_EFFECTS = ("money", "fans")
+
+# Erlaubte Platzhalter der Text-Vorlagen
+TEMPLATE_FIELDS = {
+    "review_templates": {"company", "game", "genre", "topic"},
+    "mail_templates": {"game", "genre", "topic"},
+}
+
+# Reihenfolge der Abschnitte: Namen zuerst, damit sich Tabellen darauf beziehen können
+SECTIONS = (
+    "genres", "topics", "compatibility", "ideal_sliders",
+    "platforms", "features", "events", "review_templates", "mail_templates",
+)
+
+# Tabellen in game_data, die ein Pack verändern kann
+TABLES = (
+    "TOPICS", "GENRES", "TOPIC_GENRE_COMPAT", "GENRE_IDEAL_SLIDERS",
+    "PLATFORMS", "ENGINE_FEATURES", "RANDOM_EVENTS", "REVIEW_TEMPLATES", "MAIL_TEMPLATES",
+)
+
+
+def _base_dir():
+    # PyInstaller entpackt Dateien nach _MEIPASS
+    return getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
+
+
+CONTENT_DIR = os.path.join(_base_dir(), "content")
+
+_base = None   # unveränderte Kopie der Basisdaten (vor dem ersten Pack)
+
+
+def pack_files(directory=None):
+    """Pfade aller Pack-Dateien, alphabetisch sortiert."""
+    directory = directory or CONTENT_DIR
+    try:
+        names = sorted(n for n in os.listdir(directory) if n.endswith(PACK_SUFFIXES))
+    except OSError:
+        return []
+    return [os.path.join(directory, n) for n in names]
+
+
+# ============================================================
+# PRÜFEN & ZUSAMMENFÜHREN
+# ============================================================
+
+def _is_number(value):
+    return isinstance(value, NUMBER) and not isinstance(value, bool)
+
+
+def _check_type(value, types):
+    if isinstance(value, bool):
+        return bool in (types if isinstance(types, tuple) else (types,))
+    return isinstance(value, types)
+
+
+def validate_entry(entry, fields):
+    """Prüft ein Objekt gegen ein Schema; liefert (vollständiges Objekt, Fehlertext)."""
+    if not isinstance(entry, dict):
+        return None, "erwartet ein Objekt"
+    unknown = set(entry) - set(fields)
+    if unknown:
+        return None, f"unbekannte Felder {sorted(unknown)}"
+    result = {}
+    for name, (types, default) in fields.items():
+        if name not in entry:
+            if default is REQUIRED:
+                return None, f"Feld '{name}' fehlt"
+            result[name] = default
+        elif not _check_type(entry[name], types):
+            return None, f"Feld '{name}' hat falschen Typ"
+        else:
+            result[name] = entry[name]
+    return result, None
+
+
+def base_tables():
+    """Frische Kopie der Basisdaten ohne Packs; Kompatibilität als Thema -> {Genre: Wert}."""
+    global _base
+    if _base is None:
+        _base = {
+            "TOPICS": list(game_data.TOPICS),
+            "GENRES": list(game_data.GENRES),
+            "TOPIC_GENRE_COMPAT": {
+                topic: dict(zip(game_data.GENRES, row))
+                for topic, row in game_data.TOPIC_GENRE_COMPAT.items()
+            },
+            "GENRE_IDEAL_SLIDERS": game_data.GENRE_IDEAL_SLIDERS,
+            "PLATFORMS": game_data.PLATFORMS,
+            "ENGINE_FEATURES": game_data.ENGINE_FEATURES,
+            "RANDOM_EVENTS": game_data.RANDOM_EVENTS,
+            "REVIEW_TEMPLATES": game_data.REVIEW_TEMPLATES,
+            "MAIL_TEMPLATES": game_data.MAIL_TEMPLATES,
+        }
+        _base = pickle.loads(pickle.dumps(_base))
+    return pickle.loads(pickle.dumps(_base))
+
+
+def _merge_names(target, values, where, problems):
+    if not isinstance(values, list):
+        problems.append(f"{where}: erwartet eine Liste")
+        return
+    known = set(target)
+    for value in values:
+        if not isinstance(value, str) or not value:
+            problems.append(f"{where}: ungültiger Name {value!r}")
+        elif value not in known:
+            target.append(value)
+            known.add(value)
+
+
+def _merge_compat(tables, section, where, problems):
+    genres = tables["GENRES"]
+    known_genres = set(genres)
+    table = tables["TOPIC_GENRE_COMPAT"]
+    for topic, row in section.items():
+        if isinstance(row, list):
+            row = dict(zip(genres, row))
+        if not isinstance(row, dict):
+            problems.append(f"{where}.{topic}: erwartet Objekt oder Liste")
+            continue
+        bad = [g for g, v in row.items() if g not in known_genres or type(v) is not int or not 0 <= v <= 3]
+        if bad:
+            problems.append(f"{where}.{topic}: ungültige Werte für {sorted(map(str, bad))}")
+            continue
+        table.setdefault(topic, {}).update(row)
+
+
+def _merge_sliders(tables, section, where, problems):
+    sliders = set(game_data.SLIDER_NAMES)
+    for genre, values in section.items():
+        if not isinstance(values, dict) or not all(
+            name in sliders and _is_number(v) for name, v in values.items()
+        ):
+            problems.append(f"{where}.{genre}: erwartet {{Slider: Zahl}} mit {game_data.SLIDER_NAMES}")
+            continue
+        tables["GENRE_IDEAL_SLIDERS"][genre] = dict(values)
+
+
+def _merge_entries(tables, section_name, entries, where, problems, positions):
+    table_name, key, fields = ENTRY_SCHEMAS[section_name]
+    if not isinstance(entries, list):
+        problems.append(f"{where}: erwartet eine Liste")
+        return
+    table = tables[table_name]
+    index = positions.get(table_name)
+    if index is None:
+        index = positions[table_name] = {entry[key]: i for i, entry in enumerate(table)}
+    for i, raw in enumerate(entries):
+        entry, error = validate_entry(raw, fields)
+        if error is None and section_name == "events" and entry["effect"] not in EVENT_EFFECTS:
+            error = f"Effekt muss einer von {list(EVENT_EFFECTS)} sein"
+        if error:
+            problems.append(f"{where}[{i}]: {error}")
+            continue
+        pos = index.get(entry[key])
+        if pos is None:
+            index[entry[key]] = len(table)
+            table.append(entry)
+        else:
+            table[pos] = entry
+
+
+def _template_error(text, allowed):
+    if not isinstance(text, str):
+        return "erwartet Text"
+    try:
+        fields, _ = compile_template(text)
+    except ValueError as e:
+        return str(e)
+    if not fields <= allowed:
+        return f"unbekannte Platzhalter {sorted(fields - allowed)}"
+    return None
+
+
+def _merge_templates(tables, section_name, section, where, problems):
+    allowed = TEMPLATE_FIELDS[section_name]
+    if section_name == "review_templates":
+        table = tables["REVIEW_TEMPLATES"]
+        for category, texts in section.items():
+            if category not in table or not isinstance(texts, list):
+                problems.append(f"{where}.{category}: unbekannte Kategorie oder keine Liste")
+                continue
+            for text in texts:
+                error = _template_error(text, allowed)
+                if error:
+                    problems.append(f"{where}.{category}: {error}")
+                else:
+                    table[category].append(text)
+    else:
+        table = tables["MAIL_TEMPLATES"]
+        for kind, mail in section.items():
+            if kind not in table or not isinstance(mail, dict) or set(mail) - {"subject", "body"}:
+                problems.append(f"{where}.{kind}: unbekannte Mail-Art oder Felder")
+                continue
+            errors = [_template_error(text, allowed) for text in mail.values()]
+            if any(errors):
+                problems.append(f"{where}.{kind}: {next(e for e in errors if e)}")
+                continue
+            table[kind].update(mail)
+
+
+def merge_pack(tables, pack, name, problems):
+    """Legt ein geparstes Pack über die Tabellen; ungültige Einträge werden übersprungen."""
+    if not isinstance(pack, dict):
+        problems.append(f"{name}: erwartet ein Objekt auf oberster Ebene")
+        return
+    unknown = set(pack) - set(SECTIONS)
+    if unknown:
+        problems.append(f"{name}: unbekannte Abschnitte {sorted(unknown)}")
+    positions = {}
+    for section_name in SECTIONS:
+        if section_name not in pack:
+            continue
+        section = pack[section_name]
+        where = f"{name}:{section_name}"
+        if section_name == "topics":
+            _merge_names(tables["TOPICS"], section, where, problems)
+        elif section_name == "genres":
+            _merge_names(tables["GENRES"], section, where, problems)
+        elif section_name in ENTRY_SCHEMAS:
+            _merge_entries(tables, section_name, section, where, problems, positions)
+        elif not isinstance(section, dict):
+            problems.append(f"{where}: erwartet ein Objekt")
+        elif section_name == "compatibility":
+            _merge_compat(tables, section, where, problems)
+        elif section_name == "ideal_sliders":
+            _merge_sliders(tables, section, where, problems)
+        else:
+            _merge_templates(tables, section_name, section, where, problems)
+
+
+def finalize_tables(tables, problems):
+    """Wandelt die Kompatibilität zurück in Zeilen (Genre-Reihenfolge, fehlend = neutral)."""
+    genres = tables["GENRES"]
+    topics = set(tables["TOPICS"])
+    rows = {}
+    for topic, values in tables["TOPIC_GENRE_COMPAT"].items():
+        if topic not in topics:
+            problems.append(f"compatibility: unbekanntes Thema '{topic}'")
+            continue
+        rows[topic] = [values.get(genre, game_data.COMPAT_DEFAULT) for genre in genres]
+    tables["TOPIC_GENRE_COMPAT"] = rows
+    return tables
+
+
+# ============================================================
+# LADEN, CACHE & ANWENDEN
+# ============================================================
+
+def parse_pack(path, data):
+    """Parst den Inhalt einer Pack-Datei (bytes) je nach Endung."""
+    if path.endswith(".toml"):
+        if tomllib is None:
+            raise ValueError("TOML-Packs brauchen Python 3.11 oder neuer")
+        return tomllib.loads(data.decode("utf-8"))
+    return json.loads(data.decode("utf-8"))
+
+
+def cache_key(blobs):
+    """Hash über Cache-Version, Basisdaten/Index-Code und alle Packs (Name + Inhalt)."""
+    digest = hashlib.sha256(f"v{CACHE_VERSION}".encode())
+    for source in (game_data.__file__, market.__file__, timeline.__file__, __file__):
+        try:
+            with open(source, "rb") as f:
+                digest.update(hashlib.sha256(f.read()).digest())
+        except OSError:
+            pass   # gepackte Version ohne Quelltext: nur die Cache-Version zählt
+    for path, data in blobs:
+        digest.update(os.path.basename(path).encode("utf-8") + b"\0")
+        digest.update(hashlib.sha256(data).digest())
+    return digest.hexdigest()
+
+
+def apply_content(tables, indexes):
+    """Überträgt Tabellen und Indizes nach game_data (Listen/Dicts werden in-place ersetzt)."""
+    for name in TABLES:
+        if name not in tables:
+            continue
+        target = getattr(game_data, name)
+        if isinstance(target, list):
+            target[:] = tables[name]
+        else:
+            target.clear()
+            target.update(tables[name])
+    for name, index in indexes.items():
+        setattr(game_data, name, index)
+
+
+def compile_content(blobs):
+    """Parst, prüft und führt alle Packs zusammen; liefert (Tabellen, Indizes, Probleme)."""
+    problems = []
+    tables = base_tables()
+    for path, data in blobs:
+        name = os.path.basename(path)
+        try:
+            pack = parse_pack(path, data)
+        except ValueError as e:
+            problems.append(f"{name}: nicht lesbar ({e})")
+            continue
+        merge_pack(tables, pack, name, problems)
+    finalize_tables(tables, problems)
+    apply_content(tables, {})
+    return tables, game_data.compile_indexes(), problems
+
+
+def _read_cache(path, key):
+    try:
+        with open(path, "rb") as f:
+            # Fremde oder veraltete Dateien werden anhand der Kopfzeile verworfen, ohne sie zu entpickeln
+            if f.readline() != CACHE_MAGIC + key.encode("ascii") + b"\n":
+                return None
+            cached = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return None
+    if not isinstance(cached, dict) or cached.get("key") != key:
+        return None
+    return cached
+
+
+def load_content_packs(directory=None, cache_path=CACHE_FILE):
+    """
+    Lädt alle Content-Packs und wendet sie an. Liefert eine kurze
+    Zusammenfassung oder None, wenn es keine Packs gibt.
+    """
+    start = time.perf_counter()
+    paths = pack_files(directory)
+    if not paths:
+        return None
+    blobs = []
+    for path in paths:
+        try:
+            with open(path, "rb") as f:
+                blobs.append((path, f.read()))
+        except OSError as e:
+            print(f"[Content-Pack Fehler]: {e}")
+    key = cache_key(blobs)
+
+    cached = _read_cache(cache_path, key) if cache_path else None
+    if cached is not None:
+        apply_content(cached["tables"], cached["indexes"])
+        problems = cached["problems"]
+    else:
+        tables, indexes, problems = compile_content(blobs)
+        apply_content(tables, indexes)
+        if cache_path:
+            try:
+                with open(cache_path, "wb") as f:
+                    f.write(CACHE_MAGIC + key.encode("ascii") + b"\n")
+                    pickle.dump(
+                        {"key": key, "tables": tables, "indexes": indexes, "problems": problems},
+                        f, protocol=pickle.HIGHEST_PROTOCOL,
+                    )
+            except OSError as e:
+                print(f"[Content-Pack Fehler]: Cache nicht geschrieben: {e}")
+
+    for problem in problems:
+        print(f"[Content-Pack Fehler]: {problem}")
+    seconds = time.perf_counter() - start
+    if seconds > CONTENT_BUDGET:
+        print(f"[CONTENT] Laden dauerte {seconds:.3f}s (Budget {CONTENT_BUDGET:.3f}s)")
+    return {
+        "packs": len(blobs),
+        "cached": cached is not None,
+        "problems": len(problems),
+        "seconds": seconds,
+    }
+
+
+def install_tables(tables):
+    """Ersetzt Tabellen in game_data (nur die übergebenen) und baut die Indizes neu."""
+    apply_content(tables, {})
+    for name, index in game_data.compile_indexes().items():
+        setattr(game_data, name, index)
+
+
+def reset_content():
+    """Stellt die Basisdaten ohne Packs wieder her (z.B. nach Benchmarks)."""
+    install_tables(finalize_tables(base_tables(), []))
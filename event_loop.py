@@ -0,0 +1,177 @@
+"""
+Hauptschleifen-Hilfen für Audio Studio Tycoon - Audio Edition.
+
+Zwei Modi:
+- "poll":  klassisch, pygame.event.get() + clock.tick(30)
+- "event": blockiert in pygame.event.wait(), bis ein Ereignis eintrifft
+           oder der nächste anstehende Timer fällig wird
+
+Ein Spieler, der nur der Sprachausgabe zuhört, weckt das Spiel im
+Event-Modus also gar nicht mehr auf. Ohne blockierenden Videotreiber
+(z.B. Dummy/Offscreen) fragt SDL in pygame.event.wait() allerdings jede
+Millisekunde ab; im Leerlauf (keine Eingabe seit IDLE_AFTER Sekunden,
+keine gehaltene Taste, keine wartende Musik) wird deshalb in Scheiben
+von IDLE_SLICE geschlafen.
+
+Pro Durchlauf werden alle anstehenden Ereignisse abgeholt; Serien von
+Navigationstasten (Auto-Repeat) werden vor der Weitergabe an das Menü
+zu einer einzigen Bewegung zusammengefasst (coalesce_events).
+"""
+
+import heapq
+import itertools
+import math
+import time
+
+import pygame
+
+POLL_FPS = 30
+# Obergrenze für einen einzelnen Wartevorgang (Sicherheitsnetz)
+MAX_IDLE_WAIT = 5.0
+# Leerlauf: so lange nach der letzten Eingabe, dann Warten in Scheiben dieser Länge
+IDLE_AFTER = 2.0
+IDLE_SLICE = 0.05
+
+# Tasten-Wiederholung: Verzögerung und Intervall in ms (pygame.key.set_repeat)
+KEY_REPEAT = (400, 40)
+
+# Gegenläufige Navigationstasten, die zu einer Netto-Bewegung verrechnet werden
+NAV_AXES = {
+    pygame.K_UP: (pygame.K_UP, pygame.K_DOWN, -1),
+    pygame.K_DOWN: (pygame.K_UP, pygame.K_DOWN, 1),
+    pygame.K_PAGEUP: (pygame.K_PAGEUP, pygame.K_PAGEDOWN, -1),
+    pygame.K_PAGEDOWN: (pygame.K_PAGEUP, pygame.K_PAGEDOWN, 1),
+}
+# Tasten, bei denen eine Wiederholung nichts ändert
+IDEMPOTENT_KEYS = (pygame.K_HOME, pygame.K_END)
+
+
+class Timers:
+    """Einfache Timer-Warteschlange (Heap nach Fälligkeit, time.time()-basiert)."""
+
+    def __init__(self):
+        self._heap = []
+        self._ids = itertools.count()
+
+    def add(self, delay, callback):
+        """Ruft callback nach delay Sekunden auf."""
+        heapq.heappush(self._heap, (time.time() + delay, next(self._ids), callback))
+
+    def next_deadline(self):
+        return self._heap[0][0] if self._heap else None
+
+    def run_due(self, now=None):
+        """Führt alle fälligen Timer aus."""
+        now = time.time() if now is None else now
+        while self._heap and self._heap[0][0] <= now:
+            _, _, callback = heapq.heappop(self._heap)
+            callback()
+
+
+class LoopStats:
+    """Zählt Aufwachvorgänge und CPU-Zeit der Hauptschleife."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.wakeups = 0
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+
+    def wakeup(self):
+        self.wakeups += 1
+
+    def summary(self):
+        wall = max(1e-9, time.perf_counter() - self._wall_start)
+        cpu = time.process_time() - self._cpu_start
+        scale = 60.0 / wall
+        return {
+            "seconds": round(wall, 2),
+            "wakeups": self.wakeups,
+            "wakeups_per_minute": round(self.wakeups * scale),
+            "cpu_seconds_per_minute": round(cpu * scale, 4),
+        }
+
+
+def next_timeout(deadlines, now=None, max_wait=MAX_IDLE_WAIT):
+    """Wartezeit in Millisekunden bis zur frühesten Deadline (None-Werte ignoriert)."""
+    now = time.time() if now is None else now
+    pending = [d for d in deadlines if d is not None]
+    wait = min(pending) - now if pending else max_wait
+    return max(0, math.ceil(min(wait, max_wait) * 1000))
+
+
+def wait_for_events(timeout_ms, idle=False, stats=None):
+    """
+    Blockiert bis zum nächsten Ereignis oder Timeout, liefert alle anstehenden
+    Ereignisse. idle: in IDLE_SLICE-Scheiben schlafen statt pygame.event.wait()
+    (jede Scheibe zählt in stats als Aufwachvorgang).
+    """
+    if timeout_ms <= 0:
+        return pygame.event.get()
+    if idle:
+        end = time.perf_counter() + timeout_ms / 1000
+        while True:
+            events = pygame.event.get()
+            remaining = end - time.perf_counter()
+            if events or remaining <= 0:
+                return events
+            time.sleep(min(IDLE_SLICE, remaining))
+            if stats is not None:
+                stats.wakeup()
+    first = pygame.event.wait(timeout_ms)
+    events = [] if first.type == pygame.NOEVENT else [first]
+    events.extend(pygame.event.get())
+    return events
+
+
+def set_key_repeat(delay_ms, interval_ms):
+    """Aktiviert die Tasten-Wiederholung (0 = aus)."""
+    if delay_ms > 0 and interval_ms > 0:
+        pygame.key.set_repeat(delay_ms, interval_ms)
+    else:
+        pygame.key.set_repeat()
+
+
+def _nav_axis(event):
+    if event.type != pygame.KEYDOWN or getattr(event, 'mod', 0) & ~pygame.KMOD_NUM & ~pygame.KMOD_CAPS:
+        return None
+    return NAV_AXES.get(event.key)
+
+
+def coalesce_events(events):
+    """
+    Fasst direkt aufeinanderfolgende Navigationstasten zusammen.
+
+    Auf/Ab (bzw. Bild auf/ab) werden zu einer Netto-Bewegung verrechnet;
+    das Ergebnis ist ein einzelnes KEYDOWN mit dem Attribut count
+    (Anzahl Schritte). Heben sich die Tasten auf, entfällt das Ereignis.
+    Wiederholte Pos1/Ende-Tasten bleiben einmal erhalten. Alle anderen
+    Ereignisse trennen Serien und behalten ihre Reihenfolge.
+    """
+    result = []
+    axis = None
+    net = 0
+
+    def flush():
+        if axis and net:
+            key = axis[1] if net > 0 else axis[0]
+            result.append(pygame.event.Event(pygame.KEYDOWN, key=key, unicode="", mod=0, count=abs(net)))
+
+    for event in events:
+        event_axis = _nav_axis(event)
+        if event_axis is not None:
+            if axis is None or event_axis[:2] != axis[:2]:
+                flush()
+                axis, net = event_axis, 0
+            net += event_axis[2] * getattr(event, 'count', 1)
+            continue
+        flush()
+        axis, net = None, 0
+        if (event.type == pygame.KEYDOWN and event.key in IDEMPOTENT_KEYS and result
+                and result[-1].type == pygame.KEYDOWN and result[-1].key == event.key):
+            continue
+        result.append(event)
+    flush()
+    return result
@@ -0,0 +1,323 @@
+"""
+Menü-Stack und Hauptschleife für Audio Studio Tycoon - Audio Edition.
+"""
+
+import time
+import pygame
+from music import MENU_MUSIC_CONTEXTS, MUSIC_EVENT
+from hud import HudRenderer
+from profiling import Profiler
+from pipeline import MAX_CATCH_UP_WEEKS
+from event_loop import (
+    IDLE_AFTER, POLL_FPS, Timers, LoopStats, next_timeout, wait_for_events, coalesce_events,
+)
+from menus import (
+    MainMenu,
+    CompanyNameMenu,
+    GameMenu,
+    SettingsMenu,
+    TopicMenu,
+    GenreMenu,
+    PlatformMenu,
+    AudienceMenu,
+    EngineSelectMenu,
+    GameNameMenu,
+    DevelopmentSliderMenu,
+    DevProgressMenu,
+    ReviewResultMenu,
+    HRMenu,
+    EmployeeListMenu,
+    HireMenu,
+    FireMenu,
+    ResearchMenu,
+    FeatureResearchMenu,
+    EngineCreateNameMenu,
+    EngineFeatureSelectMenu,
+    OfficeMenu,
+    GameSizeMenu,
+    MarketingMenu,
+    TrainingEmployeeSelectMenu,
+    TrainingOptionMenu,
+    BankruptcyMenu,
+    EmailInboxMenu,
+    EmailDetailMenu,
+    ServiceMenu,
+    GameServiceOptionsMenu,
+    SaveMenu,
+    LoadMenu,
+    HelpMenu,
+    HistoryMenu,
+    ChartsMenu,
+    MenuRegistry,
+)
+
+
+# Menü-Schlüssel -> Fabrik(audio, state); erzeugt wird erst bei der ersten Navigation
+MENU_FACTORIES = {
+    # Haupt-Flow
+    "main_menu": MainMenu,
+    "company_name_input": CompanyNameMenu,
+    "game_menu": GameMenu,
+
+    # Spielentwicklung
+    "topic_menu": TopicMenu,
+    "genre_menu": GenreMenu,
+    "platform_menu": PlatformMenu,
+    "audience_menu": AudienceMenu,
+    "game_size_menu": GameSizeMenu,
+    "marketing_menu": MarketingMenu,
+    "engine_select_menu": EngineSelectMenu,
+    "game_name_input": GameNameMenu,
+    "slider_menu": DevelopmentSliderMenu,
+    "dev_progress_menu": DevProgressMenu,
+    "review_result": ReviewResultMenu,
+
+    # Personal
+    "hr_menu": HRMenu,
+    "employee_list": EmployeeListMenu,
+    "hire_menu": HireMenu,
+    "fire_menu": FireMenu,
+    "training_employee_select": TrainingEmployeeSelectMenu,
+    "training_option_select": TrainingOptionMenu,
+
+    # Forschung & Engines
+    "research_menu": ResearchMenu,
+    "feature_research_menu": FeatureResearchMenu,
+    "engine_create_name": EngineCreateNameMenu,
+    "engine_feature_select": EngineFeatureSelectMenu,
+
+    # Büro
+    "office_menu": OfficeMenu,
+
+    # Spezial
+    "bankruptcy": BankruptcyMenu,
+    "email_inbox": EmailInboxMenu,
+    "email_detail": EmailDetailMenu,
+    "history_menu": HistoryMenu,
+    "charts_menu": ChartsMenu,
+    "service_menu": ServiceMenu,
+    "game_service_options": GameServiceOptionsMenu,
+    "settings_menu": lambda audio, state: SettingsMenu(audio, state, lambda: "main_menu"),
+    "settings_menu_ingame": lambda audio, state: SettingsMenu(audio, state, lambda: "game_menu"),
+    "save_menu": SaveMenu,
+    "load_menu": LoadMenu,
+    "help_menu": HelpMenu,
+}
+
+# In diesen Menüs steht die Spielzeit (außerhalb des laufenden Spiels, Einstellungen, Speichern)
+PAUSED_MENUS = (
+    "main_menu", "company_name_input", "load_menu", "settings_menu", "bankruptcy",
+    "settings_menu_ingame", "save_menu",
+)
+
+# Debug-Overlay mit Frame-Zeiten ein-/ausblenden
+OVERLAY_KEY = pygame.K_F3
+OVERLAY_REFRESH = 1.0
+
+
+class Game:
+    """Menü-Stack, Spielzustand und Hauptschleife."""
+
+    def __init__(self, audio, state, screen=None, loop_mode="event", max_resident_menus=None,
+                 profiler=None, coalesce_input=True):
+        self.audio = audio
+        self.state = state
+        self.menus = MenuRegistry(MENU_FACTORIES, audio, state, max_resident=max_resident_menus)
+        self.hud = HudRenderer(screen) if screen is not None else None
+        self.loop_mode = loop_mode
+        self.coalesce_input = coalesce_input
+        self.timers = Timers()
+        self.stats = LoopStats()
+        self.profiler = profiler or Profiler()
+        if self.profiler.enabled:
+            self.profiler.instrument(type(state))
+        self.show_overlay = False
+        self.next_week_at = None   # time.time() der nächsten Spielwoche, solange entwickelt wird
+        self.last_input_at = 0.0   # time.time() der letzten Taste (Leerlauf-Erkennung)
+        self.running = True
+        self.current_key = "main_menu"
+        self.current_menu = self.menus[self.current_key]
+
+    def navigate(self, key):
+        """Wechselt zu einem anderen Menü."""
+        self.current_key = key
+        self.current_menu = self.menus[key]
+        if key in MENU_MUSIC_CONTEXTS:
+            self.audio.set_music_context(MENU_MUSIC_CONTEXTS[key])
+        # Einträge können sich seit dem letzten Besuch geändert haben (Mitarbeiter, E-Mails, ...)
+        invalidate = getattr(self.current_menu, 'invalidate_jump', None)
+        if invalidate:
+            invalidate()
+        self.current_menu.announce_entry()
+        self.mark_dirty()
+
+    def mark_dirty(self):
+        if self.hud:
+            self.hud.mark_dirty()
+
+    def toggle_overlay(self):
+        """Blendet das Frame-Zeit-Overlay ein/aus (schaltet die Messung bei Bedarf ein)."""
+        self.show_overlay = not self.show_overlay
+        if self.show_overlay and not self.profiler.enabled:
+            self.profiler.enable()
+            self.profiler.instrument(type(self.state))
+        self.audio.speak(self.state.get_text('profiler_overlay_on' if self.show_overlay else 'profiler_overlay_off'))
+        if self.show_overlay:
+            self.timers.add(OVERLAY_REFRESH, self._refresh_overlay)
+        self.mark_dirty()
+
+    def _refresh_overlay(self):
+        if self.show_overlay:
+            self.mark_dirty()
+            self.timers.add(OVERLAY_REFRESH, self._refresh_overlay)
+
+    def dispatch(self, event):
+        """Verarbeitet ein einzelnes pygame-Ereignis."""
+        if event.type == pygame.QUIT:
+            self.running = False
+
+        elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+            if self.hud:
+                self.hud.invalidate()
+
+        elif event.type == pygame.KEYDOWN and event.key == OVERLAY_KEY:
+            self.toggle_overlay()
+
+        elif event.type == pygame.KEYDOWN:
+            self.last_input_at = time.time()
+            result = self.current_menu.handle_input(event)
+            self.mark_dirty()
+
+            if result == "quit":
+                self.running = False
+            elif result and result in self.menus:
+                self.navigate(result)
+
+    def dispatch_all(self, events):
+        """Verarbeitet alle Ereignisse eines Durchlaufs (Auto-Repeat zusammengefasst)."""
+        if self.coalesce_input:
+            events = coalesce_events(events)
+        for event in events:
+            if event.type == MUSIC_EVENT:
+                continue  # update() beim nächsten Durchlauf genügt
+            self.dispatch(event)
+
+    def update(self):
+        """Update-Logik (Fortschrittsbalken, Musik, Timer etc.)"""
+        span = self.profiler.span
+        with span("audio"):
+            self.audio.update()
+        with span("timers"):
+            self.timers.run_due()
+        with span("studio_clock"):
+            self.run_clock()
+        if hasattr(self.current_menu, 'update'):
+            with span("menu_update"):
+                self.current_menu.update()
+
+        # Pleite-Check
+        with span("is_bankrupt"):
+            bankrupt = self.state.is_bankrupt()
+        if bankrupt and self.current_key != "bankruptcy":
+            self.navigate("bankruptcy")
+
+    def run_clock(self, now=None):
+        """
+        Lässt die Spielwochen in Echtzeit (Spieltempo aus den Einstellungen)
+        laufen, solange Projekte in Entwicklung sind, und sagt
+        Phasenwechsel und Veröffentlichungen an. Ohne Projekte steht die Zeit.
+        """
+        state = self.state
+        if not state.pipeline or self.current_key in PAUSED_MENUS:
+            self.next_week_at = None
+            return
+        now = time.time() if now is None else now
+        step = state.seconds_per_week()
+        if self.next_week_at is None or now - self.next_week_at > step * MAX_CATCH_UP_WEEKS:
+            self.next_week_at = now + step
+            return
+        while state.pipeline and now >= self.next_week_at:
+            state.advance_week()
+            self.next_week_at += step
+        self.announce_dev_events()
+        self.mark_dirty()
+
+    def announce_dev_events(self):
+        """Liest die gesammelten Meldungen der Entwicklungs-Pipeline vor."""
+        state = self.state
+        while state.dev_events:
+            kind, project, phase = state.dev_events.popleft()
+            if kind == "released":
+                self.audio.play_sound("cash")
+                self.audio.speak(state.get_text(
+                    'project_released', name=project.name, average=project.review.average,
+                ), interrupt=False)
+            else:
+                self.audio.speak(state.get_text('project_phase', name=project.name, phase=phase), interrupt=False)
+
+    def is_idle(self, now=None):
+        """Keine Eingabe seit IDLE_AFTER Sekunden, keine gehaltene Taste, keine wartende Musik."""
+        now = time.time() if now is None else now
+        if now - self.last_input_at < IDLE_AFTER:
+            return False
+        music = getattr(self.audio, 'music', None)
+        if music is not None and music.busy():
+            return False
+        # Gehaltene Taste: Auto-Repeat soll ohne Verzögerung ankommen
+        return not (pygame.display.get_init() and any(pygame.key.get_pressed()))
+
+    def next_deadline(self):
+        """Frühester Zeitpunkt (time.time()), zu dem die Schleife aufwachen muss."""
+        menu_deadline = getattr(self.current_menu, 'next_deadline', None)
+        return min(
+            (d for d in (
+                menu_deadline() if menu_deadline else None,
+                self.timers.next_deadline(),
+                self.next_week_at,
+            ) if d is not None),
+            default=None,
+        )
+
+    def draw(self):
+        # Fenster nur bei Änderungen neu zeichnen
+        if not self.hud:
+            return
+        overlay = self.profiler.overlay_lines() if self.show_overlay else None
+        with self.profiler.span("hud"):
+            redrawn = self.hud.draw(self.state, self.current_key, overlay)
+        if redrawn:
+            with self.profiler.span("flip"):
+                pygame.display.flip()
+
+    def run(self, max_seconds=None):
+        """Hauptschleife im gewählten Modus ("event" oder "poll")."""
+        clock = pygame.time.Clock()
+        stop_at = time.time() + max_seconds if max_seconds is not None else None
+        self.stats.reset()
+
+        while self.running:
+            self.stats.wakeup()
+            frame_start = time.perf_counter()
+            with self.profiler.span("update"):
+                self.update()
+            busy = time.perf_counter() - frame_start
+
+            if self.loop_mode == "poll":
+                events = pygame.event.get()
+            else:
+                deadline = self.next_deadline()
+                if stop_at is not None:
+                    deadline = stop_at if deadline is None else min(deadline, stop_at)
+                events = wait_for_events(next_timeout([deadline]), idle=self.is_idle(), stats=self.stats)
+
+            # Wartezeit zählt nicht zur Frame-Zeit
+            frame_start = time.perf_counter()
+            with self.profiler.span("events"):
+                self.dispatch_all(events)
+
+            self.draw()
+            self.profiler.record("frame", busy + time.perf_counter() - frame_start)
+            if self.loop_mode == "poll":
+                clock.tick(POLL_FPS)
+            if stop_at is not None and time.time() >= stop_at:
+                break
@@ -5,6 +5,11 @@ Enthält Themen, Genres, Kompatibilitätstabelle, Slider-Gewichtungen,
 Plattformen, Engine-Features, Mitarbeiter-Daten und Zufallsereignisse.
 """
 
+import numpy as np
+
+from market import PlatformMarket
+from timeline import ReleaseTimeline
+
 # ============================================================
 # THEMEN (Topics) - 20 verschiedene
 # ============================================================
@@ -123,6 +128,64 @@ TOPIC_GENRE_COMPAT = {
     "Detektiv":         [  1,     1,   1,    1,     3,    3,     0,     1  ],
 }
 
+# ============================================================
+# KOMPATIBILITÄTS-MATRIX
+# Themen und Genres bekommen feste Indizes; die Tabelle liegt dicht als
+# 2D-Array vor (Zeile = Thema, Spalte = Genre). Fehlende Einträge
+# (Themen ohne Zeile, Genres ohne Spalte) gelten als "Okay" (1).
+# ============================================================
+COMPAT_DEFAULT = 1
+
+
+class CompatMatrix:
+    """Dichte Thema/Genre-Tabelle mit Index-Lookups und ganzen Zeilen/Spalten."""
+
+    def __init__(self, topics, genres, table, default=COMPAT_DEFAULT):
+        self.topics = list(topics)
+        self.genres = list(genres)
+        self.default = default
+        self.topic_ids = {topic: i for i, topic in enumerate(self.topics)}
+        self.genre_ids = {genre: i for i, genre in enumerate(self.genres)}
+        self.matrix = np.full((len(self.topics), len(self.genres)), default, dtype=np.int8)
+        for topic, values in table.items():
+            row = self.topic_ids.get(topic)
+            if row is None:
+                continue
+            values = values[:len(self.genres)]
+            self.matrix[row, :len(values)] = values
+        # Einzelwerte aus Python-Listen sind schneller als NumPy-Skalare
+        self.rows = self.matrix.tolist()
+
+    def value(self, topic, genre):
+        row = self.topic_ids.get(topic)
+        if row is None:
+            return self.default
+        return self.rows[row][self.genre_ids.get(genre, 0)]
+
+    def row(self, topic):
+        """Kompatibilität eines Themas mit allen Genres (Array in GENRES-Reihenfolge)."""
+        row = self.topic_ids.get(topic)
+        if row is None:
+            return np.full(len(self.genres), self.default, dtype=np.int8)
+        return self.matrix[row]
+
+    def column(self, genre):
+        """Kompatibilität eines Genres mit allen Themen (Array in TOPICS-Reihenfolge)."""
+        return self.matrix[:, self.genre_ids.get(genre, 0)]
+
+    def genres_by_compatibility(self, topic):
+        """Genres, beste Kombination zuerst (bei Gleichstand Original-Reihenfolge)."""
+        order = np.argsort(-self.row(topic), kind="stable")
+        return [self.genres[i] for i in order]
+
+    def topics_by_compatibility(self, genre):
+        """Themen, beste Kombination zuerst (bei Gleichstand Original-Reihenfolge)."""
+        order = np.argsort(-self.column(genre), kind="stable")
+        return [self.topics[i] for i in order]
+
+
+COMPAT = CompatMatrix(TOPICS, GENRES, TOPIC_GENRE_COMPAT)
+
 # ============================================================
 # PLATTFORMEN
 # name, Lizenzgebühr, Markt-Multiplikator, verfügbar ab Woche, Ende Woche (None = nie), Typ
@@ -353,11 +416,15 @@ RANDOM_EVENTS = [
 # BÜRO-STUFEN
 # ============================================================
 OFFICE_LEVELS = [
-    {"name": "Garage",          "max_employees": 1,  "cost": 0,       "prestige": 0},
-    {"name": "Kleines Büro",    "max_employees": 3,  "cost": 50000,   "prestige": 1},
-    {"name": "Mittleres Büro",  "max_employees": 6,  "cost": 200000,  "prestige": 2},
-    {"name": "Großes Studio",   "max_employees": 12, "cost": 500000,  "prestige": 3},
-    {"name": "Hauptquartier",   "max_employees": 20, "cost": 1500000, "prestige": 5},
+    {"name": "Garage",          "max_employees": 1,    "cost": 0,         "prestige": 0},
+    {"name": "Kleines Büro",    "max_employees": 3,    "cost": 50000,     "prestige": 1},
+    {"name": "Mittleres Büro",  "max_employees": 6,    "cost": 200000,    "prestige": 2},
+    {"name": "Großes Studio",   "max_employees": 12,   "cost": 500000,    "prestige": 3},
+    {"name": "Hauptquartier",   "max_employees": 20,   "cost": 1500000,   "prestige": 5},
+    {"name": "Campus",          "max_employees": 100,  "cost": 6000000,   "prestige": 7},
+    {"name": "Konzernzentrale", "max_employees": 500,  "cost": 25000000,  "prestige": 9},
+    {"name": "Mega-Studio",     "max_employees": 2000, "cost": 100000000, "prestige": 12},
+    {"name": "Studio-Imperium", "max_employees": 5000, "cost": 400000000, "prestige": 15},
 ]
 
 # ============================================================
@@ -528,10 +595,17 @@ REVIEW_TEMPLATES = {
 
 def get_compatibility(topic, genre):
     """Gibt Kompatibilitätswert (0-3) zurück."""
-    if topic not in TOPIC_GENRE_COMPAT:
-        return 1
-    genre_index = GENRES.index(genre) if genre in GENRES else 0
-    return TOPIC_GENRE_COMPAT[topic][genre_index]
+    return COMPAT.value(topic, genre)
+
+
+def genres_by_compatibility(topic):
+    """Alle Genres, nach Kompatibilität mit dem Thema sortiert (beste zuerst)."""
+    return COMPAT.genres_by_compatibility(topic)
+
+
+def topics_by_compatibility(genre):
+    """Alle Themen, nach Kompatibilität mit dem Genre sortiert (beste zuerst)."""
+    return COMPAT.topics_by_compatibility(genre)
 
 
 def get_compatibility_text(value):
@@ -550,19 +624,41 @@ def get_ideal_sliders(genre):
     return GENRE_IDEAL_SLIDERS.get(genre, {s: 5 for s in SLIDER_NAMES})
 
 
+PLATFORM_TIMELINE = ReleaseTimeline(PLATFORMS, "available_week", "end_week")
+FEATURE_TIMELINE = ReleaseTimeline(ENGINE_FEATURES, "week")
+PLATFORM_MARKET = PlatformMarket(PLATFORMS)
+
+
+def compile_indexes():
+    """Baut alle Nachschlage-Indizes aus den aktuellen Tabellen (Name -> Objekt)."""
+    return {
+        "COMPAT": CompatMatrix(TOPICS, GENRES, TOPIC_GENRE_COMPAT),
+        "PLATFORM_TIMELINE": ReleaseTimeline(PLATFORMS, "available_week", "end_week"),
+        "FEATURE_TIMELINE": ReleaseTimeline(ENGINE_FEATURES, "week"),
+        "PLATFORM_MARKET": PlatformMarket(PLATFORMS),
+    }
+
+
 def get_available_platforms(week):
     """Gibt Plattformen zurück, die in der aktuellen Woche verfügbar sind."""
-    current_week = float(week)
-    available = []
-    for p in PLATFORMS:
-        start = float(p["available_week"]) if p["available_week"] is not None else 0.0
-        end = float(p["end_week"]) if p["end_week"] is not None else 99999.0
-        if start <= current_week <= end:
-            available.append(p)
-    return available
+    return PLATFORM_TIMELINE.available(week)
+
+
+def get_platform(name):
+    """Plattform-Eintrag zum Namen (oder None)."""
+    return PLATFORM_MARKET.platform(name)
+
+
+def get_platform_market(name, week):
+    """Markt-Multiplikator einer Plattform in einer Woche (installierte Basis * market_multi)."""
+    return PLATFORM_MARKET.multiplier(name, week)
+
+
+def get_market_overview(week):
+    """[(Name, Multiplikator, Trend)] aller verfügbaren Plattformen, größter Markt zuerst."""
+    return PLATFORM_MARKET.overview(get_available_platforms(week), week)
 
 
 def get_available_features(week):
     """Gibt Engine-Features zurück, die in der aktuellen Woche erforschbar sind."""
-    current_week = int(week)
-    return [f for f in ENGINE_FEATURES if int(f["week"]) <= current_week]
+    return FEATURE_TIMELINE.available(int(week))
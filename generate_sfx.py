@@ -1,41 +1,221 @@
-import wave
-import struct
-import math
+"""
+Sound-Synthese für Audio Studio Tycoon - Audio Edition.
+
+Alle Effekte sind als deklarative Rezepte in SFX_RECIPES beschrieben
+und werden als komplette NumPy-Puffer gerendert. Die Rezepte können
+als WAV-Dateien nach assets/ geschrieben oder direkt als
+pygame.mixer.Sound im Speicher erzeugt werden.
+
+Aufruf: python generate_sfx.py [--force]
+"""
+
+import hashlib
+import json
 import os
+import sys
+import wave
+from concurrent.futures import ThreadPoolExecutor
 
-def generate_beep(filename, frequency, duration, volume=0.5, sample_rate=44100):
-    """Generiert einen einfachen Beep und speichert ihn als WAV."""
-    if not os.path.exists('assets'):
-        os.makedirs('assets')
-    
-    num_samples = int(duration * sample_rate)
+import numpy as np
+
+SAMPLE_RATE = 44100
+ASSETS_DIR = "assets"
+MANIFEST_FILE = "sfx_manifest.json"
+SYNTH_VERSION = 1  # Erhöhen, wenn sich die Render-Logik ändert
+
+# ============================================================
+# REZEPTE
+# tones: Liste von Tönen, jeweils mit
+#   freq      Startfrequenz in Hz
+#   sweep_to  Endfrequenz (optional, linearer Sweep)
+#   start     Startzeit in Sekunden innerhalb des Effekts (optional)
+#   duration  Länge in Sekunden (optional, Standard: bis zum Ende)
+#   gain      Lautstärke relativ zum Effekt (optional)
+# envelope: Attack/Release in Sekunden (lineare Rampen)
+# ============================================================
+SFX_RECIPES = {
+    # Navigations-Klick (kurz, mittlere Frequenz)
+    "click": {
+        "duration": 0.05, "volume": 0.2,
+        "tones": [{"freq": 440}],
+        "envelope": {"attack": 0.01, "release": 0.01},
+    },
+    # Bestätigung (zwei Töne aufsteigend)
+    "confirm": {
+        "duration": 0.1, "volume": 0.3,
+        "tones": [
+            {"freq": 660, "duration": 0.05},
+            {"freq": 880, "start": 0.05},
+        ],
+        "envelope": {"attack": 0.01, "release": 0.01},
+    },
+    # Fehler (tief, kurz, nach unten gezogen)
+    "error": {
+        "duration": 0.15, "volume": 0.4,
+        "tones": [{"freq": 220, "sweep_to": 110}],
+        "envelope": {"attack": 0.01, "release": 0.01},
+    },
+    # Erfolg (fanfare-artig: Dur-Dreiklang, Töne setzen nacheinander ein)
+    "success": {
+        "duration": 0.2, "volume": 0.3,
+        "tones": [
+            {"freq": 523.25, "gain": 0.5},
+            {"freq": 659.25, "start": 0.06, "gain": 0.5},
+            {"freq": 783.99, "start": 0.12, "gain": 0.5, "sweep_to": 880},
+        ],
+        "envelope": {"attack": 0.01, "release": 0.01},
+    },
+}
+
+
+def _envelope(num_samples, attack, release, sample_rate):
+    """Lineare Attack/Release-Hüllkurve als Array."""
+    env = np.ones(num_samples, dtype=np.float64)
+    a = min(num_samples, int(attack * sample_rate))
+    r = min(num_samples, int(release * sample_rate))
+    if a > 0:
+        env[:a] = np.arange(a) / a
+    if r > 0:
+        env[num_samples - r:] = np.minimum(env[num_samples - r:], np.arange(r, 0, -1) / r)
+    return env
+
+
+def render(recipe, sample_rate=SAMPLE_RATE):
+    """Rendert ein Rezept zu einem Mono-Puffer (float64, -1.0 bis 1.0)."""
+    num_samples = int(recipe["duration"] * sample_rate)
+    out = np.zeros(num_samples, dtype=np.float64)
+
+    for tone in recipe["tones"]:
+        start = int(tone.get("start", 0.0) * sample_rate)
+        if start >= num_samples:
+            continue
+        length = num_samples - start
+        if "duration" in tone:
+            length = min(length, int(tone["duration"] * sample_rate))
+        f0 = tone["freq"]
+        f1 = tone.get("sweep_to", f0)
+        if f0 == f1:
+            phase = 2 * np.pi * f0 * np.arange(length) / sample_rate
+        else:
+            # Phase = Integral der Frequenz, damit der Sweep knackfrei bleibt
+            freqs = np.linspace(f0, f1, length, endpoint=False)
+            phase = 2 * np.pi * np.concatenate(([0.0], np.cumsum(freqs[:-1]))) / sample_rate
+        out[start:start + length] += np.sin(phase) * tone.get("gain", 1.0)
+
+    env = recipe.get("envelope", {})
+    out *= _envelope(num_samples, env.get("attack", 0.0), env.get("release", 0.0), sample_rate)
+    out *= recipe.get("volume", 0.5)
+    return np.clip(out, -1.0, 1.0)
+
+
+def to_int16(samples):
+    """Wandelt einen float-Puffer in 16-bit PCM um."""
+    return (samples * 32767).astype(np.int16)
+
+
+def recipe_hash(recipe, sample_rate=SAMPLE_RATE):
+    """Inhalts-Hash eines Rezepts (inkl. Samplerate und Synth-Version)."""
+    payload = json.dumps(
+        {"recipe": recipe, "sample_rate": sample_rate, "version": SYNTH_VERSION},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def write_wav(filename, samples, sample_rate=SAMPLE_RATE):
+    """Schreibt einen Mono-Puffer als 16-bit WAV-Datei."""
     with wave.open(filename, 'w') as f:
         f.setnchannels(1)  # Mono
         f.setsampwidth(2)   # 16-bit
         f.setframerate(sample_rate)
-        
-        for i in range(num_samples):
-            # Sinus-Welle mit Envelope (Fading)
-            envelope = 1.0
-            if i < 441: # Attack
-                envelope = i / 441
-            elif i > num_samples - 441: # Release
-                envelope = (num_samples - i) / 441
-                
-            value = int(math.sin(2 * math.pi * frequency * (i / sample_rate)) * 32767 * volume * envelope)
-            f.writeframesraw(struct.pack('<h', value))
+        f.writeframes(to_int16(samples).astype('<i2').tobytes())
+
+
+def generate_beep(filename, frequency, duration, volume=0.5, sample_rate=44100):
+    """Generiert einen einfachen Beep und speichert ihn als WAV."""
+    os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+    recipe = {
+        "duration": duration, "volume": volume,
+        "tones": [{"freq": frequency}],
+        "envelope": {"attack": 0.01, "release": 0.01},
+    }
+    write_wav(filename, render(recipe, sample_rate), sample_rate)
+
+
+def _load_manifest(assets_dir):
+    path = os.path.join(assets_dir, MANIFEST_FILE)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _generate_one(name, recipe, assets_dir):
+    filename = os.path.join(assets_dir, f"{name}.wav")
+    write_wav(filename, render(recipe))
+    return name
+
+
+def generate_all(recipes=None, assets_dir=ASSETS_DIR, force=False):
+    """
+    Erzeugt alle Effekte parallel als WAV-Dateien.
+    Effekte, deren Rezept-Hash zur vorhandenen Datei passt, werden übersprungen.
+    Gibt die Namen der neu erzeugten Effekte zurück.
+    """
+    recipes = recipes or SFX_RECIPES
+    os.makedirs(assets_dir, exist_ok=True)
+    manifest = _load_manifest(assets_dir)
+
+    todo = {}
+    for name, recipe in recipes.items():
+        digest = recipe_hash(recipe)
+        path = os.path.join(assets_dir, f"{name}.wav")
+        if not force and manifest.get(name) == digest and os.path.exists(path):
+            continue
+        todo[name] = digest
+
+    with ThreadPoolExecutor() as pool:
+        done = list(pool.map(lambda n: _generate_one(n, recipes[n], assets_dir), todo))
+
+    manifest.update(todo)
+    with open(os.path.join(assets_dir, MANIFEST_FILE), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return done
+
+
+def synthesize_sound(name, recipes=None):
+    """
+    Synthetisiert einen Effekt direkt als pygame.mixer.Sound (ohne WAV-Datei).
+    Der Puffer wird passend zum Format des initialisierten Mixers erzeugt.
+    Gibt None zurück, wenn es kein Rezept gibt oder der Mixer nicht läuft.
+    """
+    import pygame
+
+    recipe = (recipes or SFX_RECIPES).get(name)
+    mixer_format = pygame.mixer.get_init()
+    if recipe is None or mixer_format is None:
+        return None
+    frequency, size, channels = mixer_format
+
+    samples = render(recipe, frequency)
+    if size == 32:
+        data = samples.astype(np.float32)
+    else:
+        data = to_int16(samples)
+    if channels > 1:
+        data = np.repeat(data[:, np.newaxis], channels, axis=1)
+    return pygame.mixer.Sound(buffer=np.ascontiguousarray(data).tobytes())
+
 
 def main():
+    force = "--force" in sys.argv[1:]
     print("Generiere Sound-Effekte...")
-    # Navigations-Klick (kurz, mittlere Frequenz)
-    generate_beep("assets/click.wav", 440, 0.05, volume=0.2)
-    # Bestätigung (zwei Töne aufsteigend)
-    generate_beep("assets/confirm.wav", 880, 0.1, volume=0.3)
-    # Fehler (tief, kurz)
-    generate_beep("assets/error.wav", 110, 0.15, volume=0.4)
-    # Erfolg (fanfare-artig)
-    generate_beep("assets/success.wav", 660, 0.2, volume=0.3)
-    print("Fertig! Sounds in /assets gespeichert.")
+    done = generate_all(force=force)
+    skipped = len(SFX_RECIPES) - len(done)
+    print(f"Fertig! {len(done)} Sounds in /{ASSETS_DIR} gespeichert, {skipped} unverändert.")
+
 
 if __name__ == "__main__":
     main()
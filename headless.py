@@ -0,0 +1,210 @@
+"""
+Headless-Modus für Audio Studio Tycoon - Audio Edition.
+
+Läuft ohne Bildschirm, Soundkarte und Screenreader (SDL-Dummy-Treiber,
+stumme Audio-Ausgabe). Zwei Betriebsarten:
+
+- Menü-Skript: steuert den echten Menü-Stack über Tastensequenzen
+    python headless.py --keys "RETURN text:Mein_Studio RETURN DOWN RETURN"
+- Simulation: treibt GameState direkt über viele Wochen
+    python headless.py --weeks 520 --seed 42 --report report.json
+
+Tasten-Token: UP, DOWN, LEFT, RIGHT, RETURN/ENTER, ESCAPE/ESC,
+BACKSPACE, PAGEUP, PAGEDOWN, HOME, END, einzelne Zeichen,
+"text:..." (tippt jeden Buchstaben, "_" = Leerzeichen) und
+"wait:SEKUNDEN" (lässt die Hauptschleife laufen, z.B. für Entwicklungsphasen).
+"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import json
+import random
+import sys
+import time
+
+import pygame
+
+KEY_NAMES = {
+    "UP": pygame.K_UP,
+    "DOWN": pygame.K_DOWN,
+    "LEFT": pygame.K_LEFT,
+    "RIGHT": pygame.K_RIGHT,
+    "RETURN": pygame.K_RETURN,
+    "ENTER": pygame.K_RETURN,
+    "ESCAPE": pygame.K_ESCAPE,
+    "ESC": pygame.K_ESCAPE,
+    "BACKSPACE": pygame.K_BACKSPACE,
+    "PAGEUP": pygame.K_PAGEUP,
+    "PAGEDOWN": pygame.K_PAGEDOWN,
+    "HOME": pygame.K_HOME,
+    "END": pygame.K_END,
+}
+
+
+def key_event(key, char=""):
+    return pygame.event.Event(pygame.KEYDOWN, key=key, unicode=char, mod=0)
+
+
+def parse_script(script):
+    """Wandelt ein Tasten-Skript in eine Liste von Aktionen um."""
+    actions = []
+    for token in script.split():
+        if token.startswith("wait:"):
+            actions.append(("wait", float(token[5:])))
+        elif token.startswith("text:"):
+            for char in token[5:].replace("_", " "):
+                actions.append(("key", key_event(ord(char.lower()) if char.isalpha() else 0, char)))
+        elif token.upper() in KEY_NAMES:
+            actions.append(("key", key_event(KEY_NAMES[token.upper()])))
+        elif len(token) == 1:
+            actions.append(("key", key_event(ord(token.lower()), token)))
+        else:
+            raise ValueError(f"Unbekanntes Tasten-Token: {token}")
+    return actions
+
+
+def run_script(audio, state, script):
+    """Treibt den echten Menü-Stack mit einem Tasten-Skript."""
+    from game import Game
+
+    game = Game(audio, state, screen=None, loop_mode="event")
+    game.current_menu.announce_entry()
+    for kind, value in parse_script(script):
+        if not game.running:
+            break
+        if kind == "wait":
+            game.run(max_seconds=value)
+        else:
+            game.update()
+            game.dispatch(value)
+    game.update()
+    return {"final_menu": game.current_key}
+
+
+def auto_develop(state):
+    """Einfache Spielstrategie für die Simulation: startet ein passendes Spiel."""
+    from models import GameProject
+    from game_data import (
+        TOPICS, AUDIENCES, SLIDER_NAMES, GAME_SIZES, GENRE_IDEAL_SLIDERS,
+        get_available_platforms, get_compatibility, get_ideal_sliders,
+    )
+
+    topic = random.choice(TOPICS)
+    genre = max(GENRE_IDEAL_SLIDERS, key=lambda g: (get_compatibility(topic, g), random.random()))
+    platforms = [p for p in get_available_platforms(state.week) if p["license_fee"] <= state.money // 4]
+    if not platforms:
+        return None
+    platform = random.choice(platforms)["name"]
+    size = "Klein"
+    for s in GAME_SIZES:
+        if len(state.employees) >= s["min_employees"] and state.money > 200000 * s["cost_multi"]:
+            size = s["name"]
+    ideal = get_ideal_sliders(genre)
+    engine = max(state.engines, key=lambda e: e.tech_level)
+
+    project = GameProject(
+        f"Spiel {state.games_made + 1}", topic, genre,
+        sliders={s: ideal.get(s, 5) for s in SLIDER_NAMES},
+        platform=platform, audience=random.choice(AUDIENCES),
+        engine=engine, size=size,
+    )
+    return state.start_project(project)
+
+
+def simulate(state, weeks):
+    """Treibt GameState direkt über eine Anzahl von Wochen."""
+    state.company_name = state.company_name or "Headless Studio"
+    target_week = state.week + weeks
+    next_release = state.week
+    while state.week < target_week and not state.is_bankrupt():
+        if state.week >= next_release and state.can_start_project():
+            if state.can_hire() and state.money > 150000:
+                best = state.candidate_pool().query()
+                if best:
+                    state.hire_candidate(best[0])
+            for feature in state.get_researchable_features():
+                if state.money > feature["cost"] * 4:
+                    state.research_feature(feature)
+            auto_develop(state)
+            next_release = state.week + random.randint(4, 12)
+        state.advance_week()
+    return {"bankrupt": state.is_bankrupt()}
+
+
+def build_report(args, state, audio, result, elapsed):
+    report = {
+        "seed": args.seed,
+        "mode": "script" if args.keys or args.keys_file else "simulation",
+        "elapsed_seconds": round(elapsed, 3),
+        "week": state.week,
+        "money": state.money,
+        "fans": state.fans,
+        "games_made": state.games_made,
+        "employees": len(state.employees),
+        "high_score": state.high_score,
+        "spoken_lines": audio.spoken_count,
+        "sounds": audio.sound_counts,
+    }
+    if args.weeks:
+        report["weeks"] = args.weeks
+        report["weeks_per_second"] = round(args.weeks / max(elapsed, 1e-9), 1)
+    report.update(result)
+    return report
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Audio Studio Tycoon - Headless-Modus")
+    parser.add_argument("--seed", type=int, default=None, help="Zufalls-Seed für reproduzierbare Läufe")
+    parser.add_argument("--weeks", type=int, default=0, help="Anzahl Wochen, die GameState direkt simuliert")
+    parser.add_argument("--keys", default="", help="Tasten-Skript für den Menü-Stack")
+    parser.add_argument("--keys-file", default=None, help="Datei mit Tasten-Skript")
+    parser.add_argument("--report", default=None, help="Pfad für den JSON-Bericht")
+    parser.add_argument("--echo", action="store_true", help="Sprachausgaben auf der Konsole ausgeben")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    pygame.init()
+    from audio import NullAudioManager
+    from content import load_content_packs
+    from logic import GameState
+
+    load_content_packs()
+    audio = NullAudioManager(echo=args.echo)
+    state = GameState()
+
+    script = args.keys
+    if args.keys_file:
+        with open(args.keys_file, "r", encoding="utf-8") as f:
+            script = f"{script} {f.read()}"
+
+    start = time.perf_counter()
+    result = {}
+    if script.strip():
+        result.update(run_script(audio, state, script))
+    if args.weeks:
+        result.update(simulate(state, args.weeks))
+    elapsed = time.perf_counter() - start
+
+    report = build_report(args, state, audio, result, elapsed)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+    else:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""
+HUD-Anzeige für Audio Studio Tycoon - Audio Edition.
+
+Das Fenster dient nur der Tastatureingabe und zeigt eine kleine
+Statusübersicht. Schriftarten werden einmalig erzeugt, gerenderte
+Texte nach Inhalt gecached, und neu gezeichnet wird nur, wenn sich
+der angezeigte Inhalt tatsächlich geändert hat. Neben mark_dirty()
+(Eingaben, Navigation) wird jeden Durchlauf ein kleiner Schnappschuss
+der angezeigten Werte verglichen, damit auch Änderungen aus
+menu.update() oder Menü-Aktionen ohne Navigation ankommen.
+"""
+
+import pygame
+from game_data import OFFICE_LEVELS
+
+BACKGROUND = (10, 10, 20)
+OVERLAY_COLOR = (200, 200, 80)
+TEXT_CACHE_LIMIT = 256
+
+
+class HudRenderer:
+    def __init__(self, screen):
+        self.screen = screen
+        self.font = pygame.font.SysFont("Arial", 13)
+        self._text_cache = {}     # (Text, Farbe) -> Surface
+        self._last_lines = None
+        self._last_key = None
+        self._dirty = True
+        self._force = True
+
+    def mark_dirty(self):
+        """Spielzustand oder Menü könnten sich geändert haben."""
+        self._dirty = True
+
+    def invalidate(self):
+        """Fensterinhalt verloren (z.B. nach Expose) - komplett neu zeichnen."""
+        self._dirty = True
+        self._force = True
+
+    @staticmethod
+    def state_key(state, menu_key):
+        """Billiger Schnappschuss aller angezeigten Werte (ohne Texte zu bauen)."""
+        trend = state.current_trend
+        return (
+            state.company_name, state.money, state.fans, state.week, state.games_made,
+            state.office_level, len(state.employees), len(state.engines),
+            (trend['topic'], trend['genre']) if trend else None,
+            state.settings.get("language"), menu_key,
+        )
+
+    def render_text(self, text, color):
+        """Rendert einen Text einmalig und liefert danach die gecachte Surface."""
+        key = (text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            if len(self._text_cache) >= TEXT_CACHE_LIMIT:
+                self._text_cache.clear()
+            surface = self.font.render(text, True, color)
+            self._text_cache[key] = surface
+        return surface
+
+    def build_lines(self, state, menu_key, overlay=None):
+        """Alle HUD-Zeilen als (Text, Farbe, Position); overlay: optionale Debug-Zeilen."""
+        office = OFFICE_LEVELS[state.office_level]
+        lines = [
+            (
+                f"[{state.company_name or 'Audio Studio Tycoon'}] "
+                f"{state.get_text('money', money=state.money)} | "
+                f"{state.get_text('fans')}: {state.fans:,} | "
+                f"{state.get_text('week')}: {state.week} | "
+                f"Games: {state.games_made}",
+                (80, 200, 80), (10, 10),
+            ),
+            (
+                f"Büro: {office['name']} | "
+                f"Mitarbeiter: {len(state.employees)}/{office['max_employees']} | "
+                f"Engines: {len(state.engines)}",
+                (100, 150, 200), (10, 30),
+            ),
+            (f"Aktuelles Menü: {menu_key}", (150, 150, 150), (10, 50)),
+        ]
+        if state.current_trend:
+            lines.append((
+                f"TREND: {state.current_trend['topic']} / {state.current_trend['genre']}",
+                (255, 100, 100), (10, 70),
+            ))
+        for i, text in enumerate(overlay or ()):
+            lines.append((text, OVERLAY_COLOR, (10, 95 + i * 16)))
+        lines.append((
+            "Dieses Spiel ist für Screenreader (NVDA) optimiert. "
+            "Das Fenster dient nur der Tastatureingabe.",
+            (60, 60, 60), (10, 275),
+        ))
+        return lines
+
+    def draw(self, state, menu_key, overlay=None):
+        """
+        Zeichnet das HUD, falls nötig.
+        Gibt True zurück, wenn neu gezeichnet wurde (dann display.flip() aufrufen).
+        """
+        try:
+            key = self.state_key(state, menu_key)
+        except Exception:
+            key = None
+        if key != self._last_key:
+            self._last_key = key
+            self._dirty = True
+        if not self._dirty:
+            return False
+        self._dirty = False
+
+        try:
+            lines = self.build_lines(state, menu_key, overlay)
+        except Exception:
+            return False
+        if lines == self._last_lines and not self._force:
+            return False
+        self._last_lines = lines
+        self._force = False
+
+        self.screen.fill(BACKGROUND)
+        for text, color, pos in lines:
+            self.screen.blit(self.render_text(text, color), pos)
+        return True
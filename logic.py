@@ -8,15 +8,23 @@ Spielhistorie, Ereignisse und die Bewertungslogik.
 import random
 import json
 import os
+from collections import deque
 from models import GameProject, ReviewScore, Employee, Engine, EngineFeature
-from translations import TRANSLATIONS
+from roster import Roster
+from catalog import get_catalog
+from candidates import CANDIDATES_PER_SLOT, MAX_POOL, MIN_POOL, CandidatePool
+from charts import Charts
+from competitors import CompetitorMarket
+from pipeline import DEFAULT_TIME_SCALE, STAFF_PER_PROJECT, TIME_SCALES, DevPipeline, phase_weeks
+from staffing import assign_team, phase_summary, slider_bonuses
 from game_data import (
     get_compatibility, get_ideal_sliders, SLIDER_NAMES, GENRES,
-    PLATFORMS, AUDIENCE_MULTI, AUDIENCE_PRICE,
+    AUDIENCE_MULTI, AUDIENCE_PRICE,
     RANDOM_EVENTS, OFFICE_LEVELS, ENGINE_FEATURES,
-    EMPLOYEE_ROLES, DEV_PHASES, GAME_SIZES, MARKETING_CAMPAIGNS,
+    DEV_PHASES, GAME_SIZES, MARKETING_CAMPAIGNS,
     TREND_TOPICS, TREND_GENRES, TRAINING_OPTIONS,
     get_available_platforms, get_available_features,
+    get_platform, get_platform_market,
 )
 
 
@@ -33,14 +41,27 @@ class GameState:
 
         # Trends
         self.current_trend = {}  # {'topic': '...', 'genre': '...', 'week_started': X}
+
+        # Konkurrenz-Studios und Charts
+        self.competitors = CompetitorMarket(seed=random.getrandbits(32), week=self.week)
+        self.charts = Charts()
         self.last_trend_week = 0
 
-        # Mitarbeiter
-        self.employees = []
+        # Mitarbeiter und Bewerber-Markt
+        self.employees = Roster()
+        self.candidates = CandidatePool(seed=random.getrandbits(32), week=self.week)
+        self.staffing_dirty = True   # Team geändert: Phasen neu besetzen
+        self._slider_bonus = {}
+
+        # Projekte in Entwicklung, Meldungen dazu und ungelesene Testberichte
+        self.pipeline = DevPipeline()
+        self.dev_events = deque(maxlen=100)   # (Art, Projekt, Phasenname)
+        self.unread_reviews = []              # Indizes in game_history
 
         # Engines
         self.engines = []
         self.unlocked_features = []  # Liste von EngineFeature (freigeschaltet)
+        self.unlocked_names = set()  # Namen der freigeschalteten Features
         self._init_starter_engine()
 
         # Büro
@@ -68,8 +89,10 @@ class GameState:
         # Einstellungen
         self.settings = {
             "language": "de",
-            "music_enabled": True
+            "music_enabled": True,
+            "time_scale": DEFAULT_TIME_SCALE,
         }
+        self._catalog = get_catalog(self.settings["language"])
 
     def _init_starter_engine(self):
         """Erstellt die Starter-Engine mit Basis-Features."""
@@ -79,6 +102,7 @@ class GameState:
                 feat = EngineFeature(f_data["category"], f_data["name"], f_data["tech_bonus"])
                 starter_features.append(feat)
                 self.unlocked_features.append(feat)
+                self.unlocked_names.add(feat.name)
 
         starter = Engine("Basis-Engine", starter_features)
         self.engines.append(starter)
@@ -99,14 +123,16 @@ class GameState:
 
     def get_text(self, key, **kwargs):
         """Holt einen übersetzten Text basierend auf dem aktuellen Sprach-Setting."""
-        lang = self.settings.get("language", "de")
-        text = TRANSLATIONS.get(lang, TRANSLATIONS['de']).get(key, key)
-        if kwargs:
-            try:
-                return text.format(**kwargs)
-            except Exception:
-                return text
-        return text
+        catalog = self._catalog
+        language = self.settings.get("language", "de")
+        if language != catalog.language and language != catalog.requested_language:
+            catalog = self._catalog = get_catalog(language)
+        return catalog.text(key, kwargs)
+
+    def set_language(self, language):
+        """Wechselt die Sprache (tauscht nur die Katalog-Referenz)."""
+        self.settings["language"] = language
+        self._catalog = get_catalog(language)
 
     # ==========================================================
     # MITARBEITER
@@ -119,17 +145,51 @@ class GameState:
     def can_hire(self):
         return len(self.employees) < self.get_max_employees()
 
-    def generate_candidate(self):
-        """Generiert einen zufälligen Bewerber."""
-        from game_data import EMPLOYEE_SPECIALIZATIONS
-        role_data = random.choice(EMPLOYEE_ROLES)
-        level = random.randint(1, min(3, 1 + self.games_made // 3))
-        
-        spec = None
-        if random.random() < 0.3: # 30% Chance auf Spezialisierung
-            spec = random.choice(EMPLOYEE_SPECIALIZATIONS)
-            
-        return Employee(role_data=role_data, skill_level=level, specialization=spec)
+    def candidate_pool(self):
+        """Bewerber-Pool, auf die aktuelle Woche und Bürogröße gebracht."""
+        size = min(MAX_POOL, max(MIN_POOL, self.get_max_employees() * CANDIDATES_PER_SLOT))
+        self.candidates.sync(self.week, size, self.candidate_level_cap())
+        return self.candidates
+
+    def candidate_level_cap(self):
+        """Höchstes Bewerber-Level (steigt mit der Zahl veröffentlichter Spiele)."""
+        return min(3, 1 + self.games_made // 3)
+
+    def refresh_candidates(self):
+        """Ersetzt alle Bewerber durch neue."""
+        size = min(MAX_POOL, max(MIN_POOL, self.get_max_employees() * CANDIDATES_PER_SLOT))
+        self.candidates.refresh(size, self.candidate_level_cap())
+
+    def hire_candidate(self, index):
+        """Stellt einen Bewerber aus dem Pool ein; gibt den Mitarbeiter oder None zurück."""
+        emp = self.candidates.employee(index)
+        if not self.hire_employee(emp):
+            return None
+        self.candidates.remove(index)
+        return emp
+
+    def hire_candidates(self, indices):
+        """
+        Stellt mehrere Bewerber auf einmal ein, der Reihe nach, solange
+        Plätze und Geld reichen. Gibt die eingestellten Mitarbeiter zurück.
+        """
+        pool = self.candidates
+        indices = list(indices)[:max(0, self.get_max_employees() - len(self.employees))]
+        chosen = []
+        spent = 0
+        for index, salary in zip(indices, pool.salary[indices].tolist()):
+            if spent + salary * 2 > self.money:
+                break
+            spent += salary * 2
+            chosen.append(index)
+        if not chosen:
+            return []
+        hired = [pool.employee(i) for i in chosen]
+        self.money -= spent
+        self.employees.extend(hired)
+        pool.remove(chosen)
+        self.staffing_dirty = True
+        return hired
 
     def hire_employee(self, employee):
         """Stellt einen Mitarbeiter ein."""
@@ -141,12 +201,14 @@ class GameState:
             return False
         self.money -= hire_cost
         self.employees.append(employee)
+        self.staffing_dirty = True
         return True
 
     def fire_employee(self, index):
         """Entlässt einen Mitarbeiter."""
         if 0 <= index < len(self.employees):
             emp = self.employees.pop(index)
+            self.staffing_dirty = True
             # Abfindung = 4 Wochen Gehalt
             self.money -= emp.salary * 4
             return emp
@@ -154,7 +216,7 @@ class GameState:
 
     def pay_salaries(self):
         """Bezahlt alle Gehälter (wöchentlich)."""
-        total = sum(e.salary for e in self.employees)
+        total = self.employees.payroll()
         self.money -= total
         return total
 
@@ -163,12 +225,13 @@ class GameState:
         for _ in range(weeks):
             self.week += 1
             self.pay_salaries()
+            self.employees.add_weeks(1)
             
             # Trends und Zufallsereignisse
             self.check_random_event()
             
             # Verkäufe für aktive Spiele
-            for g in self.game_history:
+            for index, g in enumerate(self.game_history):
                 if g.is_active:
                     g.weeks_on_market += 1
                     # Verkäufe sinken mit der Zeit
@@ -180,14 +243,27 @@ class GameState:
                     g.sales += new_sales
                     g.revenue += new_sales * price
                     self.money += new_sales * price
+                    self.charts.record_game(index, g, self.company_name, new_sales)
                     
                     # Nach 12-20 Wochen oder bei sehr niedrigen Verkäufen vom Markt nehmen
                     if g.weeks_on_market > 20 or new_sales < 100:
                         g.is_active = False
 
+            # Phasenwechsel und Veröffentlichungen laufender Projekte
+            self.advance_projects()
+
+            # Konkurrenz veröffentlicht und verkauft (nimmt Marktanteile), Charts der Woche
+            self.advance_market()
+
             # Fan-Mails & Bugs generieren
             self.process_emails()
 
+    def advance_market(self):
+        """Simuliert die Konkurrenz bis zur aktuellen Woche und schließt die Charts jeder Woche ab."""
+        while self.competitors.week < self.week:
+            self.competitors.step(self.current_trend)
+            self.charts.close_week(self.competitors)
+
     def process_emails(self):
         """Generiert zufällige E-Mails."""
         from models import Email
@@ -245,16 +321,28 @@ class GameState:
 
     def get_team_bonus(self):
         """Gesamtbonus des Teams auf Spielqualität."""
-        if not self.employees:
-            return 0.0
-        return sum(e.quality_contribution for e in self.employees)
+        return self.employees.quality_bonus()
 
     def get_team_slider_bonus(self, slider_name):
-        """Durchschnittlicher Skill-Bonus des Teams für einen Slider."""
+        """Skill-Bonus des Teams für einen Slider (aus den Phasen, in denen er zählt)."""
         if not self.employees:
             return 0.0
-        bonuses = [e.get_slider_bonus(slider_name) for e in self.employees]
-        return sum(bonuses) / len(bonuses)
+        if self.staffing_dirty:
+            self.staff_phases()
+        return self._slider_bonus.get(slider_name, 0.0)
+
+    def staff_phases(self):
+        """Verteilt das Team optimal auf die Entwicklungsphasen (siehe staffing.py)."""
+        for emp, phase in zip(self.employees, assign_team(self.employees, DEV_PHASES)):
+            emp.phase = phase
+        self._slider_bonus = slider_bonuses(self.employees, DEV_PHASES)
+        self.staffing_dirty = False
+
+    def get_phase_staffing(self):
+        """[(Phase, Anzahl, Stärke 0-100)] der aktuellen Besetzung."""
+        if self.staffing_dirty:
+            self.staff_phases()
+        return phase_summary(self.employees, DEV_PHASES)
 
     # ==========================================================
     # ENGINES
@@ -265,12 +353,12 @@ class GameState:
         if self.money < feature_data["cost"]:
             return False
         # Prüfen ob schon freigeschaltet
-        for f in self.unlocked_features:
-            if f.name == feature_data["name"]:
-                return False
+        if feature_data["name"] in self.unlocked_names:
+            return False
         self.money -= feature_data["cost"]
         feat = EngineFeature(feature_data["category"], feature_data["name"], feature_data["tech_bonus"])
         self.unlocked_features.append(feat)
+        self.unlocked_names.add(feat.name)
         return True
 
     def create_engine(self, name, feature_list):
@@ -281,9 +369,8 @@ class GameState:
 
     def get_researchable_features(self):
         """Features die erforschbar, aber noch nicht freigeschaltet sind."""
-        available = get_available_features(self.week)
-        unlocked_names = {f.name for f in self.unlocked_features}
-        return [f for f in available if f["name"] not in unlocked_names]
+        unlocked_names = self.unlocked_names
+        return [f for f in get_available_features(self.week) if f["name"] not in unlocked_names]
 
     # ==========================================================
     # BÜRO
@@ -503,49 +590,121 @@ class GameState:
         mark_data = next((m for m in MARKETING_CAMPAIGNS if m["name"] == project.marketing), MARKETING_CAMPAIGNS[0])
         marketing_multi = mark_data["sales_multi"]
 
-        plat_multi = 1.0
-        for p in PLATFORMS:
-            if p["name"] == project.platform:
-                plat_multi = p["market_multi"]
-                break
+        # Installierte Basis der Plattform in dieser Woche (vorberechnete Kurve)
+        plat_multi = get_platform_market(project.platform, self.week)
 
         audience_multi = AUDIENCE_MULTI.get(project.audience, 1.0)
         rand_m = random.uniform(0.8, 1.2)
 
-        sales = int(base_sales * score_m * fan_bonus * plat_multi * audience_multi * marketing_multi * rand_m)
+        # Konkurrenz im selben Thema/Genre
+        share = self.competitors.sales_factor(project.topic, project.genre)
+
+        sales = int(base_sales * score_m * fan_bonus * plat_multi * audience_multi * marketing_multi * rand_m * share)
         return sales
 
-    def calculate_dev_cost(self, project):
-        """Berechnet Entwicklungskosten inkl. Größe und Marketing."""
+    def calculate_dev_cost(self, project, team=None):
+        """Berechnet Entwicklungskosten inkl. Größe und Marketing (team: siehe _dev_cost_parts)."""
+        return sum(self._dev_cost_parts(project, team))
+
+    def _dev_cost_parts(self, project, team=None):
+        """
+        (Sofortkosten, Gehälter während der Entwicklung). team: Anzahl der
+        Mitarbeiter am Projekt (None = ganzes Team); die Gehälter werden
+        wöchentlich gezahlt und hier nur für die Bilanz geschätzt.
+        """
         # Basis-Kosten basierend auf Größe
         size_data = next((s for s in GAME_SIZES if s["name"] == project.size), GAME_SIZES[1])
         base_cost = 10000 * size_data["cost_multi"]
 
         # Team-Kosten
-        dev_weeks = sum(p["duration_weeks"] for p in DEV_PHASES) * size_data["time_multi"]
-        salary_cost = sum(e.salary for e in self.employees) * dev_weeks
+        dev_weeks = sum(phase_weeks(DEV_PHASES, size_data["time_multi"]))
+        payroll = self.employees.payroll()
+        if team is not None and self.employees:
+            payroll = payroll * team / len(self.employees)
+        salary_cost = payroll * dev_weeks
 
         # Lizenzgebühren
-        license_fee = 0
-        for p in PLATFORMS:
-            if p["name"] == project.platform:
-                license_fee = p["license_fee"]
-                break
+        platform = get_platform(project.platform)
+        license_fee = platform["license_fee"] if platform else 0
 
         # Marketing-Kosten
         mark_data = next((m for m in MARKETING_CAMPAIGNS if m["name"] == project.marketing), MARKETING_CAMPAIGNS[0])
         marketing_cost = mark_data["cost"]
 
-        return int(base_cost + salary_cost + license_fee + marketing_cost)
+        return int(base_cost + license_fee + marketing_cost), int(salary_cost)
+
+    # ==========================================================
+    # ENTWICKLUNGS-PIPELINE
+    # ==========================================================
+
+    def max_parallel_projects(self):
+        """Gleichzeitige Projekte: eins plus eins je STAFF_PER_PROJECT Mitarbeiter."""
+        return 1 + len(self.employees) // STAFF_PER_PROJECT
+
+    def free_staff(self):
+        """Mitarbeiter, die an keinem laufenden Projekt arbeiten."""
+        return max(0, len(self.employees) - self.pipeline.staff_in_use())
+
+    def can_start_project(self):
+        return len(self.pipeline) < self.max_parallel_projects()
+
+    def next_project_team(self):
+        """
+        Teamgröße des nächsten Projekts: die freien Mitarbeiter, gleichmäßig
+        auf die noch offenen Projekt-Plätze verteilt (0, wenn keiner frei ist).
+        """
+        open_slots = self.max_parallel_projects() - len(self.pipeline)
+        if open_slots <= 0:
+            return 0
+        return self.free_staff() // open_slots
+
+    def start_project(self, project):
+        """
+        Startet die Entwicklung eines Projekts mit einem eigenen Team
+        (next_project_team). Sofortkosten werden abgezogen, Gehälter laufen
+        wöchentlich weiter. Gibt den DevJob zurück oder None, wenn kein
+        Platz frei ist.
+        """
+        if not self.can_start_project():
+            return None
+        team = self.next_project_team()
+        upfront, salaries = self._dev_cost_parts(project, team)
+        project.dev_cost = upfront + salaries
+        self.money -= upfront
+
+        size_data = next((s for s in GAME_SIZES if s["name"] == project.size), GAME_SIZES[1])
+        job = self.pipeline.start(project, self.week, team, phase_weeks(DEV_PHASES, size_data["time_multi"]))
+        # Phasen mit 0 Wochen gleich abschließen
+        self.advance_projects()
+        return job
+
+    def advance_projects(self):
+        """Schließt fällige Phasen ab und veröffentlicht fertige Projekte."""
+        for job, phase in self.pipeline.advance(self.week):
+            if phase == len(job.weeks) - 1:
+                self.finalize_game(job.project)
+                self.unread_reviews.append(len(self.game_history) - 1)
+                self.dev_events.append(("released", job.project, None))
+            elif job.weeks[phase + 1] > 0:
+                # Phasen mit 0 Wochen werden nicht angesagt
+                self.dev_events.append(("phase", job.project, DEV_PHASES[phase + 1]["name"]))
+
+    def seconds_per_week(self):
+        """Echtzeit pro Spielwoche beim gewählten Spieltempo."""
+        return TIME_SCALES.get(self.settings.get("time_scale"), TIME_SCALES[DEFAULT_TIME_SCALE])
+
+    def cycle_time_scale(self):
+        """Schaltet zum nächsten Spieltempo."""
+        scales = list(TIME_SCALES)
+        current = self.settings.get("time_scale", DEFAULT_TIME_SCALE)
+        index = scales.index(current) if current in scales else -1
+        self.settings["time_scale"] = scales[(index + 1) % len(scales)]
+        return self.settings["time_scale"]
 
     def finalize_game(self, project):
-        """Schließt die Spielentwicklung ab."""
+        """Veröffentlicht ein fertig entwickeltes Spiel (Kosten wurden beim Start abgezogen)."""
         project.week_developed = self.week
 
-        # Kosten und Marketing abziehen
-        project.dev_cost = self.calculate_dev_cost(project)
-        self.money -= project.dev_cost
-
         project.review = self.calculate_review(project)
         project.sales = self.calculate_sales(project)
 
@@ -557,19 +716,14 @@ class GameState:
         self.games_made += 1
         self.total_revenue += project.revenue
 
-        # Zeit vorrücken
-        size_data = next((s for s in GAME_SIZES if s["name"] == project.size), GAME_SIZES[1])
-        dev_weeks = int(sum(p["duration_weeks"] for p in DEV_PHASES) * size_data["time_multi"])
-        self.week += dev_weeks
-
-        for emp in self.employees:
-            emp.weeks_employed += dev_weeks
-            if project.review and project.review.average >= 7:
-                emp.morale = min(100, emp.morale + 5)
-            elif project.review and project.review.average < 4:
-                emp.morale = max(0, emp.morale - 10)
+        if project.review and project.review.average >= 7:
+            self.employees.adjust_morale(5)
+        elif project.review and project.review.average < 4:
+            self.employees.adjust_morale(-10)
 
         self.game_history.append(project)
+        self.charts.record_game(len(self.game_history) - 1, project, self.company_name, project.sales)
+        self.advance_market()
         return project
 
     # ==========================================================
@@ -581,18 +735,21 @@ class GameState:
         if self.money < train_data["cost"]:
             return False
         
-        emp = self.employees[emp_index]
         self.money -= train_data["cost"]
-        
-        # Skill-Boost auf Primärskill
-        sname = emp.primary_skill
-        emp.skills[sname] = min(100, emp.skills.get(sname, 0) + train_data["skill_boost"])
-        # Kleiner Boost auf Sekundärskill
-        s2 = emp.secondary_skill
-        emp.skills[s2] = min(100, emp.skills.get(s2, 0) + train_data["skill_boost"] // 2)
-        
-        # Gehalt steigt leicht
-        emp.salary = emp._calculate_salary()
+
+        # Primärskill + Boost, Sekundärskill + halber Boost; Gehalt steigt leicht
+        self.employees.train(emp_index, train_data["skill_boost"])
+        self.staffing_dirty = True
+        return True
+
+    def train_team(self, train_data):
+        """Trainiert alle Mitarbeiter auf einmal (Kosten pro Kopf)."""
+        cost = train_data["cost"] * len(self.employees)
+        if not self.employees or self.money < cost:
+            return False
+        self.money -= cost
+        self.employees.train(slice(None), train_data["skill_boost"])
+        self.staffing_dirty = True
         return True
 
     # ==========================================================
@@ -640,6 +797,11 @@ class GameState:
             "last_event_week": self.last_event_week,
             "last_trend_week": self.last_trend_week,
             "current_trend": self.current_trend,
+            "competitors": self.competitors.to_dict(),
+            "charts": self.charts.to_dict(),
+            "candidates": self.candidates.to_dict(),
+            "pipeline": self.pipeline.to_dict(lambda project: project.to_dict()),
+            "unread_reviews": self.unread_reviews,
             "settings": self.settings,
             "game_history": [g.to_dict() for g in self.game_history],
             "employees": [e.to_dict() for e in self.employees],
@@ -681,6 +843,22 @@ class GameState:
                 slots[i] = f"Slot {i}: [LEER]"
         return slots
 
+    def _load_project(self, gd):
+        """Baut ein GameProject aus seinem Speicher-Dict (Engine über den Namen)."""
+        proj = GameProject(
+            gd["name"], gd["topic"], gd["genre"],
+            gd.get("sliders"), gd.get("platform"), gd.get("audience"),
+            engine=next((e for e in self.engines if e.name == gd.get("engine_name")), None),
+            size=gd.get("size", "Mittel"), marketing=gd.get("marketing", "Kein Marketing")
+        )
+        if gd.get("review_scores"):
+            proj.review = ReviewScore(gd["review_scores"])
+        proj.sales = gd.get("sales", 0)
+        proj.revenue = gd.get("revenue", 0)
+        proj.dev_cost = gd.get("dev_cost", 0)
+        proj.week_developed = gd.get("week_developed", 0)
+        return proj
+
     def load_game(self, slot=1):
         """Lädt einen Spielstand aus einem Slot."""
         filepath = f"save_slot_{slot}.json"
@@ -701,6 +879,14 @@ class GameState:
         self.last_event_week = data.get("last_event_week", 0)
         self.last_trend_week = data.get("last_trend_week", 0)
         self.current_trend = data.get("current_trend")
+        if data.get("competitors"):
+            self.competitors = CompetitorMarket.from_dict(data["competitors"])
+        else:
+            self.competitors = CompetitorMarket(seed=random.getrandbits(32), week=self.week)
+        if data.get("candidates"):
+            self.candidates = CandidatePool.from_dict(data["candidates"])
+        else:
+            self.candidates = CandidatePool(seed=random.getrandbits(32), week=self.week)
 
         # Engines laden
         self.unlocked_features = []
@@ -708,6 +894,7 @@ class GameState:
             self.unlocked_features.append(
                 EngineFeature(fd["category"], fd["name"], fd["tech_bonus"])
             )
+        self.unlocked_names = {f.name for f in self.unlocked_features}
 
         self.engines = []
         for ed in data.get("engines", []):
@@ -717,24 +904,22 @@ class GameState:
             ]
             self.engines.append(Engine(ed["name"], features))
 
-        # Spielhistorie laden
-        self.game_history = []
-        for gd in data.get("game_history", []):
-            proj = GameProject(
-                gd["name"], gd["topic"], gd["genre"],
-                gd.get("sliders"), gd.get("platform"), gd.get("audience"),
-                size=gd.get("size", "Mittel"), marketing=gd.get("marketing", "Kein Marketing")
-            )
-            if gd.get("review_scores"):
-                proj.review = ReviewScore(gd["review_scores"])
-            proj.sales = gd.get("sales", 0)
-            proj.revenue = gd.get("revenue", 0)
-            proj.dev_cost = gd.get("dev_cost", 0)
-            proj.week_developed = gd.get("week_developed", 0)
-            self.game_history.append(proj)
+        # Spielhistorie und laufende Projekte laden
+        self.game_history = [self._load_project(gd) for gd in data.get("game_history", [])]
+        self.pipeline = DevPipeline.from_dict(data.get("pipeline", {}), self._load_project)
+        self.unread_reviews = [i for i in data.get("unread_reviews", []) if i < len(self.game_history)]
+        self.dev_events.clear()
+
+        # Charts laden (ältere Spielstände: aus der eigenen Historie aufbauen)
+        if data.get("charts"):
+            self.charts = Charts.from_dict(data["charts"])
+        else:
+            self.charts = Charts()
+            for index, game in enumerate(self.game_history):
+                self.charts.record_game(index, game, self.company_name, 0)
 
         # Mitarbeiter laden
-        self.employees = []
+        employees = []
         for ed in data.get("employees", []):
             emp = Employee.__new__(Employee)
             emp.name = ed["name"]
@@ -747,7 +932,10 @@ class GameState:
             emp.morale = ed["morale"]
             emp.weeks_employed = ed["weeks_employed"]
             emp.specialization = ed.get("specialization")
-            self.employees.append(emp)
+            emp.phase = ed.get("phase")
+            employees.append(emp)
+        self.employees = Roster(employees)
+        self.staffing_dirty = True
 
         # E-Mails laden
         self.emails = []
@@ -758,6 +946,7 @@ class GameState:
             self.emails.append(mail)
 
         self.settings = data.get("settings", {"language": "de", "music_enabled": True})
+        self.settings.setdefault("time_scale", DEFAULT_TIME_SCALE)
 
         self.reset_draft()
         return True
@@ -4,109 +4,126 @@ Hauptprogramm & Spielschleife
 
 100% Screenreader-optimiert (NVDA).
 Steuerung: Pfeiltasten + Enter + Buchstaben für Texteingabe.
+
+Die schweren Module (pygame, Menüs, Spieldaten) werden erst nach der
+ersten Sprachausgabe importiert; Mixer und Sounds starten im Hintergrund.
 """
 
-import pygame
 import time
-from audio import AudioManager
-from logic import GameState
-from menus import (
-    MainMenu,
-    CompanyNameMenu,
-    GameMenu,
-    SettingsMenu,
-    TopicMenu,
-    GenreMenu,
-    PlatformMenu,
-    AudienceMenu,
-    EngineSelectMenu,
-    GameNameMenu,
-    DevelopmentSliderMenu,
-    DevProgressMenu,
-    ReviewResultMenu,
-    HRMenu,
-    HireMenu,
-    FireMenu,
-    ResearchMenu,
-    FeatureResearchMenu,
-    EngineCreateNameMenu,
-    EngineFeatureSelectMenu,
-    OfficeMenu,
-    GameSizeMenu,
-    MarketingMenu,
-    TrainingEmployeeSelectMenu,
-    TrainingOptionMenu,
-    BankruptcyMenu,
-    EmailInboxMenu,
-    EmailDetailMenu,
-    ServiceMenu,
-    GameServiceOptionsMenu,
-    SaveMenu,
-    LoadMenu,
-    HelpMenu,
-)
-
-
-def main():
+
+_PROCESS_START = time.perf_counter()
+
+import argparse
+
+# Modi der Hauptschleife (event_loop.py); hier definiert, weil event_loop
+# pygame lädt und die Argumente vor der ersten Sprachausgabe geprüft werden
+LOOP_MODES = ("event", "poll")
+
+# Menüs, die kurz nach dem Start im Leerlauf vorab erzeugt werden
+PREWARM_MENUS = ["company_name_input", "game_menu", "load_menu", "settings_menu"]
+PREWARM_DELAY = 0.5
+
+
+def key_repeat_arg(value):
+    """'VERZÖGERUNG[,INTERVALL]' in ms -> (Verzögerung, Intervall)."""
+    parts = value.split(",")
+    if len(parts) > 2:
+        raise argparse.ArgumentTypeError(f"höchstens zwei Werte erwartet: {value!r}")
+    try:
+        repeat = [int(v) for v in parts]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"ganze Millisekunden erwartet, z.B. 400,40: {value!r}")
+    if any(v < 0 for v in repeat):
+        raise argparse.ArgumentTypeError(f"Werte dürfen nicht negativ sein: {value!r}")
+    return repeat[0], (repeat[1] if len(repeat) > 1 else 0)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Audio Studio Tycoon - Audio Edition")
+    parser.add_argument(
+        "--loop", choices=LOOP_MODES, default="event",
+        help="Hauptschleife: 'event' blockiert im Leerlauf, 'poll' weckt 30-mal pro Sekunde",
+    )
+    parser.add_argument(
+        "--loop-stats", action="store_true",
+        help="Aufwachvorgänge und CPU-Zeit der Hauptschleife beim Beenden ausgeben",
+    )
+    parser.add_argument(
+        "--max-menus", type=int, default=None,
+        help="Höchstzahl gleichzeitig gehaltener Menüs (selten genutzte werden verworfen)",
+    )
+    parser.add_argument(
+        "--key-repeat", type=key_repeat_arg, default=None, metavar="VERZÖGERUNG,INTERVALL",
+        help="Tasten-Wiederholung in ms (Standard 400,40; '0' schaltet sie aus)",
+    )
+    parser.add_argument(
+        "--no-coalesce", action="store_true",
+        help="Wiederholte Navigationstasten nicht zusammenfassen (jede Taste einzeln ansagen)",
+    )
+    parser.add_argument(
+        "--profile-startup", nargs="?", const="startup_profile.log", default=None, metavar="DATEI",
+        help="Startphasen und Import-Zeiten in eine Logdatei schreiben",
+    )
+    parser.add_argument(
+        "--profile", nargs="?", const="frame_profile.json", default=None, metavar="DATEI",
+        help="Frame-Zeiten und Hot-Paths messen und beim Beenden als JSON speichern (F3: Overlay)",
+    )
+    parser.add_argument(
+        "--startup-only", action="store_true",
+        help="Nach dem Start (erstes Menü angesagt) sofort beenden, z.B. für Benchmarks",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    from startup import StartupProfiler
+    profiler = StartupProfiler(origin=_PROCESS_START, trace_imports=bool(args.profile_startup))
+
+    # ---- Sprachausgabe zuerst ----
+    with profiler.phase("speech"):
+        from speech import SpeechOutput
+        speech = SpeechOutput()
+        speech.speak("Audio Studio Tycoon.")
+    profiler.mark("first_speech")
+
     # ---- Initialisierung ----
-    pygame.init()
-    screen = pygame.display.set_mode((500, 300))
-    pygame.display.set_caption("Audio Studio Tycoon - Audio Edition")
-    audio = AudioManager()
-    audio.speak("Audio Studio Tycoon.")
-    state = GameState()
-
-    # ---- Menü-Instanzen ----
-    menus = {
-        # Haupt-Flow
-        "main_menu": MainMenu(audio, state),
-        "company_name_input": CompanyNameMenu(audio, state),
-        "game_menu": GameMenu(audio, state),
-
-        # Spielentwicklung
-        "topic_menu": TopicMenu(audio, state),
-        "genre_menu": GenreMenu(audio, state),
-        "platform_menu": PlatformMenu(audio, state),
-        "audience_menu": AudienceMenu(audio, state),
-        "game_size_menu": GameSizeMenu(audio, state),
-        "marketing_menu": MarketingMenu(audio, state),
-        "engine_select_menu": EngineSelectMenu(audio, state),
-        "game_name_input": GameNameMenu(audio, state),
-        "slider_menu": DevelopmentSliderMenu(audio, state),
-        "dev_progress_menu": DevProgressMenu(audio, state),
-        "review_result": ReviewResultMenu(audio, state),
-
-        # Personal
-        "hr_menu": HRMenu(audio, state),
-        "hire_menu": HireMenu(audio, state),
-        "fire_menu": FireMenu(audio, state),
-        "training_employee_select": TrainingEmployeeSelectMenu(audio, state),
-        "training_option_select": TrainingOptionMenu(audio, state),
-
-        # Forschung & Engines
-        "research_menu": ResearchMenu(audio, state),
-        "feature_research_menu": FeatureResearchMenu(audio, state),
-        "engine_create_name": EngineCreateNameMenu(audio, state),
-        "engine_feature_select": EngineFeatureSelectMenu(audio, state),
-
-        # Büro
-        "office_menu": OfficeMenu(audio, state),
-
-        # Spezial
-        "bankruptcy": BankruptcyMenu(audio, state),
-        "email_inbox": EmailInboxMenu(audio, state),
-        "email_detail": EmailDetailMenu(audio, state),
-        "service_menu": ServiceMenu(audio, state),
-        "game_service_options": GameServiceOptionsMenu(audio, state),
-        "settings_menu": SettingsMenu(audio, state, lambda: "main_menu"),
-        "settings_menu_ingame": SettingsMenu(audio, state, lambda: "game_menu"),
-        "save_menu": SaveMenu(audio, state),
-        "load_menu": LoadMenu(audio, state),
-        "help_menu": HelpMenu(audio, state),
-    }
-
-    current_key = "main_menu"
-    current_menu = menus[current_key]
+    with profiler.phase("pygame"):
+        import pygame
+        from audio import AudioManager, preinit_mixer
+        preinit_mixer()
+        pygame.display.init()
+        pygame.font.init()
+        screen = pygame.display.set_mode((500, 300))
+        pygame.display.set_caption("Audio Studio Tycoon - Audio Edition")
+        from event_loop import KEY_REPEAT, set_key_repeat
+        if args.key_repeat is None:
+            set_key_repeat(*KEY_REPEAT)
+        else:
+            set_key_repeat(*args.key_repeat)
+
+    with profiler.phase("audio"):
+        audio = AudioManager(speech=speech, start_mixer=False)
+        audio.start_mixer_async(on_ready=lambda: profiler.mark("mixer_ready"))
+
+    with profiler.phase("content"):
+        from content import load_content_packs
+        load_content_packs()
+
+    with profiler.phase("state"):
+        from logic import GameState
+        state = GameState()
+
+    # ---- Menü-Registry (Menüs entstehen bei der ersten Navigation) ----
+    with profiler.phase("menus"):
+        from game import Game
+        from music import MENU_MUSIC_CONTEXTS
+        from profiling import Profiler
+        game = Game(
+            audio, state, screen, loop_mode=args.loop, max_resident_menus=args.max_menus,
+            profiler=Profiler(enabled=bool(args.profile)), coalesce_input=not args.no_coalesce,
+        )
 
     # ---- Willkommensnachricht ----
     audio.speak(
@@ -115,89 +132,23 @@ def main():
         "erforsche Technologien und entwickle Bestseller! "
         "Nutze die Pfeiltasten zum Navigieren und Enter zum Auswählen."
     )
-    time.sleep(0.3)
-    audio.play_music("music_back")
-    current_menu.announce_entry()
+    audio.set_music_context(MENU_MUSIC_CONTEXTS[game.current_key])
+    game.current_menu.announce_entry()
+    profiler.mark("interactive")
+    game.timers.add(PREWARM_DELAY, lambda: game.menus.prewarm(PREWARM_MENUS))
+
+    for name, at, limit in profiler.budget_violations():
+        print(f"[START] {name} nach {at:.3f}s (Budget {limit:.3f}s)")
+    if args.profile_startup:
+        profiler.write(args.profile_startup)
 
     # ---- Hauptschleife ----
-    running = True
-    clock = pygame.time.Clock()
-
-    while running:
-        # Update-Logik (Fortschrittsbalken etc.)
-        if hasattr(current_menu, 'update'):
-            current_menu.update()
-
-        # Pleite-Check
-        if state.is_bankrupt() and current_key != "bankruptcy":
-            current_key = "bankruptcy"
-            current_menu = menus[current_key]
-            current_menu.announce_entry()
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-
-            elif event.type == pygame.KEYDOWN:
-                result = current_menu.handle_input(event)
-
-                if result == "quit":
-                    running = False
-                elif result and result in menus:
-                    current_key = result
-                    current_menu = menus[current_key]
-                    current_menu.announce_entry()
-
-        # Fenster aktualisieren
-        screen.fill((10, 10, 20))
-
-        try:
-            font = pygame.font.SysFont("Arial", 13)
-
-            # Header
-            header = font.render(
-                f"[{state.company_name or 'Audio Studio Tycoon'}] "
-                f"{state.get_text('money', money=state.money)} | "
-                f"{state.get_text('fans')}: {state.fans:,} | "
-                f"{state.get_text('week')}: {state.week} | "
-                f"Games: {state.games_made}",
-                True, (80, 200, 80)
-            )
-            screen.blit(header, (10, 10))
-
-            # Team-Info
-            from game_data import OFFICE_LEVELS
-            office = OFFICE_LEVELS[state.office_level]
-            team_text = font.render(
-                f"Büro: {office['name']} | "
-                f"Mitarbeiter: {len(state.employees)}/{office['max_employees']} | "
-                f"Engines: {len(state.engines)}",
-                True, (100, 150, 200)
-            )
-            screen.blit(team_text, (10, 30))
-
-            # Menü-Info
-            menu_info = font.render(f"Aktuelles Menü: {current_key}", True, (150, 150, 150))
-            screen.blit(menu_info, (10, 50))
-
-            # Trend-Info
-            if state.current_trend:
-                txt = f"TREND: {state.current_trend['topic']} / {state.current_trend['genre']}"
-                trend_v = font.render(txt, True, (255, 100, 100))
-                screen.blit(trend_v, (10, 70))
-
-            # Screenreader-Hinweis
-            hint = font.render(
-                "Dieses Spiel ist für Screenreader (NVDA) optimiert. "
-                "Das Fenster dient nur der Tastatureingabe.",
-                True, (60, 60, 60)
-            )
-            screen.blit(hint, (10, 275))
-        except Exception:
-            pass
-
-        pygame.display.flip()
-        clock.tick(30)
+    if not args.startup_only:
+        game.run()
+    if args.loop_stats:
+        print(f"[LOOP] {args.loop}: {game.stats.summary()}")
+    if args.profile:
+        game.profiler.write(args.profile)
 
     # ---- Aufräumen ----
     audio.cleanup()
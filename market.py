@@ -0,0 +1,135 @@
+"""
+Plattform-Marktmodell für Audio Studio Tycoon - Audio Edition.
+
+Jede Plattform hat eine installierte Basis, die sich über ihren
+Lebenszyklus (available_week bis end_week) ändert: zum Start verkauft
+sich wenig, auf dem Höhepunkt am meisten, zum Ende hin und danach immer
+weniger. Plattformen ohne Ende wachsen bis zur Reife und bleiben dann
+stabil. Der Faktor multipliziert den festen market_multi der Plattform.
+
+Die Kurven werden beim Laden einmal für jede Woche des Zyklus berechnet
+(NumPy, alle Plattformen in einem Durchgang). Eine Abfrage ist danach ein
+Dict-Zugriff plus ein Array-Index; vor dem Start gilt der erste, nach dem
+Ende der Kurve der letzte Wert.
+"""
+
+from array import array
+
+import numpy as np
+
+# Anteil der Spitzen-Nachfrage in der Startwoche
+LAUNCH_SHARE = 0.5
+# Höhepunkt: Faktor und Zeitpunkt (Anteil am Lebenszyklus)
+PEAK_SHARE = 1.3
+PEAK_AT = 0.35
+# Faktor in der letzten Woche
+END_SHARE = 0.6
+# Nach dem Ende halbiert sich die Nachfrage alle HALF_LIFE Wochen ...
+HALF_LIFE = 10
+# ... für so viele Halbwertszeiten, danach bleibt sie konstant
+TAIL_HALF_LIVES = 4
+# Plattformen ohne Ende: Wochen bis zur Reife (Faktor 1.0)
+MATURE_WEEKS = 52
+# Höchstzahl vorberechneter Werte pro Plattform (längere Zyklen in gröberen Schritten)
+MAX_POINTS = 512
+# Wochen, über die der Trend in der Marktübersicht bestimmt wird
+TREND_WEEKS = 4
+
+
+def _smoothstep(x):
+    x = np.clip(x, 0.0, 1.0)
+    return x * x * (3.0 - 2.0 * x)
+
+
+def _share(t, life, open_ended):
+    """Faktor zur Woche t nach dem Start (alle Argumente elementweise)."""
+    mature = LAUNCH_SHARE + (1.0 - LAUNCH_SHARE) * _smoothstep(t / MATURE_WEEKS)
+    peak = np.maximum(1.0, life * PEAK_AT)
+    rise = LAUNCH_SHARE + (PEAK_SHARE - LAUNCH_SHARE) * _smoothstep(t / peak)
+    fall = PEAK_SHARE + (END_SHARE - PEAK_SHARE) * _smoothstep((t - peak) / np.maximum(1.0, life - peak))
+    tail = END_SHARE * 0.5 ** (np.maximum(t - life, 0.0) / HALF_LIFE)
+    cycle = np.where(t <= peak, rise, np.where(t <= life, fall, tail))
+    return np.where(open_ended, mature, cycle)
+
+
+def curve_weeks(start, end):
+    """Anzahl der Wochen ab start, über die sich der Faktor noch ändert."""
+    if end is None:
+        return MATURE_WEEKS + 1
+    return max(1, end - start) + HALF_LIFE * TAIL_HALF_LIVES + 1
+
+
+def install_curve(start, end):
+    """Faktor der installierten Basis für jede Woche ab start (NumPy-Array)."""
+    t = np.arange(curve_weeks(start, end), dtype=float)
+    return _share(t, max(1, (end or start) - start), end is None)
+
+
+class PlatformMarket:
+    """
+    Vorberechnete Markt-Multiplikatoren aller Plattformen je Woche.
+
+    Alle Kurven liegen hintereinander in einem flachen Array (offsets
+    zeigt auf den Anfang jeder Plattform). Sehr lange Lebenszyklen werden
+    mit höchstens MAX_POINTS Stützstellen abgelegt (eine pro step Wochen).
+    """
+
+    def __init__(self, platforms):
+        self.platforms = list(platforms)
+        self.index = {p["name"]: i for i, p in enumerate(self.platforms)}
+        count = len(self.platforms)
+        starts = np.array([p.get("available_week", 1) for p in self.platforms], dtype=np.int64)
+        ends = [p.get("end_week") for p in self.platforms]
+        open_ended = np.array([end is None for end in ends], dtype=bool)
+        weeks = np.array([curve_weeks(s, e) for s, e in zip(starts.tolist(), ends)], dtype=np.int64)
+        life = np.maximum(1, np.array([e or s for s, e in zip(starts.tolist(), ends)], dtype=np.int64) - starts)
+        steps = -(-weeks // MAX_POINTS)
+        points = -(-weeks // steps)
+        offsets = np.zeros(count, dtype=np.int64)
+        np.cumsum(points[:-1], out=offsets[1:])
+
+        # Eine Auswertung für alle Stützstellen aller Plattformen
+        owner = np.repeat(np.arange(count), points)
+        t = (np.arange(points.sum()) - offsets[owner]) * steps[owner]
+        multis = np.array([p.get("market_multi", 1.0) for p in self.platforms], dtype=float)
+        values = _share(t.astype(float), life[owner], open_ended[owner]) * multis[owner]
+
+        self.starts = starts.tolist()
+        self.steps = steps.tolist()
+        self.last = (offsets + points - 1).tolist()
+        self.offsets = offsets.tolist()
+        self.values = array("d", values.round(4).tobytes())
+
+    def __len__(self):
+        return len(self.platforms)
+
+    def multiplier(self, name, week):
+        """Markt-Multiplikator der Plattform in Woche week (1.0 für unbekannte)."""
+        i = self.index.get(name)
+        if i is None:
+            return 1.0
+        offset = week - self.starts[i]
+        if offset <= 0:
+            return self.values[self.offsets[i]]
+        return self.values[min(self.offsets[i] + offset // self.steps[i], self.last[i])]
+
+    def platform(self, name):
+        """Plattform-Eintrag zum Namen (oder None)."""
+        i = self.index.get(name)
+        return None if i is None else self.platforms[i]
+
+    def trend(self, name, week):
+        """-1 fallend, 0 stabil, 1 wachsend (Vergleich mit TREND_WEEKS zuvor)."""
+        now = self.multiplier(name, week)
+        before = self.multiplier(name, week - TREND_WEEKS)
+        if now > before * 1.02:
+            return 1
+        if now < before * 0.98:
+            return -1
+        return 0
+
+    def overview(self, platforms, week):
+        """[(Name, Multiplikator, Trend)] der übergebenen Plattformen, größter Markt zuerst."""
+        rows = [(p["name"], self.multiplier(p["name"], week), self.trend(p["name"], week)) for p in platforms]
+        rows.sort(key=lambda row: row[1], reverse=True)
+        return rows
@@ -8,17 +8,22 @@ Menü-Typen:
 - Menu: Standard-Auswahl (Auf/Ab + Enter)
 - TextInputMenu: Texteingabe (Buchstaben tippen, Backspace, Enter)
 - SliderMenu: Slider-Verteilung (Auf/Ab = Slider, Links/Rechts = Wert)
+
+In Auswahl-Menüs springen getippte Buchstaben zum passenden Eintrag.
 """
 
 import pygame
-import time
+from collections import OrderedDict
+from typeahead import PrefixIndex, TypeAhead
+from translations import available_languages
+from candidates import ANY_SPECIALIZATION, SALARY_LIMITS
 from models import GameProject, ReviewScore
 from game_data import (
     TOPICS, GENRES, SLIDER_NAMES, PLATFORMS, AUDIENCES,
     OFFICE_LEVELS, ENGINE_FEATURES, GAME_SIZES, MARKETING_CAMPAIGNS,
-    TRAINING_OPTIONS,
-    get_compatibility, get_compatibility_text,
-    get_available_platforms, get_available_features,
+    TRAINING_OPTIONS, EMPLOYEE_ROLES, EMPLOYEE_SPECIALIZATIONS, DEV_PHASES,
+    get_compatibility, get_compatibility_text, genres_by_compatibility,
+    get_available_platforms, get_available_features, get_market_overview,
 )
 # logic.py: Spielzustand
 
@@ -29,17 +34,34 @@ from game_data import (
 
 class Menu:
     def __init__(self, title, options, audio, game_state):
+        self._jump_version = 0
         self.title = title
         self.options = options
         self.audio = audio
         self.game_state = game_state
         self.current_index = 0
+        self._typeahead = TypeAhead()
+        self._jump_index = None
+        self._jump_signature = None
+
+    @property
+    def options(self):
+        return self._options
+
+    @options.setter
+    def options(self, options):
+        # Neue Einträge: Type-Ahead-Index beim nächsten Tastendruck neu bauen
+        self._options = options
+        self.invalidate_jump()
+
+    def invalidate_jump(self):
+        """Nach Änderungen an Einträgen (Texte, Reihenfolge) aufrufen, die nicht über options = ... laufen."""
+        self._jump_version += 1
 
     def speak_current(self, interrupt=True):
         if self.options:
             text = self.options[self.current_index]['text']
-            pos = f"{self.current_index + 1} von {len(self.options)}"
-            # TODO: Translate pos
+            pos = self.game_state.get_text('position', index=self.current_index + 1, total=len(self.options))
             self.audio.speak(f"{text}. {pos}", interrupt=interrupt)
 
     def announce_entry(self):
@@ -51,12 +73,15 @@ class Menu:
     def handle_input(self, event):
         if not self.options:
             return None
+        if self._handle_typeahead(event):
+            return None
+        steps = getattr(event, 'count', 1)  # zusammengefasste Auto-Repeat-Tasten
         if event.key == pygame.K_UP:
-            self.current_index = (self.current_index - 1) % len(self.options)
+            self.current_index = (self.current_index - steps) % len(self.options)
             self.audio.play_sound("click")
             self.speak_current()
         elif event.key == pygame.K_DOWN:
-            self.current_index = (self.current_index + 1) % len(self.options)
+            self.current_index = (self.current_index + steps) % len(self.options)
             self.audio.play_sound("click")
             self.speak_current()
         elif event.key == pygame.K_RETURN:
@@ -69,6 +94,151 @@ class Menu:
     def update(self):
         pass
 
+    # ---------- Type-Ahead ----------
+
+    def jump_texts(self):
+        """Texte, in denen per Type-Ahead gesucht wird (Reihenfolge = Options-Index)."""
+        return [option['text'] for option in self.options]
+
+    def jump_signature(self):
+        """Ändert sich, sobald der Präfix-Index neu gebaut werden muss."""
+        return (self._jump_version, len(self.options))
+
+    def jump_index(self):
+        signature = self.jump_signature()
+        if self._jump_index is None or signature != self._jump_signature:
+            self._jump_index = PrefixIndex(self.jump_texts())
+            self._jump_signature = signature
+        return self._jump_index
+
+    def _handle_typeahead(self, event):
+        """Verarbeitet druckbare Zeichen als Sprung-Eingabe; True, wenn verbraucht."""
+        char = getattr(event, 'unicode', '')
+        if not (char and len(char) == 1 and char.isprintable()):
+            self._typeahead.reset()
+            return False
+        target = self._typeahead.feed(char, self.jump_index(), self.current_index)
+        if target is None:
+            self.audio.play_sound("error")
+        elif target != self.current_index:
+            self.current_index = target
+            self.audio.play_sound("click")
+            self.speak_current()
+        return True
+
+
+# ============================================================
+# VIRTUELLE LISTE (sehr viele Einträge)
+# ============================================================
+
+class VirtualListMenu(Menu):
+    """
+    Menü für lange Listen (E-Mails, Spiele-Historie, ...).
+
+    Einträge werden per Index aus einer Datenquelle geholt statt als
+    Options-Liste aufgebaut; Text entsteht nur für den fokussierten
+    Eintrag. Unterklassen implementieren item_count(), item_text(i) und
+    select_item(i). Feste Einträge (z.B. "Zurück") stehen in
+    self.fixed_options und folgen nach den Listeneinträgen.
+
+    Bild auf/ab springt PAGE_SIZE Einträge, Pos1/Ende an Anfang/Ende.
+    Für Type-Ahead werden beim ersten Tastendruck alle Suchtexte
+    (jump_key) einmal erzeugt und indiziert.
+    """
+
+    PAGE_SIZE = 10
+
+    def __init__(self, title, audio, game_state, fixed_options=None):
+        super().__init__(title, [], audio, game_state)
+        self.fixed_options = fixed_options or []
+
+    def item_count(self):
+        return 0
+
+    def item_text(self, index):
+        return ""
+
+    def select_item(self, index):
+        return None
+
+    def option_count(self):
+        return self.item_count() + len(self.fixed_options)
+
+    def option_text(self, index):
+        count = self.item_count()
+        if index < count:
+            return self.item_text(index)
+        return self.fixed_options[index - count]['text']
+
+    def speak_current(self, interrupt=True):
+        total = self.option_count()
+        if total:
+            self.current_index = min(self.current_index, total - 1)
+            text = self.option_text(self.current_index)
+            pos = self.game_state.get_text('position', index=self.current_index + 1, total=total)
+            self.audio.speak(f"{text}. {pos}", interrupt=interrupt)
+
+    def _move_to(self, index):
+        self.current_index = index
+        self.audio.play_sound("click")
+        self.speak_current()
+
+    def item_jump_key(self, index):
+        """Suchtext eines Listeneintrags für Type-Ahead (Standard: der vorgelesene Text)."""
+        return self.item_text(index)
+
+    def jump_key(self, index):
+        count = self.item_count()
+        if index < count:
+            return self.item_jump_key(index)
+        return self.fixed_options[index - count]['text']
+
+    def jump_texts(self):
+        return [self.jump_key(i) for i in range(self.option_count())]
+
+    @property
+    def fixed_options(self):
+        return self._fixed_options
+
+    @fixed_options.setter
+    def fixed_options(self, options):
+        self._fixed_options = options
+        self.invalidate_jump()
+
+    def jump_signature(self):
+        # Unterklassen rufen invalidate_jump() auf, wenn sie ihre Einträge neu aufbauen;
+        # die Anzahl fängt Änderungen an fremden Listen (Mitarbeiter, E-Mails) ab.
+        return (self._jump_version, self.option_count())
+
+    def handle_input(self, event):
+        total = self.option_count()
+        if not total:
+            return None
+        if self._handle_typeahead(event):
+            return None
+        steps = getattr(event, 'count', 1)
+        if event.key == pygame.K_UP:
+            self._move_to((self.current_index - steps) % total)
+        elif event.key == pygame.K_DOWN:
+            self._move_to((self.current_index + steps) % total)
+        elif event.key == pygame.K_PAGEUP:
+            self._move_to(max(0, self.current_index - self.PAGE_SIZE * steps))
+        elif event.key == pygame.K_PAGEDOWN:
+            self._move_to(min(total - 1, self.current_index + self.PAGE_SIZE * steps))
+        elif event.key == pygame.K_HOME:
+            self._move_to(0)
+        elif event.key == pygame.K_END:
+            self._move_to(total - 1)
+        elif event.key == pygame.K_RETURN:
+            self.audio.play_sound("confirm")
+            count = self.item_count()
+            if self.current_index < count:
+                return self.select_item(self.current_index)
+            action = self.fixed_options[self.current_index - count].get('action')
+            if action:
+                return action()
+        return None
+
 
 # ============================================================
 # TEXTEINGABE-MENÜ
@@ -86,24 +256,24 @@ class TextInputMenu:
 
     def announce_entry(self):
         self.text = ""
-        self.audio.speak(f"{self.title}. {self.prompt} Tippe den Namen und drücke Enter.")
+        self.audio.speak(f"{self.title}. {self.prompt} {self.game_state.get_text('typing_prompt')}")
 
     def handle_input(self, event):
         if event.key == pygame.K_RETURN:
             if self.text.strip():
                 self.audio.play_sound("confirm")
-                self.audio.speak(f"Bestätigt: {self.text}")
+                self.audio.speak(self.game_state.get_text('confirmed', text=self.text))
                 return self.on_confirm(self.text.strip())
             else:
-                self.audio.speak("Bitte gib einen Namen ein.")
+                self.audio.speak(self.game_state.get_text('enter_name'))
         elif event.key == pygame.K_BACKSPACE:
             if self.text:
                 removed = self.text[-1]
                 self.text = self.text[:-1]
-                remaining = self.text if self.text else "leer"
-                self.audio.speak(f"{removed} gelöscht. Aktuell: {remaining}")
+                remaining = self.text if self.text else self.game_state.get_text('input_empty_short')
+                self.audio.speak(self.game_state.get_text('delete_char', char=removed, text=remaining))
             else:
-                self.audio.speak("Eingabe ist leer.")
+                self.audio.speak(self.game_state.get_text('empty_input'))
         elif event.key == pygame.K_ESCAPE:
             return self.on_cancel()
         elif event.unicode and event.unicode.isprintable() and len(event.unicode) == 1:
@@ -130,26 +300,34 @@ class SettingsMenu:
 
     def _update_options(self):
         s = self.game_state.settings
-        lang_name = "Deutsch" if s['language'] == 'de' else "English"
+        lang_name = self.game_state.get_text('language_name')
         music_status = self.game_state.get_text('on') if s['music_enabled'] else self.game_state.get_text('off')
 
+        scale = self.game_state.get_text('time_scale_' + s.get('time_scale', 'normal'))
+
         self.options = [
             {'text': f"{self.game_state.get_text('music')}: {music_status}", 'action': self._toggle_music},
             {'text': f"{self.game_state.get_text('language')}: {lang_name}", 'action': self._toggle_language},
+            {'text': self.game_state.get_text('time_scale_option', value=scale), 'action': self._toggle_time_scale},
             {'text': self.game_state.get_text('back'), 'action': self.on_back}
         ]
 
     def _toggle_music(self):
         self.game_state.settings['music_enabled'] = not self.game_state.settings['music_enabled']
         self.audio.set_music_enabled(self.game_state.settings['music_enabled'])
-        if self.game_state.settings['music_enabled']:
-            self.audio.play_music("music_back")
+        self._update_options()
+        self.speak_current()
+
+    def _toggle_time_scale(self):
+        self.game_state.cycle_time_scale()
         self._update_options()
         self.speak_current()
 
     def _toggle_language(self):
-        new_lang = 'en' if self.game_state.settings['language'] == 'de' else 'de'
-        self.game_state.settings['language'] = new_lang
+        languages = available_languages() or ['de']
+        current = self.game_state.settings['language']
+        new_lang = languages[(languages.index(current) + 1) % len(languages)] if current in languages else languages[0]
+        self.game_state.set_language(new_lang)
         self._update_options()
         self.audio.speak(self.game_state.get_text('language'))
         self.speak_current()
@@ -164,12 +342,13 @@ class SettingsMenu:
         self.speak_current(interrupt=False)
 
     def handle_input(self, event):
+        steps = getattr(event, 'count', 1)
         if event.key == pygame.K_UP:
-            self.current_index = (self.current_index - 1) % len(self.options)
+            self.current_index = (self.current_index - steps) % len(self.options)
             self.audio.play_sound("click")
             self.speak_current()
         elif event.key == pygame.K_DOWN:
-            self.current_index = (self.current_index + 1) % len(self.options)
+            self.current_index = (self.current_index + steps) % len(self.options)
             self.audio.play_sound("click")
             self.speak_current()
         elif event.key == pygame.K_RETURN:
@@ -210,9 +389,7 @@ class SliderMenu:
         self._enter_warned = False
         self.audio.speak(
             f"{self.title}. "
-            f"Verteile {self.budget} Punkte auf {len(self.slider_names)} Bereiche. "
-            f"Auf und Ab zum Wechseln. Links und Rechts zum Ändern. "
-            f"Enter zum Bestätigen."
+            + self.game_state.get_text('slider_intro', budget=self.budget, count=len(self.slider_names))
         )
         self._speak_current()
 
@@ -220,18 +397,20 @@ class SliderMenu:
         name = self.slider_names[self.current_index]
         val = self.values[name]
         self.audio.speak(
-            f"{name}: {val} von 10. "
-            f"Verbleibend: {self.remaining} Punkte. "
-            f"Slider {self.current_index + 1} von {len(self.slider_names)}.",
+            self.game_state.get_text(
+                'slider_value', name=name, value=val, remaining=self.remaining,
+                index=self.current_index + 1, total=len(self.slider_names),
+            ),
             interrupt=True
         )
 
     def handle_input(self, event):
+        steps = getattr(event, 'count', 1)
         if event.key == pygame.K_UP:
-            self.current_index = (self.current_index - 1) % len(self.slider_names)
+            self.current_index = (self.current_index - steps) % len(self.slider_names)
             self._speak_current()
         elif event.key == pygame.K_DOWN:
-            self.current_index = (self.current_index + 1) % len(self.slider_names)
+            self.current_index = (self.current_index + steps) % len(self.slider_names)
             self._speak_current()
         elif event.key == pygame.K_RIGHT:
             name = self.slider_names[self.current_index]
@@ -241,10 +420,10 @@ class SliderMenu:
                 self._speak_current()
             elif self.remaining <= 0:
                 self.audio.play_sound("error")
-                self.audio.speak("Keine Punkte mehr übrig.")
+                self.audio.speak(self.game_state.get_text('slider_no_points'))
             else:
                 self.audio.play_sound("error")
-                self.audio.speak("Maximum erreicht.")
+                self.audio.speak(self.game_state.get_text('slider_max'))
         elif event.key == pygame.K_LEFT:
             name = self.slider_names[self.current_index]
             if self.values[name] > 0:
@@ -253,14 +432,14 @@ class SliderMenu:
                 self._speak_current()
             else:
                 self.audio.play_sound("error")
-                self.audio.speak("Bereits auf Null.")
+                self.audio.speak(self.game_state.get_text('slider_zero'))
         elif event.key == pygame.K_RETURN:
             if self.remaining > 0:
                 if hasattr(self, '_enter_warned') and self._enter_warned:
                     self.audio.play_sound("confirm")
                     return self.on_confirm(dict(self.values))
                 self.audio.play_sound("error")
-                self.audio.speak(f"Noch {self.remaining} Punkte übrig. Nochmal Enter zum Bestätigen.")
+                self.audio.speak(self.game_state.get_text('slider_points_left', remaining=self.remaining))
                 self._enter_warned = True
             else:
                 self.audio.play_sound("confirm")
@@ -295,7 +474,7 @@ class MainMenu(Menu):
         return "settings_menu"
 
     def new_game(self):
-        self.audio.speak("Neues Spiel wird gestartet...")
+        self.audio.speak(self.game_state.get_text('starting_new_game'))
         return "company_name_input"
 
     def load_game(self):
@@ -313,7 +492,7 @@ class MainMenu(Menu):
 class CompanyNameMenu(TextInputMenu):
     def __init__(self, audio, game_state):
         super().__init__(
-            title="Firmengründung", # TODO: Translate
+            title=game_state.get_text('company_founding'),
             prompt=game_state.get_text('company_name_prompt'),
             audio=audio,
             game_state=game_state,
@@ -323,12 +502,7 @@ class CompanyNameMenu(TextInputMenu):
 
     def _confirm(self, name):
         self.game_state.company_name = name
-        self.audio.speak(
-            f"Willkommen bei {name}! "
-            f"Du hast {self.game_state.money:,} Euro Startkapital. "
-            f"Du startest in einer Garage. "
-            f"Zeit, dein erstes Spiel zu entwickeln!"
-        )
+        self.audio.speak(self.game_state.get_text('welcome_company', name=name, money=self.game_state.money))
         return "game_menu"
 
     def _cancel(self):
@@ -346,12 +520,14 @@ class GameMenu(Menu):
         options = [
             {'text': game_state.get_text('company_overview'), 'action': self.show_status},
             {'text': game_state.get_text('develop_new_game'), 'action': self.new_game},
+            {'text': game_state.get_text('projects'), 'action': self.goto_projects},
             {'text': game_state.get_text('hr_department'), 'action': self.goto_hr},
             {'text': game_state.get_text('research_engines'), 'action': self.goto_research},
             {'text': game_state.get_text('service_support'), 'action': self.goto_service},
             {'text': game_state.get_text('inbox'), 'action': self.goto_inbox},
             {'text': game_state.get_text('upgrade_office'), 'action': self.goto_office},
             {'text': game_state.get_text('history'), 'action': self.show_history},
+            {'text': game_state.get_text('charts'), 'action': self.goto_charts},
             {'text': game_state.get_text('save_game'), 'action': self.goto_save},
             {'text': game_state.get_text('wiki'), 'action': self.goto_help},
             {'text': game_state.get_text('settings'), 'action': self.goto_settings},
@@ -364,9 +540,7 @@ class GameMenu(Menu):
         # Zufallsereignis prüfen
         event = self.game_state.check_random_event()
         if event:
-            self.audio.speak(
-                f"Ereignis: {event['title']}! {event['text']}"
-            )
+            self.audio.speak(self.game_state.get_text('random_event', title=event['title'], text=event['text']))
         self.audio.speak(
             f"{self.game_state.get_text('management_center')} - {self.game_state.company_name}. "
             f"{self.game_state.get_text('week')} {self.game_state.week}.",
@@ -385,9 +559,15 @@ class GameMenu(Menu):
         return None
 
     def new_game(self):
+        if not self.game_state.can_start_project():
+            self.audio.speak(self.game_state.get_text('no_free_team', max=self.game_state.max_parallel_projects()))
+            return None
         self.game_state.reset_draft()
         return "topic_menu"
 
+    def goto_projects(self):
+        return "dev_progress_menu"
+
     def goto_hr(self):
         return "hr_menu"
 
@@ -402,12 +582,12 @@ class GameMenu(Menu):
 
     def show_history(self):
         if not self.game_state.game_history:
-            self.audio.speak(self.game_state.get_text('history') + ": Leer.")
+            self.audio.speak(self.game_state.get_text('history_empty'))
             return None
-        self.audio.speak(f"{self.game_state.get_text('history')}: {len(self.game_state.game_history)}.")
-        for i, game in enumerate(self.game_state.game_history[-5:], 1):
-            self.audio.speak(f"{i}. {game.summary()}", interrupt=False)
-        return None
+        return "history_menu"
+
+    def goto_charts(self):
+        return "charts_menu"
 
     def goto_save(self):
         return "save_menu"
@@ -420,6 +600,96 @@ class GameMenu(Menu):
         return "main_menu"
 
 
+class HistoryMenu(VirtualListMenu):
+    """Alle veröffentlichten Spiele, neueste zuerst."""
+
+    def __init__(self, audio, game_state):
+        super().__init__(
+            game_state.get_text('history'), audio, game_state,
+            fixed_options=[{'text': game_state.get_text('back'), 'action': lambda: "game_menu"}],
+        )
+
+    def announce_entry(self):
+        self.current_index = 0
+        self.audio.speak(f"{self.title}: {self.item_count()}.")
+        self.speak_current(interrupt=False)
+
+    def item_count(self):
+        return len(self.game_state.game_history)
+
+    def item_text(self, index):
+        history = self.game_state.game_history
+        return history[len(history) - 1 - index].summary()
+
+    def select_item(self, index):
+        self.speak_current()
+        return None
+
+
+class ChartsMenu(VirtualListMenu):
+    """Wochen-Charts und Bestenlisten (eigene und Konkurrenz-Spiele); Links/Rechts wechselt die Liste."""
+
+    # (Chart, Titel-Schlüssel, Eintrags-Schlüssel)
+    CHARTS = [
+        ("weekly", "chart_weekly", "chart_entry_sales"),
+        ("sales", "chart_sales", "chart_entry_sales"),
+        ("revenue", "chart_revenue", "chart_entry_revenue"),
+        ("review", "chart_review", "chart_entry_review"),
+    ]
+
+    def __init__(self, audio, game_state):
+        super().__init__(
+            game_state.get_text('charts'), audio, game_state,
+            fixed_options=[{'text': game_state.get_text('back'), 'action': lambda: "game_menu"}],
+        )
+        self.chart = 0
+        self.rows = []
+
+    def announce_entry(self):
+        self.audio.speak(f"{self.title}. {self.game_state.get_text('charts_switch')}")
+        self._show_chart(interrupt=False)
+
+    def _show_chart(self, interrupt=True):
+        metric, title_key, _ = self.CHARTS[self.chart]
+        self.rows = self.game_state.charts.top(metric)
+        self.invalidate_jump()
+        self.current_index = 0
+        chart = self.game_state.get_text(title_key)
+        if self.rows:
+            heading = self.game_state.get_text(
+                'chart_heading', chart=chart, week=self.game_state.week, count=len(self.rows))
+        else:
+            heading = self.game_state.get_text('charts_empty', chart=chart)
+        self.audio.speak(heading, interrupt=interrupt)
+        self.speak_current(interrupt=False)
+
+    def handle_input(self, event):
+        if event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+            step = 1 if event.key == pygame.K_RIGHT else -1
+            self.chart = (self.chart + step) % len(self.CHARTS)
+            self.audio.play_sound("click")
+            self._show_chart()
+            return None
+        return super().handle_input(event)
+
+    def item_count(self):
+        return len(self.rows)
+
+    def item_text(self, index):
+        title, studio, value = self.rows[index]
+        metric, _, entry_key = self.CHARTS[self.chart]
+        value = f"{value:.1f}" if metric == "review" else f"{int(value):,}"
+        return self.game_state.get_text(entry_key, rank=index + 1, title=title, studio=studio, value=value)
+
+    def item_jump_key(self, index):
+        # Type-Ahead springt über den Spieltitel, nicht über den Rang
+        return self.rows[index][0]
+
+    def select_item(self, index):
+        self.speak_current()
+        return None
+
+
 # ============================================================
 # SPIELENTWICKLUNG: THEMA → GENRE → PLATTFORM → ZIELGRUPPE → ENGINE → NAME → SLIDER → REVIEW
 # ============================================================
@@ -434,7 +704,7 @@ class TopicMenu(Menu):
 
     def _select(self, topic):
         self.game_state.current_draft['topic'] = topic
-        self.audio.speak(f"Thema: {topic}")
+        self.audio.speak(self.game_state.get_text('topic_selected', topic=topic))
         return "genre_menu"
 
     def _cancel(self):
@@ -442,17 +712,24 @@ class TopicMenu(Menu):
 
 
 class GenreMenu(Menu):
+    """Genre-Auswahl; die zum gewählten Thema passendsten Genres stehen oben."""
+
     def __init__(self, audio, game_state):
-        options = []
-        for genre in GENRES:
-            options.append({'text': genre, 'action': lambda g=genre: self._select(g)})
+        super().__init__(game_state.get_text('select_genre'), self._build_options(GENRES, game_state), audio, game_state)
+        self._sorted_for = None
+
+    def _build_options(self, genres, game_state):
+        options = [{'text': genre, 'action': lambda g=genre: self._select(g)} for genre in genres]
         options.append({'text': game_state.get_text('back'), 'action': self._cancel})
-        super().__init__(game_state.get_text('select_genre'), options, audio, game_state)
+        return options
 
     def announce_entry(self):
         topic = self.game_state.current_draft.get('topic', '?')
+        if topic != self._sorted_for:
+            self.options = self._build_options(genres_by_compatibility(topic), self.game_state)
+            self._sorted_for = topic
         self.current_index = 0
-        self.audio.speak(f"Wähle ein Genre für dein {topic}-Spiel.")
+        self.audio.speak(self.game_state.get_text('genre_prompt', topic=topic))
         self.speak_current(interrupt=False)
 
     def _select(self, genre):
@@ -460,7 +737,7 @@ class GenreMenu(Menu):
         self.game_state.current_draft['genre'] = genre
         compat = get_compatibility(topic, genre)
         compat_text = get_compatibility_text(compat)
-        self.audio.speak(f"{topic} plus {genre}: {compat_text}.")
+        self.audio.speak(self.game_state.get_text('genre_selected', topic=topic, genre=genre, compat=compat_text))
         return "platform_menu"
 
     def _cancel(self):
@@ -474,7 +751,7 @@ class PlatformMenu(Menu):
         self.audio = audio
         self.game_state = game_state
         # Wird in announce_entry dynamisch befüllt
-        super().__init__("Wähle eine Plattform", [], audio, game_state)
+        super().__init__(game_state.get_text('select_platform'), [], audio, game_state)
 
     def announce_entry(self):
         self.current_index = 0
@@ -482,12 +759,11 @@ class PlatformMenu(Menu):
         self.options = []
         for p in available:
             fee = p['license_fee']
-            fee_text = f" (Lizenz: {fee:,} {self.game_state.get_text('money_unit')})" if fee > 0 else ""
+            fee_text = self.game_state.get_text('platform_license', fee=fee) if fee > 0 else ""
             
             def select_action(pn=p['name'], cost=fee):
                 if self.game_state.money < cost:
-                    # TODO: Translate
-                    self.audio.speak(f"Nicht genug Geld für die {pn} Lizenz. Du brauchst {cost:,} {self.game_state.get_text('money_unit')}.")
+                    self.audio.speak(self.game_state.get_text('platform_no_money', platform=pn, cost=cost))
                     return None
                 return self._select(pn)
 
@@ -495,15 +771,26 @@ class PlatformMenu(Menu):
                 'text': f"{p['name']}{fee_text}",
                 'action': select_action,
             })
+        self.options.append({'text': self.game_state.get_text('market_overview'), 'action': self._market_overview})
         self.options.append({'text': self.game_state.get_text('back'), 'action': self._cancel})
         self.audio.speak(self.game_state.get_text('select_platform'))
         self.speak_current(interrupt=False)
 
     def _select(self, platform_name):
         self.game_state.current_draft['platform'] = platform_name
-        self.audio.speak(f"Plattform: {platform_name}.")
+        self.audio.speak(self.game_state.get_text('platform_selected', platform=platform_name))
         return "audience_menu"
 
+    def _market_overview(self):
+        """Liest alle verfügbaren Plattformen nach aktueller Marktgröße vor."""
+        gs = self.game_state
+        trends = {1: gs.get_text('market_up'), 0: gs.get_text('market_flat'), -1: gs.get_text('market_down')}
+        lines = [gs.get_text('market_heading', week=gs.week)]
+        for name, multi, trend in get_market_overview(gs.week):
+            lines.append(gs.get_text('market_entry', platform=name, multi=multi, trend=trends[trend]))
+        self.audio.speak(" ".join(lines))
+        return None
+
     def _cancel(self):
         return "genre_menu"
 
@@ -520,7 +807,7 @@ class AudienceMenu(Menu):
 
     def _select(self, audience):
         self.game_state.current_draft['audience'] = audience
-        self.audio.speak(f"Zielgruppe: {audience}.")
+        self.audio.speak(self.game_state.get_text('audience_selected', audience=audience))
         return "game_size_menu"
 
     def _cancel(self):
@@ -545,14 +832,14 @@ class GameSizeMenu(Menu):
     def _select(self, size_data):
         # Check min employees
         if len(self.game_state.employees) < size_data['min_employees']:
-            self.audio.speak(
-                f"Für ein {size_data['name']} Spiel brauchst du mindestens "
-                f"{size_data['min_employees']} Mitarbeiter. Du hast nur {len(self.game_state.employees)}."
-            )
+            self.audio.speak(self.game_state.get_text(
+                'size_needs_employees', size=size_data['name'],
+                required=size_data['min_employees'], current=len(self.game_state.employees),
+            ))
             return None
         
         self.game_state.current_draft['size'] = size_data['name']
-        self.audio.speak(f"Größe: {size_data['name']}.")
+        self.audio.speak(self.game_state.get_text('size_selected', size=size_data['name']))
         return "marketing_menu"
 
     def _cancel(self):
@@ -576,11 +863,11 @@ class MarketingMenu(Menu):
 
     def _select(self, mark_data):
         if self.game_state.money < mark_data['cost']:
-            self.audio.speak(f"Nicht genug Geld für {mark_data['name']}. Du brauchst {mark_data['cost']:,} Euro.")
+            self.audio.speak(self.game_state.get_text('not_enough_money_for', item=mark_data['name'], cost=mark_data['cost']))
             return None
             
         self.game_state.current_draft['marketing'] = mark_data['name']
-        self.audio.speak(f"Marketing: {mark_data['name']}.")
+        self.audio.speak(self.game_state.get_text('marketing_selected', marketing=mark_data['name']))
         return "engine_select_menu"
 
     def _cancel(self):
@@ -600,7 +887,7 @@ class EngineSelectMenu(Menu):
         self.options = []
         for eng in self.game_state.engines:
             self.options.append({
-                'text': f"{eng.name}, Tech-Level {eng.tech_level}",
+                'text': self.game_state.get_text('engine_option', name=eng.name, level=eng.tech_level),
                 'action': lambda e=eng: self._select(e),
             })
         self.options.append({'text': self.game_state.get_text('back'), 'action': self._cancel})
@@ -609,7 +896,7 @@ class EngineSelectMenu(Menu):
 
     def _select(self, engine):
         self.game_state.current_draft['engine'] = engine
-        self.audio.speak(f"Engine: {engine.name}, Tech-Level {engine.tech_level}.")
+        self.audio.speak(self.game_state.get_text('engine_selected', name=engine.name, level=engine.tech_level))
         return "game_name_input"
 
     def _cancel(self):
@@ -620,7 +907,7 @@ class GameNameMenu(TextInputMenu):
     def __init__(self, audio, game_state):
         super().__init__(
             title=game_state.get_text('game_name'),
-            prompt=game_state.get_text('game_name_prompt_short'), # I'll add this to translations
+            prompt=game_state.get_text('game_name_prompt_short'),
             audio=audio,
             game_state=game_state,
             on_confirm=self._confirm,
@@ -630,14 +917,14 @@ class GameNameMenu(TextInputMenu):
     def announce_entry(self):
         self.text = ""
         d = self.game_state.current_draft
-        self.audio.speak(
-            f"Spielname eingeben. Dein {d.get('topic','?')} {d.get('genre','?')}-Spiel "
-            f"auf {d.get('platform','?')}. Tippe den Namen und drücke Enter."
-        )
+        self.audio.speak(self.game_state.get_text(
+            'game_name_intro', topic=d.get('topic', '?'), genre=d.get('genre', '?'),
+            platform=d.get('platform', '?'),
+        ))
 
     def _confirm(self, name):
         self.game_state.current_draft['name'] = name
-        self.audio.speak(f"Spielname: {name}. Weiter zur Entwicklung!")
+        self.audio.speak(self.game_state.get_text('game_name_selected', name=name))
         return "slider_menu"
 
     def _cancel(self):
@@ -668,77 +955,114 @@ class DevelopmentSliderMenu(SliderMenu):
             'size': d.get('size', 'Mittel'),
             'marketing': d.get('marketing', 'Kein Marketing')
         })()
-        cost = self.game_state.calculate_dev_cost(dummy)
-
-        self.audio.speak(
-            f"Entwicklung von '{d.get('name','?')}', "
-            f"ein {d.get('topic','?')} {d.get('genre','?')}-Spiel "
-            f"auf {d.get('platform','?')}. "
-            f"Geschätzte Kosten: {cost:,} Euro. "
-            f"Verteile {self.budget} Punkte auf 6 Bereiche."
-        )
+        # Gehälter nur für das Team, das dieses Projekt bekäme
+        cost = self.game_state.calculate_dev_cost(dummy, team=self.game_state.next_project_team())
+
+        self.audio.speak(self.game_state.get_text(
+            'dev_intro', name=d.get('name', '?'), topic=d.get('topic', '?'),
+            genre=d.get('genre', '?'), platform=d.get('platform', '?'),
+            cost=cost, budget=self.budget,
+        ))
         self._speak_current()
 
     def _confirm(self, values):
-        self.game_state.current_draft['sliders'] = values
-
-        # Entwicklungsfortschritt anzeigen
-        self.audio.speak(
-            "Entwicklung läuft... Dein Team arbeitet hart!"
+        gs = self.game_state
+        d = gs.current_draft
+        d['sliders'] = values
+        project = GameProject(
+            name=d['name'], topic=d['topic'], genre=d['genre'],
+            sliders=d['sliders'], platform=d.get('platform', 'PC'),
+            audience=d.get('audience', 'Jugendliche'),
+            engine=d.get('engine'),
+            size=d.get('size', 'Mittel'),
+            marketing=d.get('marketing', 'Kein Marketing')
         )
-        return "dev_progress_menu"
+        job = gs.start_project(project)
+        if job is None:
+            self.audio.speak(gs.get_text('no_free_team', max=gs.max_parallel_projects()))
+            return None
+
+        # Die Entwicklung läuft im Hintergrund weiter, das Studio bleibt bedienbar
+        self.audio.speak(gs.get_text(
+            'project_started', name=project.name, team=job.team,
+            weeks=job.weeks_left(gs.week), week=job.end_week,
+        ))
+        gs.reset_draft()
+        return "game_menu"
 
     def _cancel(self):
         return "game_name_input"
 
 
-class DevProgressMenu:
-    """Zeigt Entwicklungsfortschritt in Phasen."""
+class DevProgressMenu(VirtualListMenu):
+    """
+    Übersicht der Entwicklungs-Pipeline: laufende Projekte mit Phase und
+    Restdauer, danach neue Testberichte. Die Wochen laufen im Hintergrund
+    weiter (Game.run_clock); hier lässt sich auch das Spieltempo umschalten.
+    """
 
     def __init__(self, audio, game_state):
-        self.audio = audio
-        self.game_state = game_state
-        self.phase_index = 0
-        self.start_time = 0.0
-        self.completed = False
-        self.phases = []
+        super().__init__(game_state.get_text('projects'), audio, game_state)
+        self.rows = []
+        self._rows_signature = None
+        self._build_fixed()
+
+    def _build_fixed(self):
+        gs = self.game_state
+        scale = gs.get_text('time_scale_' + gs.settings.get('time_scale', 'normal'))
+        self.fixed_options = [
+            {'text': gs.get_text('time_scale_option', value=scale), 'action': self._cycle_time_scale},
+            {'text': gs.get_text('back'), 'action': lambda: "game_menu"},
+        ]
 
     def announce_entry(self):
-        from game_data import DEV_PHASES
-        self.phases = DEV_PHASES
-        self.phase_index = 0
-        self.start_time = time.time()
-        self.completed = False
-        self.audio.speak(
-            f"Phase 1 von {len(self.phases)}: {self.phases[0]['name']}..."
-        )
+        self.current_index = 0
+        self._build_fixed()
+        self._refresh_rows()
+        gs = self.game_state
+        self.audio.speak(gs.get_text(
+            'projects_intro', count=len(gs.pipeline), max=gs.max_parallel_projects(),
+            free=gs.free_staff(), reviews=len(gs.unread_reviews),
+        ))
+        self.speak_current(interrupt=False)
+
+    def _refresh_rows(self):
+        gs = self.game_state
+        self.rows = [('job', job) for job in gs.pipeline] + [('review', i) for i in gs.unread_reviews]
+        self._rows_signature = (gs.week, len(gs.pipeline), len(gs.unread_reviews))
+        self.invalidate_jump()
 
     def update(self):
-        if self.completed:
-            return
-        from game_data import DEV_PHASES
-        elapsed = time.time() - self.start_time
-        phase_duration = 1.5  # Sekunden pro Phase
-
-        if elapsed >= phase_duration:
-            self.phase_index += 1
-            self.start_time = time.time()
-
-            if self.phase_index >= len(DEV_PHASES):
-                self.completed = True
-                self.audio.speak(
-                    self.game_state.get_text('dev_completed')
-                )
-            else:
-                phase = DEV_PHASES[self.phase_index]
-                # Phase name might be in game_data, still hardcoded there?
-                self.audio.speak(
-                    f"Phase {self.phase_index+1} von {len(DEV_PHASES)}: {phase['name']}..."
-                )
+        # Fertige Projekte und neue Testberichte, während das Menü offen ist
+        gs = self.game_state
+        if self._rows_signature != (gs.week, len(gs.pipeline), len(gs.unread_reviews)):
+            self._refresh_rows()
 
-    def handle_input(self, event):
-        if self.completed and event.key == pygame.K_RETURN:
+    def item_count(self):
+        return len(self.rows)
+
+    def item_text(self, index):
+        gs = self.game_state
+        kind, value = self.rows[index]
+        if kind == 'review':
+            return gs.get_text('project_review_entry', name=gs.game_history[value].name)
+        return gs.get_text(
+            'project_entry', name=value.project.name, phase=DEV_PHASES[value.phase]['name'],
+            index=value.phase + 1, total=len(DEV_PHASES), weeks=value.weeks_left(gs.week), team=value.team,
+        )
+
+    def select_item(self, index):
+        kind, value = self.rows[index]
+        if kind == 'review':
+            self.game_state._pending_review_index = value
             return "review_result"
+        self.speak_current()
+        return None
+
+    def _cycle_time_scale(self):
+        self.game_state.cycle_time_scale()
+        self._build_fixed()
+        self.speak_current()
         return None
 
 
@@ -756,27 +1080,19 @@ class ReviewResultMenu(Menu):
 
     def announce_entry(self):
         self.current_index = 0
-        from models import GameProject
-
-        d = self.game_state.current_draft
-        project = GameProject(
-            name=d['name'], topic=d['topic'], genre=d['genre'],
-            sliders=d['sliders'], platform=d.get('platform', 'PC'),
-            audience=d.get('audience', 'Jugendliche'),
-            engine=d.get('engine'),
-            size=d.get('size', 'Mittel'),
-            marketing=d.get('marketing', 'Kein Marketing')
-        )
-
-        project = self.game_state.finalize_game(project)
+        gs = self.game_state
+        index = getattr(gs, '_pending_review_index', len(gs.game_history) - 1)
+        if index in gs.unread_reviews:
+            gs.unread_reviews.remove(index)
+        project = gs.game_history[index]
 
-        self.audio.speak(f"Die Reviews für '{project.name}' sind da!")
+        self.audio.speak(self.game_state.get_text('reviews_in', name=project.name))
 
         for i, score in enumerate(project.review.scores):
-            self.audio.speak(f"Reviewer {i+1}: {score} von 10.", interrupt=False)
+            self.audio.speak(self.game_state.get_text('reviewer_score', index=i + 1, score=score), interrupt=False)
 
         self.audio.speak(
-            f"Durchschnittsbewertung: {project.review.average:.1f} von 10.",
+            self.game_state.get_text('review_average', average=project.review.average),
             interrupt=False,
         )
         # NEU: Detaillierte Berichte sprechen
@@ -784,26 +1100,24 @@ class ReviewResultMenu(Menu):
             self.audio.speak(comment, interrupt=False)
         self.audio.play_sound("cash")
         self.audio.speak(
-            f"Verkäufe: {project.sales:,} Einheiten. "
-            f"Einnahmen: {project.revenue:,} Euro. "
-            f"Kosten: {project.dev_cost:,} Euro. "
-            f"Gewinn: {project.profit:,} Euro.",
+            self.game_state.get_text(
+                'review_sales', sales=project.sales, revenue=project.revenue,
+                cost=project.dev_cost, profit=project.profit,
+            ),
             interrupt=False,
         )
         self.audio.speak(
-            f"Neuer Kontostand: {self.game_state.money:,} Euro. "
-            f"Fans: {self.game_state.fans:,}.",
+            self.game_state.get_text('review_balance', money=self.game_state.money, fans=self.game_state.fans),
             interrupt=False,
         )
         self.speak_current(interrupt=False)
 
     def _continue(self):
-        self.game_state.reset_draft()
-        return "game_menu"
+        return "dev_progress_menu"
 
     def _quit(self):
         self.game_state.save_game()
-        self.audio.speak("Spielstand gespeichert. Auf Wiedersehen!")
+        self.audio.speak(self.game_state.get_text('saved_goodbye'))
         return "quit"
 
 
@@ -820,6 +1134,7 @@ class HRMenu(Menu):
             {'text': game_state.get_text('show_employees'), 'action': self.show_employees},
             {'text': game_state.get_text('train_employee'), 'action': self.train},
             {'text': game_state.get_text('fire_employee'), 'action': self.fire},
+            {'text': game_state.get_text('phase_staffing'), 'action': self.staffing},
             {'text': game_state.get_text('back'), 'action': self.back},
         ]
         super().__init__(game_state.get_text('hr_department'), options, audio, game_state)
@@ -828,123 +1143,255 @@ class HRMenu(Menu):
         self.current_index = 0
         gs = self.game_state
         max_emp = gs.get_max_employees()
-        self.audio.speak(
-            f"Personal-Abteilung. "
-            f"{len(gs.employees)} von {max_emp} Mitarbeiter."
-        )
+        self.audio.speak(gs.get_text('hr_intro', count=len(gs.employees), max=max_emp))
         self.speak_current(interrupt=False)
 
     def hire(self):
         if not self.game_state.can_hire():
             office = OFFICE_LEVELS[self.game_state.office_level]
-            self.audio.speak(
-                f"Dein {office['name']} hat nur Platz für {office['max_employees']} Mitarbeiter. "
-                f"Upgrade dein Büro für mehr Plätze."
-            )
+            self.audio.speak(self.game_state.get_text('office_full', office=office['name'], max=office['max_employees']))
             return None
         return "hire_menu"
 
     def show_employees(self):
         if not self.game_state.employees:
-            self.audio.speak("Du hast noch keine Mitarbeiter.")
+            self.audio.speak(self.game_state.get_text('no_employees'))
             return None
-        for i, emp in enumerate(self.game_state.employees, 1):
-            self.audio.speak(f"{i}. {emp.detail()}", interrupt=False)
-        return None
+        return "employee_list"
 
     def train(self):
         if not self.game_state.employees:
-            self.audio.speak("Du hast keine Mitarbeiter zum Trainieren.")
+            self.audio.speak(self.game_state.get_text('no_employees_train'))
             return None
         return "training_employee_select"
 
     def fire(self):
         if not self.game_state.employees:
-            self.audio.speak("Du hast keine Mitarbeiter zum Entlassen.")
+            self.audio.speak(self.game_state.get_text('no_employees_fire'))
             return None
         return "fire_menu"
 
+    def staffing(self):
+        gs = self.game_state
+        if not gs.employees:
+            self.audio.speak(gs.get_text('no_employees'))
+            return None
+        gs.staff_phases()
+        lines = [gs.get_text('phase_staffing_heading')]
+        for phase, count, strength in gs.get_phase_staffing():
+            lines.append(gs.get_text('phase_staffing_entry', phase=phase, count=count, strength=strength))
+        self.audio.speak(" ".join(lines))
+        return None
+
     def back(self):
         return "game_menu"
 
 
-class HireMenu(Menu):
-    """Zeigt 3 zufällige Bewerber."""
+class EmployeeListMenu(VirtualListMenu):
+    """Blätterbare Mitarbeiterliste; Enter liest die Details vor."""
 
     def __init__(self, audio, game_state):
-        self.audio = audio
-        self.game_state = game_state
-        self.candidates = []
-        super().__init__(game_state.get_text('candidates'), [], audio, game_state)
+        super().__init__(
+            game_state.get_text('show_employees'), audio, game_state,
+            fixed_options=[{'text': game_state.get_text('back'), 'action': lambda: "hr_menu"}],
+        )
 
     def announce_entry(self):
         self.current_index = 0
-        self.candidates = [self.game_state.generate_candidate() for _ in range(3)]
-        self.options = []
-        for c in self.candidates:
-            hire_cost = c.salary * 2
-            spec_text = f" Spezialisierung: {c.specialization['name']}." if c.specialization else ""
-            self.options.append({
-                'text': f"{c.name}, {c.role}, Level {c.skill_level}. "
-                        f"Gehalt: {c.salary} pro Woche. {spec_text} Einstellung: {hire_cost:,} Euro",
-                'action': lambda emp=c: self._hire(emp),
-            })
-        self.options.append({'text': self.game_state.get_text('refresh_candidates'), 'action': self._refresh})
-        self.options.append({'text': self.game_state.get_text('back'), 'action': self._cancel})
+        gs = self.game_state
+        self.audio.speak(gs.get_text('employee_list_intro', count=len(gs.employees), payroll=gs.employees.payroll()))
+        self.speak_current(interrupt=False)
+
+    def item_count(self):
+        return len(self.game_state.employees)
+
+    def item_text(self, index):
+        return self.game_state.employees[index].summary()
+
+    def item_jump_key(self, index):
+        return self.game_state.employees[index].name
+
+    def select_item(self, index):
+        self.audio.speak(self.game_state.employees[index].detail())
+        return None
+
+
+class HireMenu(VirtualListMenu):
+    """Bewerber-Pool mit Filtern nach Rolle, Level, Spezialisierung und Gehalt."""
+
+    MAX_LEVEL = 5
+
+    def __init__(self, audio, game_state):
+        super().__init__(game_state.get_text('candidates'), audio, game_state)
+        self.role = None
+        self.min_level = 1
+        self.specialization = None
+        self.salary_step = 0
+        self.rows = []
+        self._build_filters()
 
-        self.audio.speak("3 Bewerber verfügbar.")
+    def announce_entry(self):
+        self.current_index = 0
+        pool = self.game_state.candidate_pool()
+        self.rows = self._query(pool)
+        self.invalidate_jump()
+        text = self.game_state.get_text('candidates_available', count=len(pool))
+        if len(self.rows) < len(pool):
+            text += " " + self.game_state.get_text('candidates_filtered', count=len(self.rows), total=len(pool))
+        self.audio.speak(text)
         self.speak_current(interrupt=False)
 
-    def _hire(self, emp):
-        hire_cost = emp.salary * 2
+    def _query(self, pool):
+        return pool.query(self.role, self.min_level, self.specialization, SALARY_LIMITS[self.salary_step])
+
+    # ---------- Filter ----------
+
+    def _build_filters(self):
+        gs = self.game_state
+        all_text = gs.get_text('filter_all')
+        role = all_text if self.role is None else EMPLOYEE_ROLES[self.role]['role']
+        if self.specialization is None:
+            spec = all_text
+        elif self.specialization == ANY_SPECIALIZATION:
+            spec = gs.get_text('filter_any_specialization')
+        else:
+            spec = EMPLOYEE_SPECIALIZATIONS[self.specialization]['name']
+        limit = SALARY_LIMITS[self.salary_step]
+        salary = gs.get_text('filter_unlimited') if limit is None else gs.get_text('filter_salary_value', salary=limit)
+        self.fixed_options = [
+            {'text': gs.get_text('filter_role', value=role), 'action': self._next_role},
+            {'text': gs.get_text('filter_level', value=self.min_level), 'action': self._next_level},
+            {'text': gs.get_text('filter_specialization', value=spec), 'action': self._next_specialization},
+            {'text': gs.get_text('filter_salary', value=salary), 'action': self._next_salary},
+            {'text': gs.get_text('hire_all_filtered'), 'action': self._hire_all},
+            {'text': gs.get_text('refresh_candidates'), 'action': self._refresh},
+            {'text': gs.get_text('back'), 'action': self._cancel},
+        ]
+
+    def _apply_filters(self):
+        """Fragt den Pool neu ab; der Fokus bleibt auf dem gerade geänderten Filter."""
+        option = self.current_index - len(self.rows)
+        pool = self.game_state.candidate_pool()
+        self.rows = self._query(pool)
+        self.invalidate_jump()
+        self._build_filters()
+        self.current_index = len(self.rows) + option
+        self.audio.speak(self.fixed_options[option]['text'])
+        self.audio.speak(
+            self.game_state.get_text('candidates_filtered', count=len(self.rows), total=len(pool)),
+            interrupt=False,
+        )
+        return None
+
+    def _next_role(self):
+        self.role = 0 if self.role is None else self.role + 1
+        if self.role >= len(EMPLOYEE_ROLES):
+            self.role = None
+        return self._apply_filters()
+
+    def _next_level(self):
+        self.min_level = self.min_level % self.MAX_LEVEL + 1
+        return self._apply_filters()
+
+    def _next_specialization(self):
+        if self.specialization is None:
+            self.specialization = ANY_SPECIALIZATION
+        elif self.specialization + 1 < len(EMPLOYEE_SPECIALIZATIONS):
+            self.specialization += 1
+        else:
+            self.specialization = None
+        return self._apply_filters()
+
+    def _next_salary(self):
+        self.salary_step = (self.salary_step + 1) % len(SALARY_LIMITS)
+        return self._apply_filters()
+
+    # ---------- Bewerber ----------
+
+    def item_count(self):
+        return len(self.rows)
+
+    def item_text(self, index):
+        name, role, level, salary, spec = self.game_state.candidates.describe(self.rows[index])
+        spec_text = self.game_state.get_text('candidate_specialization', name=spec['name']) if spec else ""
+        return self.game_state.get_text(
+            'candidate_option', name=name, role=role, level=level,
+            salary=salary, spec=spec_text, cost=salary * 2,
+        )
+
+    def item_jump_key(self, index):
+        # Type-Ahead springt über den Namen des Bewerbers
+        return self.game_state.candidates.names[self.rows[index]]
+
+    def select_item(self, index):
+        candidate = self.rows[index]
+        name, _, _, salary, _ = self.game_state.candidates.describe(candidate)
+        hire_cost = salary * 2
         if self.game_state.money < hire_cost:
-            self.audio.speak(f"Nicht genug Geld. Du brauchst {hire_cost:,} Euro.")
+            self.audio.speak(self.game_state.get_text('not_enough_money', cost=hire_cost))
             return None
-        if self.game_state.hire_employee(emp):
-            self.audio.speak(
-                f"{emp.name} eingestellt! "
-                f"Kosten: {hire_cost:,} Euro. "
-                f"Restgeld: {self.game_state.money:,} Euro."
-            )
+        if self.game_state.hire_candidate(candidate):
+            self.rows = self._query(self.game_state.candidates)
+            self.invalidate_jump()
+            self.audio.speak(self.game_state.get_text('hired', name=name, cost=hire_cost, money=self.game_state.money))
             return "hr_menu"
-        self.audio.speak("Einstellung fehlgeschlagen.")
+        self.audio.speak(self.game_state.get_text('hire_failed'))
         return None
 
+    def _hire_all(self):
+        """Stellt die gefilterten Bewerber der Reihe nach ein, so weit Plätze und Geld reichen."""
+        gs = self.game_state
+        if not gs.can_hire():
+            office = OFFICE_LEVELS[gs.office_level]
+            self.audio.speak(gs.get_text('office_full', office=office['name'], max=office['max_employees']))
+            return None
+        hired = gs.hire_candidates(self.rows)
+        if not hired:
+            self.audio.speak(gs.get_text('hire_failed'))
+            return None
+        self.audio.speak(gs.get_text('hired_many', count=len(hired), money=gs.money))
+        return "hr_menu"
+
     def _refresh(self):
-        return "hire_menu"
+        self.game_state.refresh_candidates()
+        self.announce_entry()
+        return None
 
     def _cancel(self):
         return "hr_menu"
 
 
-class FireMenu(Menu):
+class FireMenu(VirtualListMenu):
     """Zeigt aktuelle Mitarbeiter zum Entlassen."""
 
     def __init__(self, audio, game_state):
-        self.audio = audio
-        self.game_state = game_state
-        super().__init__(game_state.get_text('fire_employee'), [], audio, game_state)
+        super().__init__(
+            game_state.get_text('fire_employee'), audio, game_state,
+            fixed_options=[{'text': game_state.get_text('back'), 'action': self._cancel}],
+        )
 
     def announce_entry(self):
         self.current_index = 0
-        self.options = []
-        for i, emp in enumerate(self.game_state.employees):
-            abfindung = emp.salary * 4
-            self.options.append({
-                'text': f"{emp.name}, {emp.role}. Abfindung: {abfindung:,} Euro",
-                'action': lambda idx=i: self._fire(idx),
-            })
-        self.options.append({'text': self.game_state.get_text('back'), 'action': self._cancel})
-        self.audio.speak("Wen möchtest du entlassen?")
+        self.audio.speak(self.game_state.get_text('fire_prompt'))
         self.speak_current(interrupt=False)
 
+    def item_count(self):
+        return len(self.game_state.employees)
+
+    def item_text(self, index):
+        emp = self.game_state.employees[index]
+        return self.game_state.get_text('fire_option', name=emp.name, role=emp.role, severance=emp.salary * 4)
+
+    def item_jump_key(self, index):
+        return self.game_state.employees[index].name
+
+    def select_item(self, index):
+        return self._fire(index)
+
     def _fire(self, index):
         emp = self.game_state.fire_employee(index)
         if emp:
-            self.audio.speak(
-                f"{emp.name} entlassen. "
-                f"Restgeld: {self.game_state.money:,} Euro."
-            )
+            self.audio.speak(self.game_state.get_text('fired', name=emp.name, money=self.game_state.money))
         return "hr_menu"
 
     def _cancel(self):
@@ -970,12 +1417,10 @@ class ResearchMenu(Menu):
     def announce_entry(self):
         self.current_index = 0
         researchable = self.game_state.get_researchable_features()
-        self.audio.speak(
-            f"Forschung und Engines. "
-            f"{len(self.game_state.unlocked_features)} Features freigeschaltet. "
-            f"{len(researchable)} neue Features verfügbar. "
-            f"{len(self.game_state.engines)} Engines erstellt."
-        )
+        self.audio.speak(self.game_state.get_text(
+            'research_intro', unlocked=len(self.game_state.unlocked_features),
+            available=len(researchable), engines=len(self.game_state.engines),
+        ))
         self.speak_current(interrupt=False)
 
     def research(self):
@@ -993,39 +1438,44 @@ class ResearchMenu(Menu):
         return "game_menu"
 
 
-class FeatureResearchMenu(Menu):
+class FeatureResearchMenu(VirtualListMenu):
     """Zeigt erforschbare Features."""
 
     def __init__(self, audio, game_state):
-        self.audio = audio
-        self.game_state = game_state
-        super().__init__(game_state.get_text('research_feature'), [], audio, game_state)
+        self.researchable = []
+        super().__init__(
+            game_state.get_text('research_feature'), audio, game_state,
+            fixed_options=[{'text': game_state.get_text('back'), 'action': self._cancel}],
+        )
 
     def announce_entry(self):
         self.current_index = 0
-        researchable = self.game_state.get_researchable_features()
-        self.options = []
-        for f in researchable:
-            self.options.append({
-                'text': f"{f['name']} ({f['category']}). Kosten: {f['cost']:,} Euro. Tech-Bonus: +{f['tech_bonus']}",
-                'action': lambda fd=f: self._research(fd),
-            })
-        if not self.options:
-            self.options.append({'text': self.game_state.get_text('no_features_available'), 'action': lambda: None})
-        self.options.append({'text': self.game_state.get_text('back'), 'action': self._cancel})
+        self.researchable = self.game_state.get_researchable_features()
+        self.fixed_options = [{'text': self.game_state.get_text('back'), 'action': self._cancel}]
+        if not self.researchable:
+            self.fixed_options.insert(0, {'text': self.game_state.get_text('no_features_available'), 'action': lambda: None})
 
-        self.audio.speak(f"{len(researchable)} Features zum Erforschen.")
+        self.audio.speak(self.game_state.get_text('features_to_research', count=len(self.researchable)))
         self.speak_current(interrupt=False)
 
+    def item_count(self):
+        return len(self.researchable)
+
+    def item_text(self, index):
+        f = self.researchable[index]
+        return self.game_state.get_text(
+            'feature_option', name=f['name'], category=f['category'], cost=f['cost'], bonus=f['tech_bonus'],
+        )
+
+    def select_item(self, index):
+        return self._research(self.researchable[index])
+
     def _research(self, feature_data):
         if self.game_state.research_feature(feature_data):
-            self.audio.speak(
-                f"{feature_data['name']} erforscht! "
-                f"Restgeld: {self.game_state.money:,} Euro."
-            )
+            self.audio.speak(self.game_state.get_text('researched', name=feature_data['name'], money=self.game_state.money))
             return "research_menu"
         else:
-            self.audio.speak("Nicht genug Geld oder bereits erforscht.")
+            self.audio.speak(self.game_state.get_text('research_failed'))
             return None
 
     def _cancel(self):
@@ -1078,7 +1528,9 @@ class EngineFeatureSelectMenu(Menu):
         for cat, features in sorted(categories.items()):
             best = max(features, key=lambda x: x.tech_bonus)
             self.options.append({
-                'text': f"[  ] {best.name} ({cat}, Tech: +{best.tech_bonus})",
+                'text': self.game_state.get_text(
+                    'engine_feature_option', mark="[  ]", name=best.name, category=cat, bonus=best.tech_bonus,
+                ),
                 'action': lambda feat=best: self._toggle(feat),
                 '_feature': best,
                 '_selected': False,
@@ -1087,43 +1539,42 @@ class EngineFeatureSelectMenu(Menu):
         self.options.append({'text': self.game_state.get_text('create_engine_option'), 'action': self._create})
         self.options.append({'text': self.game_state.get_text('back'), 'action': self._cancel})
 
-        name = getattr(self.game_state, '_pending_engine_name', 'Neue Engine')
-        self.audio.speak(
-            f"Wähle Features für '{name}'. "
-            f"Enter zum An/Abwählen. Letzte Option zum Erstellen."
-        )
+        name = getattr(self.game_state, '_pending_engine_name', None) or self.game_state.get_text('new_engine_default')
+        self.audio.speak(self.game_state.get_text('engine_features_intro', name=name))
         self.speak_current(interrupt=False)
 
     def _toggle(self, feature):
         if feature in self.selected_features:
             self.selected_features.remove(feature)
-            status = "abgewählt"
+            status = self.game_state.get_text('unselected')
         else:
             self.selected_features.append(feature)
-            status = "ausgewählt"
+            status = self.game_state.get_text('selected')
 
         # Update option text
         for opt in self.options:
             if opt.get('_feature') == feature:
                 mark = "[X]" if feature in self.selected_features else "[  ]"
-                opt['text'] = f"{mark} {feature.name} ({feature.category}, Tech: +{feature.tech_bonus})"
+                opt['text'] = self.game_state.get_text(
+                    'engine_feature_option', mark=mark, name=feature.name,
+                    category=feature.category, bonus=feature.tech_bonus,
+                )
+                self.invalidate_jump()
                 break
 
-        self.audio.speak(
-            f"{feature.name} {status}. {len(self.selected_features)} Features gewählt."
-        )
+        self.audio.speak(self.game_state.get_text(
+            'feature_toggled', name=feature.name, status=status, count=len(self.selected_features),
+        ))
         return None
 
     def _create(self):
         if not self.selected_features:
-            self.audio.speak("Wähle mindestens ein Feature!")
+            self.audio.speak(self.game_state.get_text('choose_one_feature'))
             return None
 
-        name = getattr(self.game_state, '_pending_engine_name', 'Neue Engine')
+        name = getattr(self.game_state, '_pending_engine_name', None) or self.game_state.get_text('new_engine_default')
         engine = self.game_state.create_engine(name, list(self.selected_features))
-        self.audio.speak(
-            f"Engine '{engine.name}' erstellt! Tech-Level: {engine.tech_level}."
-        )
+        self.audio.speak(self.game_state.get_text('engine_created', name=engine.name, level=engine.tech_level))
         return "research_menu"
 
     def _cancel(self):
@@ -1147,34 +1598,31 @@ class OfficeMenu(Menu):
     def announce_entry(self):
         self.current_index = 0
         office = self.game_state.get_office_info()
-        self.audio.speak(
-            f"Aktuelles Büro: {office['name']}. "
-            f"Platz für {office['max_employees']} Mitarbeiter."
-        )
+        self.audio.speak(self.game_state.get_text('office_current', name=office['name'], max=office['max_employees']))
         if self.game_state.office_level < len(OFFICE_LEVELS) - 1:
             next_office = OFFICE_LEVELS[self.game_state.office_level + 1]
             self.audio.speak(
-                f"Nächstes Upgrade: {next_office['name']} für {next_office['cost']:,} Euro. "
-                f"Platz für {next_office['max_employees']} Mitarbeiter.",
+                self.game_state.get_text(
+                    'office_next', name=next_office['name'], cost=next_office['cost'],
+                    max=next_office['max_employees'],
+                ),
                 interrupt=False
             )
         else:
-            self.audio.speak("Maximale Bürogröße erreicht!", interrupt=False)
+            self.audio.speak(self.game_state.get_text('office_max'), interrupt=False)
         self.speak_current(interrupt=False)
 
     def upgrade(self):
         if self.game_state.upgrade_office():
             office = self.game_state.get_office_info()
-            self.audio.speak(
-                f"Upgrade auf {office['name']}! "
-                f"Platz für {office['max_employees']} Mitarbeiter. "
-                f"Restgeld: {self.game_state.money:,} Euro."
-            )
+            self.audio.speak(self.game_state.get_text(
+                'office_upgraded', name=office['name'], max=office['max_employees'], money=self.game_state.money,
+            ))
         elif self.game_state.office_level >= len(OFFICE_LEVELS) - 1:
-            self.audio.speak("Maximale Bürogröße erreicht!")
+            self.audio.speak(self.game_state.get_text('office_max'))
         else:
             next_cost = OFFICE_LEVELS[self.game_state.office_level + 1]['cost']
-            self.audio.speak(f"Nicht genug Geld. Du brauchst {next_cost:,} Euro.")
+            self.audio.speak(self.game_state.get_text('not_enough_money', cost=next_cost))
         return None
 
     def back(self):
@@ -1185,27 +1633,38 @@ class OfficeMenu(Menu):
 # TRAINING-MENÜS
 # ============================================================
 
-class TrainingEmployeeSelectMenu(Menu):
-    """Wähle einen Mitarbeiter für das Training."""
+class TrainingEmployeeSelectMenu(VirtualListMenu):
+    """Wähle einen Mitarbeiter (oder das ganze Team) für das Training."""
 
     def __init__(self, audio, game_state):
-        self.audio = audio
-        self.game_state = game_state
-        super().__init__(game_state.get_text('select_employee_training'), [], audio, game_state)
+        super().__init__(
+            game_state.get_text('select_employee_training'), audio, game_state,
+            fixed_options=[
+                {'text': game_state.get_text('train_whole_team'), 'action': lambda: self._select(None)},
+                {'text': game_state.get_text('cancel'), 'action': lambda: "hr_menu"},
+            ],
+        )
 
     def announce_entry(self):
         self.current_index = 0
-        self.options = []
-        for i, emp in enumerate(self.game_state.employees):
-            self.options.append({
-                'text': f"{emp.name} ({emp.role})",
-                'action': lambda idx=i: self._select(idx)
-            })
-        self.options.append({'text': "Abbrechen", 'action': lambda: "hr_menu"})
-        self.audio.speak("Wähle einen Mitarbeiter zum Trainieren.")
+        self.audio.speak(self.game_state.get_text('select_employee_training'))
         self.speak_current(interrupt=False)
 
+    def item_count(self):
+        return len(self.game_state.employees)
+
+    def item_text(self, index):
+        emp = self.game_state.employees[index]
+        return f"{emp.name} ({emp.role})"
+
+    def item_jump_key(self, index):
+        return self.game_state.employees[index].name
+
+    def select_item(self, index):
+        return self._select(index)
+
     def _select(self, index):
+        # None = ganzes Team
         self.game_state._pending_train_emp_index = index
         return "training_option_select"
 
@@ -1221,30 +1680,48 @@ class TrainingOptionMenu(Menu):
     def announce_entry(self):
         self.current_index = 0
         emp_idx = getattr(self.game_state, '_pending_train_emp_index', 0)
-        emp = self.game_state.employees[emp_idx]
-        
+        # Ganzes Team: Kosten pro Kopf
+        heads = len(self.game_state.employees) if emp_idx is None else 1
+
         self.options = []
         for train in TRAINING_OPTIONS:
             self.options.append({
-                'text': f"{train['name']} - {train['description']} (Kosten: {train['cost']:,} Euro)",
+                'text': self.game_state.get_text(
+                    'training_option', name=train['name'], description=train['description'],
+                    cost=train['cost'] * heads,
+                ),
                 'action': lambda t=train: self._train(emp_idx, t)
             })
-        self.options.append({'text': "Abbrechen", 'action': lambda: "hr_menu"})
-        self.audio.speak(f"Training für {emp.name} wählen.")
+        self.options.append({'text': self.game_state.get_text('cancel'), 'action': lambda: "hr_menu"})
+        if emp_idx is None:
+            self.audio.speak(self.game_state.get_text('training_for_team', count=heads))
+        else:
+            self.audio.speak(self.game_state.get_text('training_for', name=self.game_state.employees[emp_idx].name))
         self.speak_current(interrupt=False)
 
     def _train(self, emp_idx, train_data):
+        if emp_idx is None:
+            return self._train_team(train_data)
         if self.game_state.train_employee(emp_idx, train_data):
             emp = self.game_state.employees[emp_idx]
-            self.audio.speak(
-                f"Training erfolgreich! {emp.name} hat sich verbessert. "
-                f"Neues Gehalt: {emp.salary} Euro. Restgeld: {self.game_state.money:,} Euro."
-            )
+            self.audio.speak(self.game_state.get_text(
+                'training_done', name=emp.name, salary=emp.salary, money=self.game_state.money,
+            ))
             return "hr_menu"
         else:
-            self.audio.speak(f"Nicht genug Geld. Du brauchst {train_data['cost']:,} Euro.")
+            self.audio.speak(self.game_state.get_text('not_enough_money', cost=train_data['cost']))
             return None
 
+    def _train_team(self, train_data):
+        gs = self.game_state
+        if gs.train_team(train_data):
+            self.audio.speak(gs.get_text(
+                'training_team_done', count=len(gs.employees), payroll=gs.employees.payroll(), money=gs.money,
+            ))
+            return "hr_menu"
+        self.audio.speak(gs.get_text('not_enough_money', cost=train_data['cost'] * len(gs.employees)))
+        return None
+
 
 # ============================================================
 # PLEITE-MENÜ
@@ -1253,43 +1730,47 @@ class TrainingOptionMenu(Menu):
 class BankruptcyMenu(Menu):
     def __init__(self, audio, game_state):
         options = [
-            {'text': "Zurück zum Hauptmenü", 'action': lambda: "main_menu"},
-            {'text': "Spiel beenden", 'action': lambda: "quit"},
+            {'text': game_state.get_text('back_to_main_menu'), 'action': lambda: "main_menu"},
+            {'text': game_state.get_text('quit_game'), 'action': lambda: "quit"},
         ]
         super().__init__(game_state.get_text('bankruptcy'), options, audio, game_state)
 
     def announce_entry(self):
-        self.audio.speak(
-            "Deine Firma ist pleite! Du hast zu viele Schulden und die Bank hat dein Studio geschlossen. "
-            "Das Spiel ist vorbei."
-        )
+        self.audio.speak(self.game_state.get_text('bankruptcy_message'))
 
 
 # ============================================================
 # NEU: E-MAIL & SERVICE
 # ============================================================
 
-class EmailInboxMenu(Menu):
+class EmailInboxMenu(VirtualListMenu):
     def __init__(self, audio, game_state):
-        self.audio = audio
-        self.game_state = game_state
-        super().__init__("Posteingang", [], audio, game_state)
+        super().__init__(
+            game_state.get_text('inbox'), audio, game_state,
+            fixed_options=[{'text': game_state.get_text('back'), 'action': lambda: "game_menu"}],
+        )
 
     def announce_entry(self):
         self.current_index = 0
-        self.options = []
-        for i, mail in enumerate(self.game_state.emails):
-            status = "" if mail.is_read else "[NEU] "
-            self.options.append({
-                'text': f"{status}{mail.subject} (Woche {mail.date_week})",
-                'action': lambda idx=i: self._read_mail(idx)
-            })
-        self.options.append({'text': "Zurück", 'action': lambda: "game_menu"})
-        
-        unread = len([m for m in self.game_state.emails if not m.is_read])
-        self.audio.speak(f"Posteingang. {len(self.game_state.emails)} E-Mails, {unread} ungelesen.")
+        emails = self.game_state.emails
+        unread = sum(1 for m in emails if not m.is_read)
+        self.audio.speak(self.game_state.get_text('inbox_intro', count=len(emails), unread=unread))
         self.speak_current(interrupt=False)
 
+    def item_count(self):
+        return len(self.game_state.emails)
+
+    def item_text(self, index):
+        mail = self.game_state.emails[index]
+        status = "" if mail.is_read else self.game_state.get_text('mail_new')
+        return self.game_state.get_text('mail_option', status=status, subject=mail.subject, week=mail.date_week)
+
+    def item_jump_key(self, index):
+        return self.game_state.emails[index].subject
+
+    def select_item(self, index):
+        return self._read_mail(index)
+
     def _read_mail(self, index):
         self.game_state._pending_email_index = index
         return "email_detail"
@@ -1312,7 +1793,7 @@ class EmailDetailMenu(Menu):
             {'text': self.game_state.get_text('delete'), 'action': lambda: self._delete(idx)}
         ]
         
-        self.audio.speak(f"Von: {mail.sender}. Betreff: {mail.subject}.")
+        self.audio.speak(self.game_state.get_text('mail_header', sender=mail.sender, subject=mail.subject))
         self.audio.speak(mail.body, interrupt=False)
         self.speak_current(interrupt=False)
 
@@ -1321,28 +1802,36 @@ class EmailDetailMenu(Menu):
         return "email_inbox"
 
 
-class ServiceMenu(Menu):
+class ServiceMenu(VirtualListMenu):
     """Management von Patches und DLCs."""
     def __init__(self, audio, game_state):
-        self.audio = audio
-        self.game_state = game_state
-        super().__init__(game_state.get_text('service_support'), [], audio, game_state)
+        self.game_indices = []
+        super().__init__(
+            game_state.get_text('service_support'), audio, game_state,
+            fixed_options=[{'text': game_state.get_text('back'), 'action': lambda: "game_menu"}],
+        )
 
     def announce_entry(self):
         self.current_index = 0
-        self.options = []
-        # Nur aktive oder verbuggte Spiele
-        for i, game in enumerate(self.game_state.game_history):
-            if game.is_active or game.bugs > 0:
-                self.options.append({
-                    'text': f"{game.name} ({game.bugs} Bugs, {game.dlc_count} DLCs)",
-                    'action': lambda idx=i: self._manage_game(idx)
-                })
-        
-        self.options.append({'text': "Zurück", 'action': lambda: "game_menu"})
-        self.audio.speak("Service und Support. Wähle ein Spiel zum Bearbeiten.")
+        # Nur aktive oder verbuggte Spiele (nur Indizes, Texte entstehen beim Vorlesen)
+        self.game_indices = [
+            i for i, game in enumerate(self.game_state.game_history)
+            if game.is_active or game.bugs > 0
+        ]
+        self.invalidate_jump()
+        self.audio.speak(self.game_state.get_text('service_intro'))
         self.speak_current(interrupt=False)
 
+    def item_count(self):
+        return len(self.game_indices)
+
+    def item_text(self, index):
+        game = self.game_state.game_history[self.game_indices[index]]
+        return self.game_state.get_text('service_option', name=game.name, bugs=game.bugs, dlcs=game.dlc_count)
+
+    def select_item(self, index):
+        return self._manage_game(self.game_indices[index])
+
     def _manage_game(self, index):
         self.game_state._pending_service_game_index = index
         return "game_service_options"
@@ -1364,21 +1853,21 @@ class GameServiceOptionsMenu(Menu):
             {'text': self.game_state.get_text('release_dlc_option'), 'action': lambda: self._dlc(idx)},
             {'text': self.game_state.get_text('back'), 'action': lambda: "service_menu"}
         ]
-        self.audio.speak(f"Optionen für {game.name}.")
+        self.audio.speak(self.game_state.get_text('options_for', name=game.name))
         self.speak_current(interrupt=False)
 
     def _patch(self, idx):
         if self.game_state.release_patch(idx):
-            self.audio.speak("Patch veröffentlicht! Bugs wurden behoben und Fans sind glücklich.")
+            self.audio.speak(self.game_state.get_text('patch_released'))
         else:
-            self.audio.speak("Keine Bugs zum Beheben gefunden.")
+            self.audio.speak(self.game_state.get_text('no_bugs'))
         return "service_menu"
 
     def _dlc(self, idx):
         if self.game_state.release_dlc(idx):
-            self.audio.speak("DLC veröffentlicht! Das Spiel ist wieder in den Charts.")
+            self.audio.speak(self.game_state.get_text('dlc_released'))
         else:
-            self.audio.speak("Nicht genug Geld für die DLC-Entwicklung.")
+            self.audio.speak(self.game_state.get_text('dlc_no_money'))
         return "service_menu"
 
 
@@ -1459,3 +1948,76 @@ class HelpMenu(Menu):
         self.current_index = 0
         self.audio.speak(self.game_state.get_text('wiki_welcome'))
         self.speak_current(interrupt=False)
+
+
+# ============================================================
+# MENÜ-REGISTRY (Lazy-Erzeugung)
+# ============================================================
+
+class MenuRegistry:
+    """
+    Erzeugt Menüs erst bei der ersten Navigation.
+
+    factories: Schlüssel -> callable(audio, game_state) -> Menü
+    max_resident: optionale Obergrenze für gleichzeitig gehaltene Menüs;
+                  darüber werden die am längsten unbenutzten verworfen.
+    pinned: Menüs, die nie verworfen werden.
+    Wechselt die Sprache, werden alle Menüs beim nächsten Zugriff neu
+    erzeugt, damit ihre Beschriftungen in der neuen Sprache vorliegen.
+    """
+
+    def __init__(self, factories, audio, game_state, max_resident=None, pinned=("main_menu", "game_menu")):
+        self.factories = dict(factories)
+        self.audio = audio
+        self.game_state = game_state
+        self.max_resident = max_resident
+        self.pinned = set(pinned)
+        self._instances = OrderedDict()
+        self._language = game_state.settings.get("language")
+        self.stats = {"created": 0, "evicted": 0}
+
+    def __contains__(self, key):
+        return key in self.factories
+
+    def __getitem__(self, key):
+        return self.get(key)
+
+    def get(self, key):
+        language = self.game_state.settings.get("language")
+        if language != self._language:
+            self._language = language
+            self.invalidate()
+
+        menu = self._instances.get(key)
+        if menu is None:
+            menu = self.factories[key](self.audio, self.game_state)
+            self._instances[key] = menu
+            self.stats["created"] += 1
+            self._evict(keep=key)
+        else:
+            self._instances.move_to_end(key)
+        return menu
+
+    def _evict(self, keep):
+        if self.max_resident is None:
+            return
+        for key in list(self._instances):
+            if len(self._instances) <= self.max_resident:
+                break
+            if key == keep or key in self.pinned:
+                continue
+            del self._instances[key]
+            self.stats["evicted"] += 1
+
+    def prewarm(self, keys):
+        """Erzeugt Menüs vorab, z.B. kurz nach dem Start im Leerlauf."""
+        for key in keys:
+            if key in self.factories and key not in self._instances:
+                self.get(key)
+
+    def invalidate(self):
+        """Verwirft alle erzeugten Menüs (z.B. nach Sprachwechsel)."""
+        self._instances.clear()
+
+    def resident_keys(self):
+        return list(self._instances)
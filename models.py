@@ -6,6 +6,7 @@ Enthält: ReviewScore, GameProject, Employee, Engine, EngineFeature
 
 import random
 from game_data import EMPLOYEE_FIRST_NAMES, EMPLOYEE_LAST_NAMES
+from roster import SkillView
 
 
 class ReviewScore:
@@ -146,13 +147,50 @@ class Engine:
         return f"{self.name} (Tech: {self.tech_level})"
 
 
+class RosterValue:
+    """
+    Attribut eines Mitarbeiters, das im Team (roster.Roster) als Spalte
+    einer Matrix liegt. Ohne Team (Bewerber, Entlassene) steht der Wert
+    ganz normal am Objekt.
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.private = "_" + name
+
+    def __get__(self, emp, owner=None):
+        if emp is None:
+            return self
+        if emp._roster is not None:
+            if self.name == "skills":
+                return SkillView(emp)
+            return emp._roster.get_value(self.name, emp._row)
+        return emp.__dict__[self.private]
+
+    def __set__(self, emp, value):
+        if emp._roster is not None:
+            emp._roster.set_value(self.name, emp._row, value)
+        else:
+            emp.__dict__[self.private] = value
+
+
 class Employee:
     """Ein Mitarbeiter des Studios."""
 
-    def __init__(self, name=None, role_data=None, skill_level=1, specialization=None):
+    # Im Team liegen diese Werte in den Arrays des Rosters (skills als
+    # roster.SkillView, die direkt in die Matrix-Zeile schreibt)
+    skills = RosterValue()
+    salary = RosterValue()
+    morale = RosterValue()
+    weeks_employed = RosterValue()
+    _roster = None
+    _row = None
+
+    def __init__(self, name=None, role_data=None, skill_level=1, specialization=None, skills=None):
         """
         role_data: Dict aus EMPLOYEE_ROLES (role, primary, secondary)
         skill_level: 1-5, beeinflusst Skills und Gehalt
+        skills: fertige Skill-Werte (z.B. aus dem Bewerber-Pool), sonst zufällig
         """
         if name is None:
             first = random.choice(EMPLOYEE_FIRST_NAMES)
@@ -167,12 +205,13 @@ class Employee:
         self.specialization = specialization  # Dict aus EMPLOYEE_SPECIALIZATIONS oder None
 
         # Skills basierend auf Rolle und Level generieren
-        self.skills = self._generate_skills()
+        self.skills = dict(skills) if skills else self._generate_skills()
 
         # Gehalt basierend auf Skills
         self.salary = self._calculate_salary()
         self.morale = 100          # 0-100
         self.weeks_employed = 0
+        self.phase = None          # Entwicklungsphase (Name aus DEV_PHASES), siehe staffing.py
 
     def _generate_skills(self):
         """Generiert Skill-Werte basierend auf Rolle und Level."""
@@ -217,15 +256,16 @@ class Employee:
     def detail(self):
         """Detaillierte Info für NVDA."""
         from game_data import SLIDER_NAMES
+        skills = self.skills
         skill_text = ". ".join(
-            f"{s}: {self.skills[s]}" for s in SLIDER_NAMES
+            f"{s}: {skills[s]}" for s in SLIDER_NAMES
         )
         return (
             f"{self.name}, {self.role}, Level {self.skill_level}. "
             f"Gehalt: {self.salary} Euro pro Woche. "
             f"Fähigkeiten: {skill_text}. "
             f"Moral: {self.morale} Prozent."
-        )
+        ) + (f" Phase: {self.phase}." if self.phase else "")
 
     def to_dict(self):
         """Für Speichern."""
@@ -236,8 +276,9 @@ class Employee:
             "secondary_skill": self.secondary_skill,
             "skill_level": self.skill_level,
             "specialization": self.specialization,
-            "skills": self.skills,
+            "skills": dict(self.skills),
             "salary": self.salary,
             "morale": self.morale,
             "weeks_employed": self.weeks_employed,
+            "phase": self.phase,
         }
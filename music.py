@@ -0,0 +1,243 @@
+"""
+Musik-System für Audio Studio Tycoon - Audio Edition.
+
+Jeder Spielkontext (Hauptmenü, Entwicklung, Review) hat eine eigene
+Playlist. Titel werden in einem Hintergrund-Thread vollständig
+dekodiert und im Speicher gehalten, sodass ein Kontextwechsel nur noch
+eine Überblendung zwischen zwei reservierten Mixer-Kanälen ist und die
+Hauptschleife nie auf Datei-I/O wartet.
+"""
+
+import os
+import queue
+import threading
+
+import pygame
+
+MUSIC_VOLUME = 0.05
+CROSSFADE_MS = 1500
+MUSIC_FORMATS = ["ogg", "wav", "mp3"]
+
+# Wird bei Titelende und fertiger Dekodierung gepostet, damit eine
+# blockierende Hauptschleife aufwacht und update() aufruft.
+MUSIC_EVENT = pygame.USEREVENT + 1
+
+# Playlist pro Kontext (Dateinamen ohne Endung in assets/)
+MUSIC_PLAYLISTS = {
+    "main_menu": ["music_back"],
+    "development": ["music_dev", "music_back"],
+    "review": ["music_review", "music_back"],
+}
+
+# Welcher Menü-Schlüssel welchen Musik-Kontext auslöst (Rest: unverändert)
+MENU_MUSIC_CONTEXTS = {
+    "main_menu": "main_menu",
+    "game_menu": "main_menu",
+    "slider_menu": "development",
+    "dev_progress_menu": "development",
+    "review_result": "review",
+}
+
+
+class MusicPlayer:
+    """Playlist-Wiedergabe mit Vorab-Dekodierung und Überblendung."""
+
+    def __init__(self, channels, resolve_path, playlists=None):
+        """
+        channels: zwei reservierte pygame.mixer.Channel für die Überblendung
+        resolve_path: Funktion, die einen relativen Asset-Pfad auflöst
+        """
+        self.channels = list(channels)
+        self.resolve_path = resolve_path
+        self.playlists = dict(playlists or MUSIC_PLAYLISTS)
+        self.enabled = True
+        self.paused = False
+        self.context = None
+        self.track = None         # Name des aktuell spielenden Titels
+        self.track_context = None # Kontext, zu dem der Titel gestartet wurde
+        self.position = 0         # Index in der Playlist des Kontexts
+        self._active = 0          # Index des aktiven Kanals
+        self._pending = None      # (Titel, Schleifen) wartet auf Dekodierung
+
+        self._decoded = {}        # Titel -> pygame.mixer.Sound (None = fehlt)
+        self._lock = threading.Lock()
+        self._requests = queue.Queue()
+        self._worker = threading.Thread(target=self._decode_loop, daemon=True)
+        self._worker.start()
+
+        for ch in self.channels:
+            ch.set_volume(MUSIC_VOLUME)
+            ch.set_endevent(MUSIC_EVENT)
+
+    # ---- Hintergrund-Dekodierung ----
+
+    def _find_file(self, name):
+        for fmt in MUSIC_FORMATS:
+            path = self.resolve_path(f"assets/{name}.{fmt}")
+            if os.path.exists(path):
+                return path
+        return None
+
+    def _decode_loop(self):
+        while True:
+            name = self._requests.get()
+            if name is None:
+                return
+            with self._lock:
+                if name in self._decoded:
+                    continue
+            sound = None
+            path = self._find_file(name)
+            if path:
+                try:
+                    sound = pygame.mixer.Sound(path)
+                except Exception as e:
+                    print(f"[Musik Fehler]: {name}: {e}")
+            with self._lock:
+                self._decoded[name] = sound
+            try:
+                pygame.event.post(pygame.event.Event(MUSIC_EVENT))
+            except Exception:
+                pass  # Event-System nicht initialisiert (z.B. Benchmarks)
+
+    def preload(self, names=None):
+        """Stellt Titel zur Dekodierung im Hintergrund in die Warteschlange."""
+        if names is None:
+            names = [n for playlist in self.playlists.values() for n in playlist]
+        for name in names:
+            with self._lock:
+                known = name in self._decoded
+            if not known:
+                self._requests.put(name)
+
+    def _lookup(self, name):
+        """(bereit, Sound) ohne zu blockieren."""
+        with self._lock:
+            if name in self._decoded:
+                return True, self._decoded[name]
+        return False, None
+
+    # ---- Wiedergabe ----
+
+    def _crossfade_to(self, name, sound, loops):
+        old = self.channels[self._active]
+        self._active = 1 - self._active
+        new = self.channels[self._active]
+        if old.get_busy():
+            old.fadeout(CROSSFADE_MS)
+        new.play(sound, loops=loops, fade_ms=CROSSFADE_MS if old.get_busy() else 0)
+        self.track = name
+        self.track_context = self.context
+
+    def _start_track(self, name, loops):
+        """Startet einen Titel, sobald er dekodiert ist."""
+        if name == self.track and self.channels[self._active].get_busy():
+            self._pending = None
+            return
+        ready, sound = self._lookup(name)
+        if not ready:
+            self._pending = (name, loops)
+            self.preload([name])
+            return
+        self._pending = None
+        if sound is not None:
+            self._crossfade_to(name, sound, loops)
+            self._preload_next()
+        else:
+            # Titel fehlt: nächsten Titel der Playlist versuchen
+            self._advance(skip_missing=True)
+
+    def _playlist(self):
+        return self.playlists.get(self.context, [])
+
+    def _loops_for_playlist(self):
+        # Einzelne Titel laufen endlos, längere Playlists titelweise
+        return -1 if len(self._playlist()) <= 1 else 0
+
+    def _preload_next(self):
+        playlist = self._playlist()
+        if len(playlist) > 1:
+            self.preload([playlist[(self.position + 1) % len(playlist)]])
+
+    def _advance(self, skip_missing=False):
+        playlist = self._playlist()
+        if not playlist:
+            return
+        for _ in range(len(playlist)):
+            self.position = (self.position + 1) % len(playlist)
+            name = playlist[self.position]
+            ready, sound = self._lookup(name)
+            if ready and sound is None and skip_missing:
+                continue
+            self._start_track(name, self._loops_for_playlist())
+            return
+
+    def set_context(self, context):
+        """Wechselt den Musik-Kontext (blockiert nie)."""
+        if context == self.context or context not in self.playlists:
+            return
+        self.context = context
+        self.position = 0
+        if not self.enabled:
+            return
+        playlist = self._playlist()
+        # Ersten vorhandenen Titel wählen; fehlen alle, läuft die alte Musik weiter
+        for i, name in enumerate(playlist):
+            ready, sound = self._lookup(name)
+            if ready and sound is None:
+                continue
+            self.position = i
+            self._start_track(name, self._loops_for_playlist())
+            return
+
+    def play_track(self, name):
+        """Spielt einen einzelnen Titel in Endlosschleife."""
+        if self.enabled:
+            self._start_track(name, -1)
+
+    def update(self):
+        """Pro Frame aufrufen: startet fertig dekodierte Titel, wechselt am Titelende."""
+        if not self.enabled or self.paused:
+            return
+        if self._pending:
+            name, loops = self._pending
+            ready, _ = self._lookup(name)
+            if ready:
+                self._start_track(name, loops)
+            return
+        if self.track and not self.channels[self._active].get_busy() and self._playlist():
+            self._advance(skip_missing=True)
+
+    def busy(self):
+        """True, solange ein Titel auf die Dekodierung wartet (Hauptschleife nicht schlafen legen)."""
+        return self._pending is not None
+
+    def set_enabled(self, enabled):
+        """Pausiert bzw. setzt die Musik fort, statt sie neu zu starten."""
+        self.enabled = enabled
+        if not enabled:
+            self.paused = True
+            for ch in self.channels:
+                ch.pause()
+            return
+        self.paused = False
+        if self.track and self.channels[self._active].get_busy() and self.track_context == self.context:
+            for ch in self.channels:
+                ch.unpause()
+            return
+        # Kontext wurde während der Pause gewechselt: alten Titel nicht fortsetzen
+        self.stop()
+        if self.context:
+            context, self.context = self.context, None
+            self.set_context(context)
+
+    def stop(self):
+        self.track = None
+        self.track_context = None
+        self._pending = None
+        for ch in self.channels:
+            ch.stop()
+
+    def shutdown(self):
+        self.stop()
+        self._requests.put(None)
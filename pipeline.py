@@ -0,0 +1,179 @@
+"""
+Entwicklungs-Pipeline für Audio Studio Tycoon - Audio Edition.
+
+Mehrere Spiele können gleichzeitig entstehen, jedes mit eigenem Team.
+Jedes Projekt läuft auf der gemeinsamen Spielwoche durch DEV_PHASES;
+die Phasenlängen ergeben sich aus duration_weeks und dem time_multi der
+Spielgröße (Gesamtdauer wie bisher).
+
+Statt jedes Projekt jede Woche zu prüfen, liegen die nächsten
+Phasenwechsel in einer Kalender-Warteschlange: je Woche ein Eimer mit
+den Projekten, deren Phase dann endet, dazu ein Heap der belegten
+Wochen. Ein Phasenwechsel kostet so O(1) statt O(log n) wie bei einem
+Heap über alle Projekte, und advance(week) fasst nur fällige Eimer an;
+ein Projekt ohne Wechsel in dieser Woche kostet nichts.
+"""
+
+import heapq
+
+# Jedes weitere gleichzeitige Projekt braucht so viele Mitarbeiter
+STAFF_PER_PROJECT = 5
+# Spieltempo: Sekunden Echtzeit pro Spielwoche, solange entwickelt wird
+TIME_SCALES = {
+    "normal": 2.0,
+    "fast": 0.75,
+    "turbo": 0.2,
+}
+DEFAULT_TIME_SCALE = "normal"
+# Liegt die Uhr weiter zurück (z.B. nach Standby), wird nicht nachgeholt
+MAX_CATCH_UP_WEEKS = 8
+
+
+def phase_weeks(phases, time_multi):
+    """
+    Länge jeder Phase in Wochen. Die Summe ist wie bisher
+    int(Summe duration_weeks * time_multi), mindestens 1; sehr kurze
+    Phasen können 0 Wochen dauern und enden dann mit der vorherigen.
+    """
+    durations = [p.get("duration_weeks", 1) for p in phases]
+    base = sum(durations) or 1
+    total = max(1, int(base * time_multi))
+    weeks = []
+    done = 0
+    elapsed = 0
+    for duration in durations:
+        elapsed += duration
+        end = round(elapsed * total / base)
+        weeks.append(end - done)
+        done = end
+    return weeks
+
+
+class DevJob:
+    """Ein Projekt in Entwicklung."""
+
+    def __init__(self, job_id, project, team, start_week, weeks):
+        self.id = job_id
+        self.project = project
+        self.team = team                # Anzahl Mitarbeiter
+        self.start_week = start_week
+        self.weeks = weeks              # Wochen je Phase
+        self.phase = 0                  # Index der laufenden Phase
+        self.ends = []                  # Woche, in der jede Phase endet
+        week = start_week
+        for length in weeks:
+            week += length
+            self.ends.append(week)
+
+    @property
+    def end_week(self):
+        return self.ends[-1]
+
+    @property
+    def done(self):
+        return self.phase >= len(self.ends)
+
+    def weeks_left(self, week):
+        return max(0, self.end_week - week)
+
+    def to_dict(self, project_data):
+        return {
+            "id": self.id,
+            "project": project_data,
+            "team": self.team,
+            "start_week": self.start_week,
+            "weeks": self.weeks,
+            "phase": self.phase,
+        }
+
+
+class DevPipeline:
+    """Alle laufenden Projekte und der Heap ihrer nächsten Phasenwechsel."""
+
+    def __init__(self):
+        self.jobs = {}                  # id -> DevJob
+        self._due = {}                  # Woche -> [id], deren laufende Phase dann endet
+        self._weeks = []                # Heap der Wochen in _due
+        self._next_id = 0
+
+    def __len__(self):
+        return len(self.jobs)
+
+    def __bool__(self):
+        return bool(self.jobs)
+
+    def __iter__(self):
+        """Laufende Projekte, das zuerst fertige vorne."""
+        return iter(sorted(self.jobs.values(), key=lambda job: (job.end_week, job.id)))
+
+    def staff_in_use(self):
+        return sum(job.team for job in self.jobs.values())
+
+    def start(self, project, week, team, weeks):
+        """Nimmt ein Projekt auf; weeks: Wochen je Phase (siehe phase_weeks)."""
+        job = DevJob(self._next_id, project, team, week, weeks)
+        self._next_id += 1
+        self._add(job)
+        return job
+
+    def _add(self, job):
+        self.jobs[job.id] = job
+        if not job.done:
+            self._schedule(job.ends[job.phase], job.id)
+
+    def _schedule(self, week, job_id):
+        bucket = self._due.get(week)
+        if bucket is None:
+            self._due[week] = [job_id]
+            heapq.heappush(self._weeks, week)
+        else:
+            bucket.append(job_id)
+
+    def next_due(self):
+        """Woche des nächsten Phasenwechsels (oder None)."""
+        return self._weeks[0] if self._weeks else None
+
+    def advance(self, week):
+        """
+        Schließt alle bis week fälligen Phasen ab. Liefert (Projekt, Index der
+        beendeten Phase) in zeitlicher Reihenfolge; endet die letzte Phase,
+        ist das Projekt fertig und nicht mehr in der Pipeline.
+        """
+        events = []
+        jobs = self.jobs
+        weeks = self._weeks
+        while weeks and weeks[0] <= week:
+            due = heapq.heappop(weeks)
+            bucket = self._due[due]
+            # Phasen mit 0 Wochen landen wieder in diesem Eimer und werden mit abgearbeitet
+            for job_id in bucket:
+                job = jobs[job_id]
+                job.phase += 1
+                events.append((job, job.phase - 1))
+                if job.phase >= len(job.ends):
+                    del jobs[job_id]
+                elif job.ends[job.phase] == due:
+                    bucket.append(job_id)
+                else:
+                    self._schedule(job.ends[job.phase], job_id)
+            del self._due[due]
+        return events
+
+    # ---------- Speichern / Laden ----------
+
+    def to_dict(self, project_to_dict):
+        return {
+            "next_id": self._next_id,
+            "jobs": [job.to_dict(project_to_dict(job.project)) for job in self],
+        }
+
+    @classmethod
+    def from_dict(cls, data, project_from_dict):
+        pipeline = cls()
+        pipeline._next_id = data.get("next_id", 0)
+        for jd in data.get("jobs", []):
+            job = DevJob(jd["id"], project_from_dict(jd["project"]), jd["team"], jd["start_week"], jd["weeks"])
+            job.phase = jd.get("phase", 0)
+            pipeline._add(job)
+            pipeline._next_id = max(pipeline._next_id, job.id + 1)
+        return pipeline
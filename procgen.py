@@ -0,0 +1,147 @@
+"""
+Prozeduraler Content-Generator für Audio Studio Tycoon - Audio Edition.
+
+Erzeugt reproduzierbare (Seed) synthetische Spieldaten in derselben Form
+wie game_data.py: Themen, Genres, Kompatibilitätszeilen, ideale Slider,
+Plattformen mit Lebenszyklus und Engine-Features. Gedacht für Skalierungs-
+und Stresstests (siehe benchmark.py, Szenario content_scale).
+
+Als Content-Pack speichern (z.B. zum Ausprobieren im Spiel):
+    python procgen.py --scale 10 --seed 1 --out content/synth.json
+"""
+
+import argparse
+import json
+
+import numpy as np
+
+from content import base_tables
+from game_data import SLIDER_NAMES
+
+SYLLABLES = [
+    "ka", "ro", "mi", "ta", "lu", "ve", "no", "sa", "di", "ke",
+    "ba", "zu", "fe", "go", "ri", "pa", "le", "xo", "shi", "dra",
+]
+PLATFORM_TYPES = ["PC", "Konsole", "Handheld", "Mobile"]
+FEATURE_CATEGORIES = ["Grafik", "Sound", "KI", "Gameplay", "Level"]
+# Verteilung der Kompatibilitätswerte 0-3
+COMPAT_WEIGHTS = [0.25, 0.35, 0.25, 0.15]
+# Länge der Ära in Wochen bei Skalierung 1
+BASE_ERA_WEEKS = 400
+
+
+def _names(rng, count, prefix):
+    """count eindeutige Kunstnamen (aus Silben, bei Kollision durchnummeriert)."""
+    parts = rng.integers(0, len(SYLLABLES), size=(count, 3))
+    lengths = rng.integers(2, 4, size=count)
+    names = []
+    seen = set()
+    for row, length in zip(parts, lengths):
+        name = "".join(SYLLABLES[i] for i in row[:length]).capitalize()
+        name = f"{prefix} {name}"
+        if name in seen:
+            name = f"{name} {len(names)}"
+        seen.add(name)
+        names.append(name)
+    return names
+
+
+def generate_content(scale=1.0, seed=0, topics=None, genres=None, platforms=None, features=None):
+    """
+    Synthetische Tabellen im Format von game_data (Name -> Tabelle).
+    Ohne explizite Anzahl wird die Größe der Basisdaten mit scale
+    multipliziert. Gleicher Seed und gleiche Größen ergeben dieselben Daten.
+    """
+    rng = np.random.default_rng(seed)
+    base = base_tables()
+    n_topics = topics or max(1, round(len(base["TOPICS"]) * scale))
+    n_genres = genres or max(1, round(len(base["GENRES"]) * scale))
+    n_platforms = platforms or max(1, round(len(base["PLATFORMS"]) * scale))
+    n_features = features or max(len(FEATURE_CATEGORIES), round(len(base["ENGINE_FEATURES"]) * scale))
+    era = int(BASE_ERA_WEEKS * max(1.0, scale))
+
+    topic_names = _names(rng, n_topics, "Thema")
+    genre_names = _names(rng, n_genres, "Genre")
+
+    compat = rng.choice(len(COMPAT_WEIGHTS), size=(n_topics, n_genres), p=COMPAT_WEIGHTS)
+    ideal = rng.integers(1, 10, size=(n_genres, len(SLIDER_NAMES)))
+
+    # Plattformen: die ersten gibt es von Anfang an, der Rest erscheint über die Ära verteilt
+    starts = rng.integers(1, era, size=n_platforms)
+    starts[:max(1, n_platforms // 10)] = 1
+    lifespans = rng.integers(40, 300, size=n_platforms)
+    forever = rng.random(n_platforms) < 0.2
+    fees = rng.integers(0, 50, size=n_platforms) * 1000
+    multis = np.round(rng.uniform(0.5, 2.5, size=n_platforms), 1)
+    kinds = rng.integers(0, len(PLATFORM_TYPES), size=n_platforms)
+    platform_table = [
+        {
+            "name": f"Plattform {i + 1}",
+            "license_fee": int(fees[i]),
+            "market_multi": float(multis[i]),
+            "available_week": int(starts[i]),
+            "end_week": None if forever[i] else int(starts[i] + lifespans[i]),
+            "type": PLATFORM_TYPES[kinds[i]],
+        }
+        for i in range(n_platforms)
+    ]
+
+    # Features: je Kategorie ist das erste kostenlos ab Woche 1 (Starter-Engine)
+    weeks = rng.integers(1, era, size=n_features)
+    bonuses = rng.integers(1, 6, size=n_features)
+    costs = rng.integers(1, 90, size=n_features) * 1000
+    feature_table = []
+    for i in range(n_features):
+        category = FEATURE_CATEGORIES[i % len(FEATURE_CATEGORIES)]
+        starter = i < len(FEATURE_CATEGORIES)
+        feature_table.append({
+            "category": category,
+            "name": f"{category} {i + 1}",
+            "tech_bonus": 1 if starter else int(bonuses[i]),
+            "cost": 0 if starter else int(costs[i]),
+            "week": 1 if starter else int(weeks[i]),
+        })
+
+    return {
+        "TOPICS": topic_names,
+        "GENRES": genre_names,
+        "TOPIC_GENRE_COMPAT": {t: row for t, row in zip(topic_names, compat.tolist())},
+        "GENRE_IDEAL_SLIDERS": {
+            g: dict(zip(SLIDER_NAMES, row)) for g, row in zip(genre_names, ideal.tolist())
+        },
+        "PLATFORMS": platform_table,
+        "ENGINE_FEATURES": feature_table,
+    }
+
+
+def as_pack(tables):
+    """Wandelt generierte Tabellen in ein Content-Pack (siehe content.py)."""
+    return {
+        "topics": tables["TOPICS"],
+        "genres": tables["GENRES"],
+        # als Objekt, weil ein Pack über die Basis-Genres gelegt wird
+        "compatibility": {
+            topic: dict(zip(tables["GENRES"], row)) for topic, row in tables["TOPIC_GENRE_COMPAT"].items()
+        },
+        "ideal_sliders": tables["GENRE_IDEAL_SLIDERS"],
+        "platforms": tables["PLATFORMS"],
+        "features": tables["ENGINE_FEATURES"],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Synthetische Spieldaten erzeugen")
+    parser.add_argument("--scale", type=float, default=1.0, help="Vielfaches der Basisdaten")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=None, help="als Content-Pack (JSON) speichern, sonst Übersicht")
+    args = parser.parse_args(argv)
+
+    tables = generate_content(args.scale, args.seed)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(as_pack(tables), f, ensure_ascii=False)
+    print({name: len(table) for name, table in tables.items()})
+
+
+if __name__ == "__main__":
+    main()
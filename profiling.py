@@ -0,0 +1,203 @@
+"""
+Frame-Zeit- und Hot-Path-Messung für Audio Studio Tycoon - Audio Edition.
+
+Benannte Zeitspannen ("Spans") um die Phasen der Hauptschleife
+(update, events, is_bankrupt, hud, flip) und um die teuren
+GameState-Methoden. Pro Span werden die letzten Messwerte in einem
+Ringpuffer gehalten und bei Bedarf zu Perzentilen und einem Histogramm
+zusammengefasst.
+
+Ist die Messung abgeschaltet, liefert span() ein gemeinsames
+Leer-Objekt und die GameState-Methoden bleiben unverändert - es
+entstehen also praktisch keine Kosten.
+"""
+
+import json
+import time
+from collections import deque
+
+PROFILE_FILE = "frame_profile.json"
+
+# Anzahl der Messwerte pro Span im rollierenden Fenster
+WINDOW_SIZE = 600
+
+# Histogramm-Grenzen in Millisekunden (letzte Klasse: alles darüber)
+HISTOGRAM_BUCKETS_MS = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 16.7, 33.3, 100.0)
+
+# GameState-Methoden, die beim Einschalten automatisch gemessen werden
+HOT_METHODS = ("advance_week", "calculate_review", "save_game")
+
+
+class SpanStats:
+    """Rollierende Statistik einer einzelnen Zeitspanne."""
+
+    def __init__(self, window=WINDOW_SIZE):
+        self.samples = deque(maxlen=window)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds):
+        self.samples.append(seconds)
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def histogram(self):
+        """Anzahl Messwerte im Fenster je Histogramm-Klasse ("<=Grenze ms")."""
+        counts = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+        for sample in self.samples:
+            ms = sample * 1000
+            for i, limit in enumerate(HISTOGRAM_BUCKETS_MS):
+                if ms <= limit:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+        labels = [f"<={limit}" for limit in HISTOGRAM_BUCKETS_MS] + [f">{HISTOGRAM_BUCKETS_MS[-1]}"]
+        return {label: n for label, n in zip(labels, counts) if n}
+
+    def snapshot(self):
+        """Kennzahlen in Millisekunden (Perzentile über das Fenster)."""
+        ordered = sorted(self.samples)
+
+        def percentile(p):
+            if not ordered:
+                return 0.0
+            return ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1000
+
+        return {
+            "count": self.count,
+            "total_ms": round(self.total * 1000, 3),
+            "mean_ms": round(self.total * 1000 / self.count, 4) if self.count else 0.0,
+            "p50_ms": round(percentile(0.50), 4),
+            "p95_ms": round(percentile(0.95), 4),
+            "max_ms": round(self.max * 1000, 4),
+            "histogram": self.histogram(),
+        }
+
+
+class _Span:
+    __slots__ = ("stats", "start")
+
+    def __init__(self, stats):
+        self.stats = stats
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.stats.add(time.perf_counter() - self.start)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Profiler:
+    """Sammelt Spans; standardmäßig ausgeschaltet."""
+
+    def __init__(self, enabled=False, window=WINDOW_SIZE):
+        self.window = window
+        self.spans = {}          # Name -> SpanStats
+        self.enabled = False
+        self._patched = []       # (Klasse, Methodenname, Original)
+        self._started = None
+        if enabled:
+            self.enable()
+
+    def enable(self):
+        if not self.enabled:
+            self.enabled = True
+            self._started = time.perf_counter()
+
+    def disable(self):
+        self.enabled = False
+        self.uninstrument()
+
+    def span(self, name):
+        """Kontextmanager, der die Dauer des Blocks unter name verbucht."""
+        if not self.enabled:
+            return _NULL_SPAN
+        stats = self.spans.get(name)
+        if stats is None:
+            stats = self.spans[name] = SpanStats(self.window)
+        return _Span(stats)
+
+    def record(self, name, seconds):
+        """Verbucht eine extern gemessene Dauer (z.B. ganze Frames)."""
+        if self.enabled:
+            stats = self.spans.get(name)
+            if stats is None:
+                stats = self.spans[name] = SpanStats(self.window)
+            stats.add(seconds)
+
+    # ---------- Methoden instrumentieren ----------
+
+    def instrument(self, cls, names=HOT_METHODS, prefix="state."):
+        """Umschließt Methoden einer Klasse mit Spans (bis uninstrument())."""
+        for name in names:
+            original = cls.__dict__.get(name)
+            if original is None or any(c is cls and n == name for c, n, _ in self._patched):
+                continue
+            setattr(cls, name, self._wrap(original, prefix + name))
+            self._patched.append((cls, name, original))
+
+    def uninstrument(self):
+        for cls, name, original in reversed(self._patched):
+            setattr(cls, name, original)
+        self._patched = []
+
+    def _wrap(self, func, span_name):
+        profiler = self
+
+        def wrapper(*args, **kwargs):
+            with profiler.span(span_name):
+                return func(*args, **kwargs)
+        wrapper.__name__ = func.__name__
+        wrapper.__doc__ = func.__doc__
+        wrapper.__wrapped__ = func
+        return wrapper
+
+    # ---------- Ausgabe ----------
+
+    def summary(self):
+        return {name: stats.snapshot() for name, stats in sorted(self.spans.items())}
+
+    def overlay_lines(self, limit=8):
+        """Kurzzeilen für das Debug-Overlay, teuerste Spans (p95) zuerst."""
+        rows = []
+        for name, stats in self.spans.items():
+            snap = stats.snapshot()
+            rows.append((snap["p95_ms"], name, snap))
+        rows.sort(key=lambda row: (row[0], row[1]), reverse=True)
+        return [
+            f"{name:<22} p50 {snap['p50_ms']:7.3f}  p95 {snap['p95_ms']:7.3f}  max {snap['max_ms']:8.3f} ms"
+            for _, name, snap in rows[:limit]
+        ]
+
+    def write(self, path=PROFILE_FILE):
+        """Schreibt alle Span-Statistiken als JSON."""
+        data = {
+            "window": self.window,
+            "seconds": round(time.perf_counter() - self._started, 3) if self._started else 0.0,
+            "histogram_buckets_ms": list(HISTOGRAM_BUCKETS_MS),
+            "spans": self.summary(),
+        }
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+        except Exception as e:
+            print(f"[Profil Fehler]: {e}")
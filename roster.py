@@ -0,0 +1,228 @@
+"""
+Mitarbeiter-Roster für Audio Studio Tycoon - Audio Edition.
+
+Das Team eines Studios kann in den großen Büros tausende Mitarbeiter
+haben. Skills (Mitarbeiter x SLIDER_NAMES), Gehalt, Moral und
+Dienstwochen liegen deshalb als NumPy-Arrays im Roster; die Employee-
+Objekte lesen und schreiben über models.RosterValue ihre Zeile.
+Gehaltsabrechnung, Team-Boni, Training und Moral sind damit je eine
+Array-Operation statt einer Schleife über Skill-Dicts.
+
+Das Roster verhält sich nach außen wie die frühere Liste
+(len, Iteration, Index, append, pop); emp.skills ist im Team eine
+Sicht auf die Matrix-Zeile, Schreibzugriffe landen direkt im Roster.
+"""
+
+from collections.abc import MutableMapping
+
+import numpy as np
+
+import game_data
+
+_COLUMNS = ("skills", "salary", "morale", "weeks_employed", "primary", "secondary")
+
+
+def salary_for(skills):
+    """Wöchentliches Gehalt aus den Skills (wie Employee._calculate_salary)."""
+    return skills.sum(axis=-1).astype(np.int64) * 5 + 500
+
+
+class SkillView(MutableMapping):
+    """
+    Skills eines Mitarbeiters im Team: liest und schreibt seine Zeile der
+    Skill-Matrix (emp.skills["Gameplay"] += 5 wirkt wie beim Dict).
+    Verlässt der Mitarbeiter das Team, greift die Sicht auf sein Dict zu.
+    """
+
+    __slots__ = ("_emp",)
+
+    def __init__(self, emp):
+        self._emp = emp
+
+    def __getitem__(self, slider):
+        emp = self._emp
+        roster = emp._roster
+        if roster is None:
+            return emp.skills[slider]
+        return int(roster._skills[emp._row, roster.slider_ids[slider]])
+
+    def __setitem__(self, slider, value):
+        emp = self._emp
+        roster = emp._roster
+        if roster is None:
+            emp.skills[slider] = value
+        else:
+            roster._skills[emp._row, roster.slider_ids[slider]] = value
+
+    def __delitem__(self, slider):
+        raise TypeError("Skills eines Mitarbeiters im Team können nicht entfernt werden")
+
+    def __iter__(self):
+        roster = self._emp._roster
+        return iter(roster.sliders if roster is not None else self._emp.skills)
+
+    def __len__(self):
+        roster = self._emp._roster
+        return len(roster.sliders if roster is not None else self._emp.skills)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class Roster:
+    """Alle Mitarbeiter eines Studios; eine Array-Zeile pro Mitarbeiter."""
+
+    def __init__(self, employees=()):
+        self.sliders = list(game_data.SLIDER_NAMES)
+        self.slider_ids = {name: i for i, name in enumerate(self.sliders)}
+        self.employees = []
+        self._size = 0
+        self._skills = np.zeros((0, len(self.sliders)), dtype=np.int32)
+        self._salary = np.zeros(0, dtype=np.int64)
+        self._morale = np.zeros(0, dtype=np.int32)
+        self._weeks_employed = np.zeros(0, dtype=np.int32)
+        self._primary = np.zeros(0, dtype=np.int32)
+        self._secondary = np.zeros(0, dtype=np.int32)
+        self.extend(employees)
+
+    # ---------- Listen-Verhalten ----------
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        return iter(self.employees)
+
+    def __getitem__(self, index):
+        return self.employees[index]
+
+    def __bool__(self):
+        return self._size > 0
+
+    def append(self, emp):
+        self.extend([emp])
+
+    def extend(self, employees):
+        """Nimmt Mitarbeiter auf (eine Array-Erweiterung für alle)."""
+        employees = list(employees)
+        if not employees:
+            return
+        start, end = self._size, self._size + len(employees)
+        self._reserve(end)
+        ids = self.slider_ids
+        self._skills[start:end] = [[emp.skills.get(s, 0) for s in self.sliders] for emp in employees]
+        self._salary[start:end] = [emp.salary for emp in employees]
+        self._morale[start:end] = [emp.morale for emp in employees]
+        self._weeks_employed[start:end] = [emp.weeks_employed for emp in employees]
+        self._primary[start:end] = [ids.get(emp.primary_skill, 0) for emp in employees]
+        self._secondary[start:end] = [ids.get(emp.secondary_skill, 0) for emp in employees]
+        for row, emp in enumerate(employees, start):
+            for name in ("skills", "salary", "morale", "weeks_employed"):
+                emp.__dict__.pop("_" + name, None)
+            emp._roster = self
+            emp._row = row
+        self.employees.extend(employees)
+        self._size = end
+
+    def pop(self, index):
+        """Entfernt einen Mitarbeiter; seine Werte wandern zurück an das Objekt."""
+        emp = self.employees.pop(index)
+        values = {name: self.get_value(name, index) for name in ("skills", "salary", "morale", "weeks_employed")}
+        for name in _COLUMNS:
+            column = getattr(self, "_" + name)
+            column[index:self._size - 1] = column[index + 1:self._size]
+        self._size -= 1
+        emp._roster = None
+        emp._row = None
+        for name, value in values.items():
+            setattr(emp, name, value)
+        for row in range(index, self._size):
+            self.employees[row]._row = row
+        return emp
+
+    def _reserve(self, size):
+        capacity = len(self._salary)
+        if size <= capacity:
+            return
+        capacity = max(size, capacity * 2, 16)
+        for name in _COLUMNS:
+            old = getattr(self, "_" + name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, "_" + name, new)
+
+    # ---------- Spalten ----------
+
+    @property
+    def skills(self):
+        """Skill-Matrix (Mitarbeiter x SLIDER_NAMES), Sicht auf die belegten Zeilen."""
+        return self._skills[:self._size]
+
+    @property
+    def salary(self):
+        return self._salary[:self._size]
+
+    @property
+    def morale(self):
+        return self._morale[:self._size]
+
+    @property
+    def weeks_employed(self):
+        return self._weeks_employed[:self._size]
+
+    def get_value(self, name, row):
+        """Wert einer Zeile; skills als Kopie (siehe SkillView für Schreibzugriffe)."""
+        if name == "skills":
+            return dict(zip(self.sliders, self._skills[row].tolist()))
+        return int(getattr(self, "_" + name)[row])
+
+    def set_value(self, name, row, value):
+        if name == "skills":
+            ids = self.slider_ids
+            for slider, skill in value.items():
+                if slider in ids:
+                    self._skills[row, ids[slider]] = skill
+        else:
+            getattr(self, "_" + name)[row] = value
+
+    # ---------- Team-Werte ----------
+
+    def payroll(self):
+        """Summe aller Wochengehälter."""
+        return int(self.salary.sum())
+
+    def quality_bonus(self):
+        """Summe der Qualitätsbeiträge (Skill-Durchschnitt / 1000 je Mitarbeiter)."""
+        if not self._size:
+            return 0.0
+        return float(self.skills.mean(axis=1).sum() / 1000.0)
+
+    def slider_bonus(self, rows=None):
+        """Durchschnittlicher Skill je Slider (0.0 - 1.0) aller oder der gewählten Mitarbeiter."""
+        skills = self.skills if rows is None else self.skills[rows]
+        if not len(skills):
+            return np.zeros(len(self.sliders))
+        return skills.mean(axis=0) / 100.0
+
+    # ---------- Änderungen für viele Mitarbeiter auf einmal ----------
+
+    def train(self, rows, boost):
+        """Training: Primärskill +boost, Sekundärskill +boost/2 (max. 100); Gehalt steigt mit."""
+        rows = np.arange(self._size)[rows]
+        skills = self._skills
+        primary, secondary = self._primary[rows], self._secondary[rows]
+        skills[rows, primary] = np.minimum(100, skills[rows, primary] + boost)
+        skills[rows, secondary] = np.minimum(100, skills[rows, secondary] + boost // 2)
+        self._salary[rows] = salary_for(skills[rows])
+
+    def adjust_morale(self, delta, rows=None):
+        """Moral aller (oder der gewählten) Mitarbeiter ändern, begrenzt auf 0-100."""
+        morale = self.morale
+        if rows is None:
+            np.clip(morale + delta, 0, 100, out=morale)
+        else:
+            morale[rows] = np.clip(morale[rows] + delta, 0, 100)
+
+    def add_weeks(self, weeks):
+        """Dienstzeit aller Mitarbeiter erhöhen."""
+        self.weeks_employed[:] += weeks
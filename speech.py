@@ -0,0 +1,30 @@
+"""
+Sprachausgabe für Audio Studio Tycoon - Audio Edition.
+Kommuniziert direkt mit NVDA über accessible_output2.
+
+Bewusst ohne pygame-Import, damit die erste Ansage beim Start
+erfolgen kann, bevor die schweren Module geladen sind.
+"""
+
+
+class SpeechOutput:
+    def __init__(self):
+        # NVDA-Ausgabe initialisieren
+        self.speaker = None
+        try:
+            from accessible_output2.outputs import nvda
+            self.speaker = nvda.NVDA()
+        except Exception as e:
+            print(f"[NVDA Init Fehler]: {e}")
+            print("[INFO] Fallback auf Konsolen-Ausgabe aktiv.")
+
+    def speak(self, text, interrupt=True):
+        """
+        Text an NVDA senden. Fallback: Konsolen-Ausgabe.
+        """
+        print(f"[SPRACHE]: {text}")
+        if self.speaker:
+            try:
+                self.speaker.speak(text, interrupt=interrupt)
+            except Exception as e:
+                print(f"[NVDA Fehler]: {e}")
@@ -0,0 +1,167 @@
+"""
+Phasen-Besetzung für Audio Studio Tycoon - Audio Edition.
+
+Jeder Mitarbeiter arbeitet in genau einer Entwicklungsphase (Konzept,
+Engine, Design, Produktion, Testing). Sein Wert für eine Phase ist der
+Durchschnitt seiner Skills in den primary_sliders der Phase. Jede Phase
+bekommt Plätze im Verhältnis ihrer duration_weeks.
+
+Gesucht ist die Zuordnung mit der größten Summe dieser Werte - ein
+Transportproblem (Min-Cost-Flow: Mitarbeiter -> Phase -> Ziel).
+Gelöst wird es mit Successive Shortest Paths: Mitarbeiter kommen einer
+nach dem anderen dazu und werden über den kürzesten Pfad im
+Residualgraphen eingeplant; ein Pfad darf bereits eingeteilte
+Mitarbeiter in andere Phasen verschieben. Da es nur k Phasen gibt, läuft
+die Pfadsuche (Bellman-Ford, negative Kanten möglich) über k Knoten.
+Die günstigste Verschiebung zwischen zwei Phasen liefert je Phasenpaar
+ein Heap mit verzögertem Löschen. Aufwand O(n * (k^3 + k^2 log n)).
+"""
+
+import heapq
+import math
+
+import numpy as np
+
+import game_data
+
+
+def phase_capacities(count, phases):
+    """Plätze je Phase, proportional zu duration_weeks (Summe >= count)."""
+    weights = [max(p.get("duration_weeks", 1), 0) for p in phases]
+    if not sum(weights):
+        weights = [1] * len(phases)
+    total = sum(weights)
+    return [math.ceil(count * w / total) for w in weights]
+
+
+def skill_matrix(employees):
+    """Skills als Matrix (Mitarbeiter x SLIDER_NAMES); ein Roster liefert sie direkt."""
+    matrix = getattr(employees, "skills", None)
+    if matrix is not None:
+        return np.asarray(matrix, dtype=float)
+    sliders = game_data.SLIDER_NAMES
+    skills = np.array([[e.skills.get(s, 0) for s in sliders] for e in employees], dtype=float)
+    return skills.reshape(len(employees), len(sliders))
+
+
+def phase_values(employees, phases):
+    """Matrix (Mitarbeiter x Phase): Durchschnitt der primären Skills (0-100)."""
+    sliders = game_data.SLIDER_NAMES
+    slider_ids = {name: i for i, name in enumerate(sliders)}
+    weights = np.zeros((len(phases), len(sliders)))
+    for p, phase in enumerate(phases):
+        primary = [slider_ids[s] for s in phase.get("primary_sliders", []) if s in slider_ids]
+        if primary:
+            weights[p, primary] = 1.0 / len(primary)
+    return skill_matrix(employees) @ weights.T
+
+
+def assign(values, capacities):
+    """
+    Optimale Zuordnung für eine Wert-Matrix (n x k) und k Kapazitäten.
+    Liefert die Phase (Spaltenindex) je Zeile; Zeilen, die nicht mehr
+    passen (Summe der Kapazitäten < n), bekommen -1.
+    """
+    values = np.asarray(values, dtype=float)
+    n, k = values.shape
+    cost = (-values).tolist()
+    phase_of = [-1] * n
+    load = [0] * k
+    # moves[q][r]: Heap (Mehrkosten, Mitarbeiter) für "Mitarbeiter aus q nach r verschieben"
+    moves = [[[] for _ in range(k)] for _ in range(k)]
+
+    def place(e, p):
+        phase_of[e] = p
+        row = cost[e]
+        here = row[p]
+        for r in range(k):
+            if r != p:
+                heapq.heappush(moves[p][r], (row[r] - here, e))
+
+    def cheapest_move(q, r):
+        heap = moves[q][r]
+        while heap and phase_of[heap[0][1]] != q:
+            heapq.heappop(heap)       # veraltet: Mitarbeiter ist nicht mehr in q
+        return heap[0] if heap else None
+
+    free = sum(capacities)
+    for e in range(min(n, free)):
+        # Kürzeste Pfade vom neuen Mitarbeiter zu allen Phasen (Bellman-Ford über k Knoten)
+        dist = list(cost[e])
+        prev = [None] * k               # (vorherige Phase, verschobener Mitarbeiter)
+        edges = []
+        for q in range(k):
+            for r in range(k):
+                if q != r:
+                    best = cheapest_move(q, r)
+                    if best is not None:
+                        edges.append((q, r, best[0], best[1]))
+        for _ in range(k - 1):
+            changed = False
+            for q, r, weight, mover in edges:
+                if dist[q] + weight < dist[r] - 1e-12:
+                    dist[r] = dist[q] + weight
+                    prev[r] = (q, mover)
+                    changed = True
+            if not changed:
+                break
+
+        target = min((p for p in range(k) if load[p] < capacities[p]), key=lambda p: dist[p])
+        load[target] += 1
+        # Pfad zurückverfolgen: jeder Verschobene wechselt von q nach r
+        r = target
+        shifts = []
+        while prev[r] is not None:
+            q, mover = prev[r]
+            shifts.append((mover, r))
+            r = q
+        for mover, phase in shifts:
+            place(mover, phase)
+        place(e, r)
+    return phase_of
+
+
+def assign_team(employees, phases=None):
+    """Optimale Phase (Name) für jeden Mitarbeiter."""
+    phases = game_data.DEV_PHASES if phases is None else phases
+    if not employees or not phases:
+        return [None] * len(employees)
+    values = phase_values(employees, phases)
+    result = assign(values, phase_capacities(len(employees), phases))
+    return [phases[p]["name"] if p >= 0 else None for p in result]
+
+
+def slider_bonuses(employees, phases=None):
+    """
+    Team-Bonus je Slider (0.0 - 1.0): Durchschnitt der Mitarbeiter in den
+    Phasen, zu deren primary_sliders der Slider gehört. Ist dort niemand
+    eingeteilt, zählt wie bisher das ganze Team.
+    """
+    phases = game_data.DEV_PHASES if phases is None else phases
+    if not employees:
+        return {}
+    skills = skill_matrix(employees) / 100.0
+    assigned = np.array([getattr(e, "phase", None) or "" for e in employees], dtype=object)
+    bonuses = {}
+    for s, slider in enumerate(game_data.SLIDER_NAMES):
+        covering = [p["name"] for p in phases if slider in p.get("primary_sliders", [])]
+        staff = np.isin(assigned, covering)
+        column = skills[staff, s] if staff.any() else skills[:, s]
+        bonuses[slider] = float(column.mean())
+    return bonuses
+
+
+def phase_summary(employees, phases=None):
+    """[(Phase, Anzahl, Durchschnittswert 0-100)] für die Ansage."""
+    phases = game_data.DEV_PHASES if phases is None else phases
+    if not employees:
+        return [(p["name"], 0, 0.0) for p in phases]
+    values = phase_values(employees, phases)
+    assigned = np.array([getattr(e, "phase", None) or "" for e in employees], dtype=object)
+    rows = []
+    for p, phase in enumerate(phases):
+        members = assigned == phase["name"]
+        count = int(members.sum())
+        strength = float(values[members, p].mean()) if count else 0.0
+        rows.append((phase["name"], count, strength))
+    return rows
@@ -0,0 +1,125 @@
+"""
+Startzeit-Profiling für Audio Studio Tycoon - Audio Edition.
+
+Misst Wanduhr-Phasen des Starts (bis zur ersten Sprachausgabe, bis
+zur Bedienbarkeit) und optional die Import-Zeiten aller Module im
+Stil von "python -X importtime" (eigene und kumulierte Zeit).
+Das Ergebnis wird als Textdatei geschrieben; die letzte Zeile enthält
+eine JSON-Zusammenfassung für Benchmarks.
+"""
+
+import builtins
+import json
+import sys
+import time
+
+PROFILE_FILE = "startup_profile.log"
+
+# Startbudget in Sekunden ab Prozessstart (für Benchmarks und Warnungen)
+STARTUP_BUDGET = {
+    "first_speech": 0.25,
+    "interactive": 1.5,
+}
+
+
+class ImportTimer:
+    """Misst Import-Zeiten, indem builtins.__import__ vorübergehend umschlossen wird."""
+
+    def __init__(self):
+        self.records = []       # (Modul, eigene µs, kumulierte µs, Tiefe)
+        self._stack = []        # [Startzeit, Kind-Zeit]
+        self._original = None
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if level or name in sys.modules:
+            return self._original(name, globals, locals, fromlist, level)
+        self._stack.append([time.perf_counter(), 0.0])
+        try:
+            return self._original(name, globals, locals, fromlist, level)
+        finally:
+            start, children = self._stack.pop()
+            total = time.perf_counter() - start
+            if self._stack:
+                self._stack[-1][1] += total
+            self.records.append((name, (total - children) * 1e6, total * 1e6, len(self._stack)))
+
+    def start(self):
+        self._original = builtins.__import__
+        builtins.__import__ = self._import
+
+    def stop(self):
+        if self._original is not None:
+            builtins.__import__ = self._original
+            self._original = None
+
+
+class StartupProfiler:
+    """Sammelt benannte Zeitpunkte und Phasen relativ zum Prozessstart."""
+
+    def __init__(self, origin=None, trace_imports=False):
+        self.origin = origin if origin is not None else time.perf_counter()
+        self.marks = {}          # Name -> Sekunden seit Start
+        self.phases = []         # (Name, Start, Dauer)
+        self.imports = ImportTimer() if trace_imports else None
+        if self.imports:
+            self.imports.start()
+
+    def now(self):
+        return time.perf_counter() - self.origin
+
+    def mark(self, name):
+        """Merkt sich einen Zeitpunkt (nur beim ersten Mal)."""
+        self.marks.setdefault(name, self.now())
+
+    def phase(self, name):
+        return _Phase(self, name)
+
+    def budget_violations(self, budget=None):
+        """Liste der Marken, die ihr Budget überschreiten."""
+        budget = budget or STARTUP_BUDGET
+        return [
+            (name, self.marks[name], limit)
+            for name, limit in budget.items()
+            if name in self.marks and self.marks[name] > limit
+        ]
+
+    def summary(self):
+        return {
+            "marks": {k: round(v, 4) for k, v in self.marks.items()},
+            "phases": {name: round(dur, 4) for name, _, dur in self.phases},
+            "budget": STARTUP_BUDGET,
+            "violations": [name for name, _, _ in self.budget_violations()],
+        }
+
+    def write(self, path=PROFILE_FILE):
+        """Schreibt Phasen, Marken und Import-Zeiten in eine Logdatei."""
+        if self.imports:
+            self.imports.stop()
+        lines = ["# Startzeit-Profil (Sekunden seit Prozessstart)", ""]
+        for name, start, dur in self.phases:
+            lines.append(f"phase {name:<24} start {start:8.4f}  dauer {dur:8.4f}")
+        for name, at in sorted(self.marks.items(), key=lambda x: x[1]):
+            lines.append(f"mark  {name:<24} bei   {at:8.4f}")
+        for name, at, limit in self.budget_violations():
+            lines.append(f"WARNUNG: {name} nach {at:.3f}s (Budget {limit:.3f}s)")
+        if self.imports and self.imports.records:
+            lines += ["", "import time: self [us] | cumulative | imported package"]
+            for name, own, cum, depth in self.imports.records:
+                lines.append(f"import time: {own:9.0f} | {cum:10.0f} | {'  ' * depth}{name}")
+        lines += ["", "SUMMARY " + json.dumps(self.summary())]
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+
+class _Phase:
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = self.profiler.now()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.phases.append((self.name, self.start, self.profiler.now() - self.start))
+        return False
@@ -0,0 +1,88 @@
+"""
+Zeitleisten-Index für Audio Studio Tycoon - Audio Edition.
+
+Plattformen und Engine-Features erscheinen ab einer bestimmten Woche
+und verschwinden (Plattformen) nach ihrer letzten Woche wieder. Statt
+bei jeder Abfrage alle Einträge zu prüfen, liegen Erscheinen und Ende
+als sortierte Ereignis-Listen vor. Die Menge der verfügbaren Einträge
+wird beim Vorrücken der Woche nur um die Ereignisse dazwischen
+geändert; die Grenzen findet bisect. Auch Sprünge (z.B. Spielstand
+laden) kosten so nur O(log n + Änderungen).
+"""
+
+from bisect import bisect_left, bisect_right
+
+# Ersatzwert für fehlende Startwochen (Ende None = nie)
+NO_START = 0
+
+
+class ReleaseTimeline:
+    """
+    Verfügbare Einträge einer Liste von Dicts zu einer Woche W
+    (start <= W <= end). Die Ergebnis-Liste behält die Reihenfolge der
+    Original-Liste und wird bis zur nächsten Änderung zwischengespeichert.
+    """
+
+    def __init__(self, items, start_key, end_key=None):
+        self.items = list(items)
+        starts = []
+        ends = []
+        for i, item in enumerate(self.items):
+            start = item.get(start_key)
+            end = item.get(end_key) if end_key else None
+            starts.append((NO_START if start is None else start, i))
+            if end is not None:
+                ends.append((end, i))
+        starts.sort()
+        ends.sort()
+        self.start_weeks = [week for week, _ in starts]
+        self.start_items = [i for _, i in starts]
+        self.end_weeks = [week for week, _ in ends]
+        self.end_items = [i for _, i in ends]
+        self._start_of = [NO_START] * len(self.items)
+        for week, i in starts:
+            self._start_of[i] = week
+
+        self.week = None
+        self.active = set()        # Indizes der verfügbaren Einträge
+        self._available = None     # sortierte Liste der Einträge (Cache)
+
+    def __len__(self):
+        return len(self.items)
+
+    def seek(self, week):
+        """Setzt die Zeitleiste auf eine Woche (vor- oder zurückspringend)."""
+        if week == self.week:
+            return
+        if self.week is None:
+            # Erster Zugriff: alles Gestartete minus alles bereits Beendete
+            started = self.start_items[:bisect_right(self.start_weeks, week)]
+            ended = self.end_items[:bisect_left(self.end_weeks, week)]
+            self.active = set(started).difference(ended)
+        elif week > self.week:
+            # Neu gestartet in (alt, neu], beendet in [alt, neu)
+            lo = bisect_right(self.start_weeks, self.week)
+            hi = bisect_right(self.start_weeks, week, lo)
+            self.active.update(self.start_items[lo:hi])
+            lo = bisect_left(self.end_weeks, self.week)
+            hi = bisect_left(self.end_weeks, week, lo)
+            self.active.difference_update(self.end_items[lo:hi])
+        else:
+            # Zurück: Starts in (neu, alt] entfernen, Enden in [neu, alt) zurückholen
+            lo = bisect_right(self.start_weeks, week)
+            hi = bisect_right(self.start_weeks, self.week, lo)
+            self.active.difference_update(self.start_items[lo:hi])
+            lo = bisect_left(self.end_weeks, week)
+            hi = bisect_left(self.end_weeks, self.week, lo)
+            start_of = self._start_of
+            self.active.update(i for i in self.end_items[lo:hi] if start_of[i] <= week)
+        self.week = week
+        self._available = None
+
+    def available(self, week):
+        """Verfügbare Einträge in Woche week (Liste, nicht verändern)."""
+        self.seek(week)
+        if self._available is None:
+            items = self.items
+            self._available = [items[i] for i in sorted(self.active)]
+        return self._available
@@ -1,183 +1,62 @@
 """
-Übersetzungen für Audio Studio Tycoon.
-Unterstützt Deutsch (de) und Englisch (en).
+Sprachpakete für Audio Studio Tycoon.
+
+Jede Sprache liegt als eigene Datei lang/<code>.json (Schlüssel -> Text)
+neben dem Programm. Geladen wird eine Datei erst, wenn die Sprache
+gebraucht wird; die Liste der verfügbaren Sprachen ergibt sich allein
+aus den Dateinamen. Weitere Sprachen kosten beim Start also nichts.
+
+Neue Sprache: lang/de.json kopieren, übersetzen, unter dem Sprachcode
+speichern (z.B. lang/fr.json). Der Schlüssel 'language_name' enthält
+den Namen der Sprache, wie er im Einstellungsmenü angesagt wird.
 """
 
-TRANSLATIONS = {
-    'de': {
-        'main_menu': "Hauptmenü",
-        'start_new_game': "Neues Spiel starten",
-        'load_savegame': "Spielstand laden",
-        'settings': "Einstellungen",
-        'quit': "Beenden",
-        'company_name_prompt': "Wie soll deine Spielefirma heißen?",
-        'welcome_company': "Willkommen bei {name}! Du hast {money:,} Euro Startkapital. Du startest in einer Garage. Zeit, dein erstes Spiel zu entwickeln!",
-        'management_center': "Management-Zentrale",
-        'week': "Woche",
-        'company_overview': "Firmen-Übersicht",
-        'develop_new_game': "Neues Spiel entwickeln",
-        'hr_department': "Personal-Abteilung",
-        'research_engines': "Forschung und Engines",
-        'service_support': "Service & Support",
-        'inbox': "Posteingang",
-        'upgrade_office': "Büro upgraden",
-        'history': "Spielhistorie",
-        'save_game': "Spielstand speichern",
-        'game_saved': "Spielstand gespeichert!",
-        'settings_menu': "Einstellungen",
-        'music': "Musik",
-        'language': "Sprache",
-        'back': "Zurück",
-        'enabled': "Ein",
-        'disabled': "Aus",
-        'on': "An",
-        'off': "Aus",
-        'press_enter_confirm': "Drücke Enter zum Bestätigen.",
-        'typing_prompt': "Tippe den Namen und drücke Enter.",
-        'delete_char': "{char} gelöscht. Aktuell: {text}",
-        'empty_input': "Eingabe ist leer.",
-        'enter_name': "Bitte gib einen Namen ein.",
-        'confirmed': "Bestätigt: {text}",
-        'no_savegame': "Kein Spielstand gefunden.",
-        'hire_employee': "Mitarbeiter einstellen",
-        'show_employees': "Mitarbeiter anzeigen",
-        'train_employee': "Mitarbeiter trainieren",
-        'fire_employee': "Mitarbeiter entlassen",
-        'candidates': "Bewerber",
-        'refresh_candidates': "Neue Bewerber anzeigen",
-        'research_feature': "Feature erforschen",
-        'create_engine_option': "Neue Engine erstellen",
-        'show_engines_option': "Engines anzeigen",
-        'no_features_available': "Keine neuen Features verfügbar",
-        'engine_name_prompt': "Wie soll deine neue Engine heißen?",
-        'select_engine_features': "Engine-Features wählen",
-        'selected': "ausgewählt",
-        'unselected': "abgewählt",
-        'office_management': "Büro-Verwaltung",
-        'select_employee_training': "Mitarbeiter für Training wählen",
-        'select_training': "Training wählen",
-        'bankruptcy': "BANKROTT",
-        'bankruptcy_message': "Deine Firma ist pleite! Du hast zu viele Schulden und die Bank hat dein Studio geschlossen. Das Spiel ist vorbei.",
-        'email_details': "E-Mail Details",
-        'reply_ok': "Antworten / OK",
-        'delete': "Löschen",
-        'update_options': "Update-Optionen",
-        'free_patch': "Kostenloser Patch ({bugs} Bugs beheben)",
-        'release_dlc_option': "DLC veröffentlichen (20.000 Euro)",
-        'save_game': "Spiel speichern",
-        'load_game': "Spiel laden",
-        'select_slot': "Wähle einen Speicherplatz",
-        'slot_empty': "[LEER]",
-        'slot_error': "[FEHLERHAFT]",
-        'game_saved': "Spiel auf Slot {slot} gespeichert!",
-        'wiki': "Wiki / Hilfe",
-        'wiki_welcome': "Willkommen im Wiki. Wähle ein Thema.",
-        'wiki_concept': "Konzept: Wähle Thema und Genre passend aus.",
-        'wiki_dev': "Entwicklung: Achte auf die Slider-Verteilung!",
-        'wiki_hr': "Personal: Spezialisten geben starke Boni.",
-        'goodbye': "Auf Wiedersehen!",
-        'select_topic': "Wähle ein Thema für dein Spiel",
-        'select_genre': "Wähle ein Genre",
-        'select_platform': "Wähle eine Plattform",
-        'select_audience': "Wähle die Zielgruppe",
-        'select_size': "Wähle die Spielgröße",
-        'marketing': "Marketing wählen",
-        'select_engine': "Wähle eine Engine",
-        'game_name': "Spielname",
-        'dev_progress': "Spielentwicklung",
-        'review_result': "Spielbewertung",
-        'money': "Geld: {money:,} Euro",
-        'money_unit': "Euro",
-        'fans': "Fans",
-        'game_name_prompt_short': "Wie soll dein Spiel heißen?",
-        'dev_completed': "Entwicklung abgeschlossen! Drücke Enter für die Reviews.",
-    },
-    'en': {
-        'main_menu': "Main Menu",
-        'start_new_game': "Start New Game",
-        'load_savegame': "Load Game",
-        'settings': "Settings",
-        'quit': "Quit",
-        'company_name_prompt': "What should your game company be named?",
-        'welcome_company': "Welcome to {name}! You have {money:,} Euro start capital. You start in a garage. Time to develop your first game!",
-        'management_center': "Management Center",
-        'week': "Week",
-        'company_overview': "Company Overview",
-        'develop_new_game': "Develop New Game",
-        'hr_department': "HR Department",
-        'research_engines': "Research and Engines",
-        'service_support': "Service & Support",
-        'inbox': "Inbox",
-        'upgrade_office': "Upgrade Office",
-        'history': "Game History",
-        'save_game': "Save Game",
-        'game_saved': "Game saved!",
-        'settings_menu': "Settings",
-        'music': "Music",
-        'language': "Language",
-        'back': "Back",
-        'enabled': "On",
-        'disabled': "Off",
-        'on': "On",
-        'off': "Off",
-        'press_enter_confirm': "Press Enter to confirm.",
-        'typing_prompt': "Type the name and press Enter.",
-        'delete_char': "{char} deleted. Current: {text}",
-        'empty_input': "Input is empty.",
-        'enter_name': "Please enter a name.",
-        'confirmed': "Confirmed: {text}",
-        'no_savegame': "No savegame found.",
-        'hire_employee': "Hire Employee",
-        'show_employees': "Show Employees",
-        'train_employee': "Train Employee",
-        'fire_employee': "Fire Employee",
-        'candidates': "Candidates",
-        'refresh_candidates': "Refresh Candidates",
-        'research_feature': "Research Feature",
-        'create_engine_option': "Create New Engine",
-        'show_engines_option': "Show Engines",
-        'no_features_available': "No new features available",
-        'engine_name_prompt': "What should your new engine be named?",
-        'select_engine_features': "Select Engine Features",
-        'selected': "selected",
-        'unselected': "unselected",
-        'office_management': "Office Management",
-        'select_employee_training': "Select Employee for Training",
-        'select_training': "Select Training",
-        'bankruptcy': "BANKRUPTCY",
-        'bankruptcy_message': "Your company is bankrupt! You have too much debt and the bank has closed your studio. Game over.",
-        'email_details': "E-Mail Details",
-        'reply_ok': "Reply / OK",
-        'delete': "Delete",
-        'update_options': "Update Options",
-        'free_patch': "Free Patch (Fix {bugs} bugs)",
-        'release_dlc_option': "Release DLC (20,000 Euro)",
-        'save_game': "Save Game",
-        'load_game': "Load Game",
-        'select_slot': "Select a save slot",
-        'slot_empty': "[EMPTY]",
-        'slot_error': "[CORRUPT]",
-        'game_saved': "Game saved to slot {slot}!",
-        'wiki': "Wiki / Help",
-        'wiki_welcome': "Welcome to the wiki. Select a topic.",
-        'wiki_concept': "Concept: Match topic and genre correctly.",
-        'wiki_dev': "Development: Watch your slider distribution!",
-        'wiki_hr': "HR: Specialists provide strong bonuses.",
-        'goodbye': "Goodbye!",
-        'select_topic': "Select a topic for your game",
-        'select_genre': "Select a genre",
-        'select_platform': "Select a platform",
-        'select_audience': "Select the target audience",
-        'select_size': "Select the game size",
-        'marketing': "Select Marketing",
-        'select_engine': "Select an engine",
-        'game_name': "Game Name",
-        'dev_progress': "Game Development",
-        'review_result': "Game Review",
-        'money': "Money: {money:,} Euro",
-        'money_unit': "Euro",
-        'fans': "Fans",
-        'game_name_prompt_short': "What should your game be named?",
-        'dev_completed': "Development completed! Press Enter for reviews.",
-    }
-}
+import json
+import os
+import sys
+
+PACK_SUFFIX = ".json"
+
+_reported = set()
+
+
+def report_once(message):
+    """Gibt eine Sprach-Warnung nur beim ersten Auftreten aus."""
+    if message not in _reported:
+        _reported.add(message)
+        print(f"[ÜBERSETZUNG]: {message}")
+
+
+def _base_dir():
+    # PyInstaller entpackt Dateien nach _MEIPASS
+    return getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
+
+
+LANG_DIR = os.path.join(_base_dir(), "lang")
+
+
+def pack_path(language, directory=None):
+    return os.path.join(directory or LANG_DIR, language + PACK_SUFFIX)
+
+
+def available_languages(directory=None):
+    """Sprachcodes aller vorhandenen Sprachpakete (ohne sie zu laden)."""
+    try:
+        names = os.listdir(directory or LANG_DIR)
+    except OSError:
+        return []
+    return sorted(name[:-len(PACK_SUFFIX)] for name in names if name.endswith(PACK_SUFFIX))
+
+
+def load_pack(language, directory=None):
+    """Lädt ein Sprachpaket; None, falls es fehlt oder fehlerhaft ist."""
+    try:
+        with open(pack_path(language, directory), "r", encoding="utf-8") as f:
+            table = json.load(f)
+    except (OSError, ValueError) as e:
+        report_once(f"Sprachpaket {language}: {e}")
+        return None
+    if not isinstance(table, dict) or not all(isinstance(v, str) for v in table.values()):
+        report_once(f"Sprachpaket {language}: erwartet ein Objekt mit Texten")
+        return None
+    return table
@@ -0,0 +1,93 @@
+"""
+Type-Ahead für Menüs in Audio Studio Tycoon - Audio Edition.
+
+Getippte Buchstaben springen zum nächsten Eintrag, dessen Text mit der
+Eingabe beginnt. Der Präfix-Index wird einmal pro Options-Satz gebaut
+(sortierte Schlüssel + bisect), die Suche bleibt so auch bei sehr
+langen Listen schnell.
+"""
+
+import time
+from bisect import bisect_left, bisect_right
+
+# Pause (Sekunden), nach der eine neue Eingabe von vorn beginnt
+TYPEAHEAD_TIMEOUT = 1.0
+# Zwischengespeicherte Treffer-Listen je Präfix
+PREFIX_CACHE_LIMIT = 64
+
+
+def normalize(text):
+    return text.strip().casefold()
+
+
+class PrefixIndex:
+    """Sortierte Schlüssel aller Einträge; findet Einträge per Präfix."""
+
+    def __init__(self, texts):
+        entries = sorted((normalize(text), i) for i, text in enumerate(texts))
+        self.keys = [key for key, _ in entries]
+        self.indices = [i for _, i in entries]
+        self._matches = {}   # Präfix -> sortierte Original-Indizes
+
+    def __len__(self):
+        return len(self.keys)
+
+    def matches(self, prefix):
+        """Alle Indizes (aufsteigend), deren Text mit prefix beginnt."""
+        prefix = normalize(prefix)
+        found = self._matches.get(prefix)
+        if found is None:
+            lo = bisect_left(self.keys, prefix)
+            hi = bisect_left(self.keys, prefix + "\U0010ffff", lo)
+            found = sorted(self.indices[lo:hi])
+            if len(self._matches) >= PREFIX_CACHE_LIMIT:
+                self._matches.clear()
+            self._matches[prefix] = found
+        return found
+
+    def find(self, prefix, start=0):
+        """Erster Treffer ab Index start (zyklisch) oder None."""
+        found = self.matches(prefix)
+        if not found:
+            return None
+        pos = bisect_left(found, start)
+        return found[pos] if pos < len(found) else found[0]
+
+    def find_next(self, prefix, current):
+        """Nächster Treffer nach current (zyklisch) oder None."""
+        found = self.matches(prefix)
+        if not found:
+            return None
+        pos = bisect_right(found, current)
+        return found[pos] if pos < len(found) else found[0]
+
+
+class TypeAhead:
+    """Sammelt getippte Zeichen und liefert das Sprungziel."""
+
+    def __init__(self, timeout=TYPEAHEAD_TIMEOUT):
+        self.timeout = timeout
+        self.buffer = ""
+        self._last = 0.0
+
+    def reset(self):
+        self.buffer = ""
+
+    def feed(self, char, index, current, now=None):
+        """
+        Verarbeitet ein Zeichen; gibt den Ziel-Index oder None zurück.
+        Wiederholtes Tippen desselben Buchstabens springt reihum durch
+        alle Einträge mit diesem Anfangsbuchstaben.
+        """
+        now = time.time() if now is None else now
+        if now - self._last > self.timeout:
+            self.buffer = ""
+        self._last = now
+        if char == " " and not self.buffer:
+            return None
+        self.buffer += char
+
+        if len(set(self.buffer)) == 1:
+            # "a", "aa", "aaa": reihum durch alle Einträge mit "a"
+            return index.find_next(self.buffer[0], current)
+        return index.find(self.buffer, current)